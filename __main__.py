@@ -1,70 +1,272 @@
+"""
+End-to-end ingest benchmark of EdgeOSData and EntityManager.
+
+Usage: python __main__.py [--devices 100,1000] [--interfaces 4] [--duration 30]
+                          [--rate 0] [--output results.json] [--label v1.2.3]
+
+Every device / interface count combination runs against benchmarks.fake_router
+(or a real router when --host is set) and reports messages per second, latency
+per stage and peak memory, results are written as JSON for comparing versions.
+frame_decode, json_parse and ws_handler are the parts of parse_message,
+prepare is the decode and transform of large payloads in the executor,
+create_components runs within update, peak memory (tracemalloc) is of the
+whole process including the fake router.
+"""
+import argparse
 import asyncio
+from datetime import datetime
+import json
 import logging
+import platform
+import time
+import tracemalloc
 
-from custom_components.edgeos.managers.configuration_manager import ConfigManager
+from benchmarks.common import StageTimer, create_config_manager
+from benchmarks.fake_router import FakeEdgeOSRouter
+from benchmarks.synthetic import get_hostname
+from custom_components.edgeos.clients import web_socket
+from custom_components.edgeos.helpers.const import (
+    DOMAIN,
+    ENTITY_STATUS_CREATED,
+    ENTITY_STATUS_READY,
+)
+from custom_components.edgeos.helpers.json_codec import JsonCodec, json_codec
 from custom_components.edgeos.managers.data_manager import EdgeOSData
-from custom_components.edgeos.managers.password_manager import PasswordManager
-from custom_components.edgeos.managers.version_check import VersionCheck
-from custom_components.edgeos.models.config_data import ConfigData
-from test_consts import *
+from custom_components.edgeos.managers.entity_manager import EntityManager
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
 
-logging.basicConfig(filename="log.txt", filemode="a", level="DEBUG")
+logging.basicConfig(filename="log.txt", filemode="a", level="WARNING")
 
 _LOGGER = logging.getLogger(__name__)
 
-loop = asyncio.get_event_loop()
+STAGE_FRAME_DECODE = "frame_decode"
+STAGE_JSON_PARSE = "json_parse"
+STAGE_WS_HANDLER = "ws_handler"
+STAGE_PREPARE = "prepare"
+STAGE_UPDATE = "update"
+STAGE_CREATE_COMPONENTS = "create_components"
 
 
-class Test:
-    messages: int = 0
+class BenchmarkHomeAssistant:
+    """Holds the managers EntityManager reads from EdgeOSHomeAssistant."""
 
-    def __init__(self):
-        self._instance = None
+    def __init__(self, config_manager, data_manager):
+        self.config_manager = config_manager
+        self.config_data = config_manager.data
+        self.data_manager = data_manager
 
-        self._hass = HomeAssistant()
-        self._hass.config.config_dir = ""
 
-        self._password_manager = PasswordManager(self._hass)
-        self._config_manager = ConfigManager(self._password_manager)
+class Benchmark:
+    def __init__(
+        self,
+        devices: int,
+        interfaces: int,
+        host: str,
+        username: str,
+        password: str,
+        trace_memory: bool,
+    ):
+        self._devices = devices
+        self._interfaces = interfaces
+        self._trace_memory = trace_memory
+        self._stage_timer = StageTimer()
+        self._updates = 0
+        self._pending_updates = 0
 
-        config_data: ConfigData = ConfigData()
-        config_data.password_clear_text = PASSWORD
-        config_data.password = self._password_manager.encrypt(PASSWORD)
-        config_data.host = HOSTNAME
-        config_data.port = PORT
-        config_data.username = USERNAME
+        self._config_manager = create_config_manager(host, username, password)
+        self._config_manager.config_entry = ConfigEntry(
+            0, DOMAIN, "Benchmark", {}, "", "", {}
+        )
 
-        self._config_manager.set_data(config_data)
+        config_data = self._config_manager.data
+        config_data.monitored_devices = [get_hostname(i) for i in range(devices)]
+        config_data.device_trackers = config_data.monitored_devices
+        config_data.monitored_interfaces = [f"eth{i}" for i in range(interfaces)]
 
-        self._data_manager = EdgeOSData(self._hass, self._config_manager, self.update)
+        self._data_manager = EdgeOSData(None, self._config_manager, self.update)
 
-        self._version_check = VersionCheck()
+        self._entity_manager = EntityManager(
+            None, BenchmarkHomeAssistant(self._config_manager, self._data_manager)
+        )
 
-    async def terminate(self):
-        await self._data_manager.terminate()
+        self.instrument()
+
+    def instrument(self):
+        timer = self._stage_timer
+        ws = self._data_manager._ws
+
+        timer.instrument(STAGE_FRAME_DECODE, ws._decoder, "feed")
+        timer.instrument(STAGE_WS_HANDLER, ws, "_edgeos_callback")
+        timer.instrument(STAGE_PREPARE, ws, "_prepare_callback")
+        timer.instrument(
+            STAGE_UPDATE, self._data_manager._update_scheduler, "_publish_callback"
+        )
+        timer.instrument(
+            STAGE_CREATE_COMPONENTS, self._entity_manager, "create_components"
+        )
+
+        web_socket.json_codec = JsonCodec(
+            json_codec.name,
+            timer.wrap(STAGE_JSON_PARSE, json_codec.loads),
+            json_codec.dumps,
+        )
 
     def update(self):
-        print(f"Version: {self._data_manager.version}")
+        full_rebuild = self._updates == 0
+
+        self._entity_manager.create_components(full_rebuild)
+
+        for entity in self._entity_manager.get_all_entities():
+            if entity.status == ENTITY_STATUS_CREATED:
+                entity.status = ENTITY_STATUS_READY
+
+        self._updates += 1
+        self._pending_updates += len(self._entity_manager.pop_pending_updates())
+
+    async def run(self, duration: float) -> dict:
+        if self._trace_memory:
+            tracemalloc.start()
+
+        task = asyncio.create_task(self._data_manager.initialize())
+
+        await asyncio.sleep(duration)
+
+        ws_statistics = self._data_manager.ws_statistics
+        peak_memory = None
+
+        if self._trace_memory:
+            peak_memory = tracemalloc.get_traced_memory()[1]
+
+            tracemalloc.stop()
+
+        await self._data_manager.terminate()
+        await self._data_manager.async_close_connections()
+
+        task.cancel()
+
+        result = {
+            "devices": self._devices,
+            "interfaces": self._interfaces,
+            "duration": duration,
+            "messages": ws_statistics["messages"],
+            "messages_per_second": ws_statistics["messages"] / duration,
+            "frames": ws_statistics["frames"],
+            "updates": self._updates,
+            "entity_updates": self._pending_updates,
+            "entities": len(self._entity_manager.get_all_entities()),
+            "stages": self._stage_timer.statistics,
+            "peak_memory_bytes": peak_memory,
+            "ws": ws_statistics,
+            "refresh": self._data_manager.refresh_statistics,
+            "connections": self._data_manager.statistics["connections"],
+        }
+
+        return result
+
+
+async def run_scenario(args, devices: int, interfaces: int) -> dict:
+    if args.host is not None:
+        benchmark = Benchmark(
+            devices,
+            interfaces,
+            args.host,
+            args.username,
+            args.password,
+            not args.skip_memory,
+        )
+
+        return await benchmark.run(args.duration)
+
+    router = FakeEdgeOSRouter(
+        devices=devices,
+        interfaces=interfaces,
+        rate=args.rate,
+        frame_size=args.frame_size,
+        username=args.username,
+        password=args.password,
+    )
+
+    async with router:
+        benchmark = Benchmark(
+            devices,
+            interfaces,
+            router.host,
+            args.username,
+            args.password,
+            not args.skip_memory,
+        )
+
+        result = await benchmark.run(args.duration)
+
+    result["rate"] = args.rate
+    result["frame_size"] = args.frame_size
+
+    return result
+
+
+async def run(args) -> dict:
+    scenarios = []
+
+    for devices in args.devices:
+        for interfaces in args.interfaces:
+            started = time.perf_counter()
+
+            result = await run_scenario(args, devices, interfaces)
+
+            scenarios.append(result)
+
+            print(
+                f"{devices:>6} devices, {interfaces:>3} interfaces: "
+                f"{result['messages_per_second']:8.1f} messages/s, "
+                f"{result['entities']} entities, "
+                f"peak memory: {result['peak_memory_bytes']}, "
+                f"took {time.perf_counter() - started:.1f}s"
+            )
+
+            for stage, statistics in result["stages"].items():
+                print(f"    {stage:>18}: {statistics}")
+
+    results = {
+        "label": args.label,
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "json_backend": json_codec.name,
+        "scenarios": scenarios,
+    }
+
+    return results
 
-        self.messages = self.messages + 1
 
-        if self.messages == 10:
-            self._data_manager.disconnect()
+def get_counts(value: str) -> list:
+    return [int(item) for item in value.split(",")]
 
-        #  print(self._version_check.is_compatible(self._data_manager.version))
-        #  print(self._version_check.is_compatible("1.9"))
 
-        #  _LOGGER.info(self._data_manager.edgeos_data)
-        #  _LOGGER.info(self._data_manager.system_data)
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--devices", type=get_counts, default=[100, 1000])
+    parser.add_argument("--interfaces", type=get_counts, default=[4])
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--rate", type=float, default=0)
+    parser.add_argument("--frame-size", type=int, default=4096)
+    parser.add_argument("--host", default=None)
+    parser.add_argument("--username", default="ubnt")
+    parser.add_argument("--password", default="ubnt")
+    parser.add_argument("--skip-memory", action="store_true")
+    parser.add_argument("--label", default=None)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
 
-    async def initialize(self):
-        await self._data_manager.initialize()
+    results = asyncio.run(run(args))
 
-        print("exit")
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
 
 
 if __name__ == "__main__":
-    t = Test()
-    loop.run_until_complete(t.initialize())
+    main()
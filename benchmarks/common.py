@@ -0,0 +1,95 @@
+"""Helpers shared by the benchmarks."""
+import time
+
+from custom_components.edgeos.managers.configuration_manager import ConfigManager
+from custom_components.edgeos.managers.data_manager import EdgeOSData
+from custom_components.edgeos.models.config_data import ConfigData
+
+from .synthetic import generate_config
+
+
+def create_config_manager(
+    host: str = "127.0.0.1", username: str = None, password: str = None
+) -> ConfigManager:
+    config_data = ConfigData()
+    config_data.host = host
+    config_data.username = username
+    config_data.password_clear_text = password
+
+    config_manager = ConfigManager(None)
+    config_manager.set_data(config_data)
+
+    return config_manager
+
+
+def create_data_manager(
+    devices: int, interfaces: int, update_callback=None, hass=None
+) -> EdgeOSData:
+    """EdgeOSData loaded with synthetic static mappings and interfaces."""
+    config_manager = create_config_manager()
+
+    if update_callback is None:
+        update_callback = lambda: None  # noqa: E731
+
+    data_manager = EdgeOSData(hass, config_manager, update_callback)
+
+    config = generate_config(devices, interfaces)
+
+    data_manager.load_devices(config)
+    data_manager.load_interfaces(config)
+
+    return data_manager
+
+
+class StageTimer:
+    """Collects durations of wrapped callables per stage."""
+
+    def __init__(self):
+        self._durations = {}
+
+    def wrap(self, stage: str, func):
+        durations = self._durations.setdefault(stage, [])
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+
+            try:
+                return func(*args, **kwargs)
+            finally:
+                durations.append(time.perf_counter() - started)
+
+        return timed
+
+    def instrument(self, stage: str, obj, attribute: str):
+        """Replace obj.attribute by a timed wrapper of the current one."""
+        setattr(obj, attribute, self.wrap(stage, getattr(obj, attribute)))
+
+    @property
+    def statistics(self) -> dict:
+        result = {}
+
+        for stage, durations in self._durations.items():
+            result[stage] = get_latency_statistics(durations)
+
+        return result
+
+
+def get_latency_statistics(durations: list) -> dict:
+    """Count and latency (milliseconds) summary of durations in seconds."""
+    count = len(durations)
+
+    if count == 0:
+        return {"count": 0}
+
+    ordered = sorted(durations)
+
+    result = {
+        "count": count,
+        "total_ms": sum(ordered) * 1000,
+        "avg_ms": sum(ordered) / count * 1000,
+        "p50_ms": ordered[int(count * 0.5)] * 1000,
+        "p95_ms": ordered[min(count - 1, int(count * 0.95))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+    return result
@@ -0,0 +1,365 @@
+"""
+Local stand-in of an EdgeRouter for load and latency testing.
+
+Usage: python -m benchmarks.fake_router [--port 8443] [--devices 1000] [--rate 10]
+
+Implements login (PHPSESSID / beaker.session.id cookies), get.json, data.json,
+heartbeat.json and wss /ws/stats with the length-prefixed framing, serving
+synthetic devices, interfaces and DPI export data over a self-signed certificate.
+Set the host of the integration (or of create_config_manager) to the printed
+address, credentials are ubnt / ubnt unless provided.
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+import json
+import os
+import ssl
+import tempfile
+import uuid
+
+from aiohttp import WSMsgType, web
+from custom_components.edgeos.clients.frame_decoder import EdgeOSFrameDecoder
+from custom_components.edgeos.helpers.const import (
+    COOKIE_BEAKER_SESSION_ID,
+    COOKIE_PHPSESSID,
+    WS_SESSION_ID,
+    WS_TOPIC_NAME,
+    WS_TOPIC_SUBSCRIBE,
+    WS_TOPIC_UNSUBSCRIBE,
+)
+
+from .synthetic import (
+    generate_config,
+    generate_dhcp_leases,
+    generate_export,
+    generate_interfaces,
+    generate_sys_info,
+    generate_system_stats,
+    to_frames,
+)
+
+LOGIN_PAGE = "<html>\n<script>\nEDGE.DeviceModel = '{}'\n</script>\n</html>"
+
+
+def create_ssl_context(directory: str) -> ssl.SSLContext:
+    """Self-signed certificate for localhost, clients connect with ssl=False."""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.utcnow()
+
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=30))
+        .sign(key, hashes.SHA256())
+    )
+
+    certificate_path = os.path.join(directory, "fake_router.crt")
+    key_path = os.path.join(directory, "fake_router.key")
+
+    with open(certificate_path, "wb") as file:
+        file.write(certificate.public_bytes(serialization.Encoding.PEM))
+
+    with open(key_path, "wb") as file:
+        file.write(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.TraditionalOpenSSL,
+                serialization.NoEncryption(),
+            )
+        )
+
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(certificate_path, key_path)
+
+    return context
+
+
+class FakeEdgeOSRouter:
+    def __init__(
+        self,
+        devices: int = 100,
+        interfaces: int = 4,
+        unknown_devices: int = 10,
+        active_ratio: float = 0.3,
+        rate: float = 10,
+        frame_size: int = 0,
+        variants: int = 10,
+        username: str = "ubnt",
+        password: str = "ubnt",
+        product: str = "ER-X",
+    ):
+        """
+        rate is the number of WS messages per second (0 - as fast as possible),
+        messages of all subscribed topics are sent in turns, frame_size splits
+        every message into WS frames of frame_size bytes (0 - single frame).
+        """
+        self.username = username
+        self.password = password
+        self.product = product
+        self.rate = rate
+
+        self._config = generate_config(devices, interfaces)
+        self._data = {
+            "sys_info": generate_sys_info(),
+            "dhcp_leases": generate_dhcp_leases(devices, unknown_devices),
+        }
+
+        generators = {
+            "export": lambda seed: generate_export(devices, active_ratio, seed=seed),
+            "interfaces": lambda seed: generate_interfaces(interfaces, seed=seed),
+            "system-stats": lambda seed: generate_system_stats(seed=seed),
+        }
+
+        self._messages = {
+            topic: [
+                [
+                    frame.decode()
+                    for frame in to_frames(json.dumps(generator(seed)), frame_size)
+                ]
+                for seed in range(variants)
+            ]
+            for topic, generator in generators.items()
+        }
+
+        self._session_ids = set()
+        self._runner = None
+        self._directory = None
+        self._port = None
+
+        self.statistics = {
+            "logins": 0,
+            "failed_logins": 0,
+            "requests": {},
+            "ws_connections": 0,
+            "ws_messages": 0,
+            "ws_frames": 0,
+            "ws_bytes": 0,
+        }
+
+    @property
+    def host(self) -> str:
+        return f"127.0.0.1:{self._port}"
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+
+        app.router.add_post("/", self.login)
+        app.router.add_get("/api/edge/get.json", self.get)
+        app.router.add_get("/api/edge/data.json", self.data)
+        app.router.add_get("/api/edge/heartbeat.json", self.heartbeat)
+        app.router.add_get("/ws/stats", self.stats)
+
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0):
+        self._directory = tempfile.TemporaryDirectory()
+
+        ssl_context = create_ssl_context(self._directory.name)
+
+        self._runner = web.AppRunner(self.create_app())
+        await self._runner.setup()
+
+        site = web.TCPSite(self._runner, host, port, ssl_context=ssl_context)
+        await site.start()
+
+        self._port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+            self._runner = None
+
+        if self._directory is not None:
+            self._directory.cleanup()
+
+            self._directory = None
+
+    async def __aenter__(self):
+        await self.start()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    def _count_request(self, name: str):
+        requests = self.statistics["requests"]
+        requests[name] = requests.get(name, 0) + 1
+
+    def _is_authorized(self, request: web.Request) -> bool:
+        return request.cookies.get(COOKIE_PHPSESSID) in self._session_ids
+
+    async def login(self, request: web.Request) -> web.Response:
+        form = await request.post()
+
+        session_id = uuid.uuid4().hex
+
+        response = web.Response(
+            text=LOGIN_PAGE.format(self.product), content_type="text/html"
+        )
+        response.set_cookie(COOKIE_PHPSESSID, session_id)
+
+        credentials = (form.get("username"), form.get("password"))
+
+        if credentials == (self.username, self.password):
+            self._session_ids.add(session_id)
+            self.statistics["logins"] += 1
+
+            response.set_cookie(COOKIE_BEAKER_SESSION_ID, session_id)
+        else:
+            self.statistics["failed_logins"] += 1
+
+        return response
+
+    async def get(self, request: web.Request) -> web.Response:
+        self._count_request("get")
+
+        if not self._is_authorized(request):
+            raise web.HTTPForbidden()
+
+        return web.json_response({"success": True, "GET": self._config})
+
+    async def data(self, request: web.Request) -> web.Response:
+        item = request.query.get("data")
+
+        self._count_request(f"data/{item}")
+
+        if not self._is_authorized(request):
+            raise web.HTTPForbidden()
+
+        if item not in self._data:
+            return web.json_response({"success": "0", "error": f"{item} unknown"})
+
+        return web.json_response({"success": "1", "output": self._data[item]})
+
+    async def heartbeat(self, request: web.Request) -> web.Response:
+        self._count_request("heartbeat")
+
+        if not self._is_authorized(request):
+            raise web.HTTPForbidden()
+
+        return web.json_response({"success": True, "PING": True, "SESSION": True})
+
+    async def stats(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        self.statistics["ws_connections"] += 1
+
+        topics = []
+        decoder = EdgeOSFrameDecoder()
+        sender = None
+
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    break
+
+                for payload in decoder.feed(msg.data):
+                    subscription = json.loads(payload)
+
+                    if subscription.get(WS_SESSION_ID) not in self._session_ids:
+                        await ws.close()
+
+                        break
+
+                    for topic in subscription.get(WS_TOPIC_SUBSCRIBE, []):
+                        if topic[WS_TOPIC_NAME] not in topics:
+                            topics.append(topic[WS_TOPIC_NAME])
+
+                    for topic in subscription.get(WS_TOPIC_UNSUBSCRIBE, []):
+                        if topic[WS_TOPIC_NAME] in topics:
+                            topics.remove(topic[WS_TOPIC_NAME])
+
+                    if sender is None:
+                        sender = asyncio.create_task(self._send_messages(ws, topics))
+
+        finally:
+            if sender is not None:
+                sender.cancel()
+
+        return ws
+
+    async def _send_messages(self, ws: web.WebSocketResponse, topics: list):
+        """Sends messages of the subscribed topics in turns, at self.rate."""
+        interval = 0 if self.rate <= 0 else 1 / self.rate
+        counter = 0
+
+        while not ws.closed:
+            available_topics = [topic for topic in topics if topic in self._messages]
+
+            if len(available_topics) > 0:
+                topic = available_topics[counter % len(available_topics)]
+                variants = self._messages[topic]
+                frames = variants[(counter // len(available_topics)) % len(variants)]
+
+                for frame in frames:
+                    await ws.send_str(frame)
+
+                    self.statistics["ws_frames"] += 1
+                    self.statistics["ws_bytes"] += len(frame)
+
+                self.statistics["ws_messages"] += 1
+                counter += 1
+
+            await asyncio.sleep(interval)
+
+
+async def serve(router: FakeEdgeOSRouter, port: int):
+    await router.start(port=port)
+
+    print(f"Fake EdgeOS router listening on {router.host}")
+
+    try:
+        while True:
+            await asyncio.sleep(10)
+
+            print(router.statistics)
+    finally:
+        await router.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--interfaces", type=int, default=8)
+    parser.add_argument("--unknown-devices", type=int, default=10)
+    parser.add_argument("--active-ratio", type=float, default=0.3)
+    parser.add_argument("--rate", type=float, default=10)
+    parser.add_argument("--frame-size", type=int, default=0)
+    parser.add_argument("--username", default="ubnt")
+    parser.add_argument("--password", default="ubnt")
+    args = parser.parse_args()
+
+    router = FakeEdgeOSRouter(
+        devices=args.devices,
+        interfaces=args.interfaces,
+        unknown_devices=args.unknown_devices,
+        active_ratio=args.active_ratio,
+        rate=args.rate,
+        frame_size=args.frame_size,
+        username=args.username,
+        password=args.password,
+    )
+
+    try:
+        asyncio.run(serve(router, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
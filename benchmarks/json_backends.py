@@ -0,0 +1,76 @@
+"""
+Replay payloads through every available JSON backend.
+
+Usage: python -m benchmarks.json_backends [payloads.jsonl] [--iterations N]
+
+Payloads file holds one JSON document per line, when not provided,
+synthetic export / interfaces / system-stats payloads are generated.
+"""
+import argparse
+import json
+import time
+
+from custom_components.edgeos.helpers.json_codec import JSON_CODECS
+
+from .synthetic import generate_export, generate_interfaces, generate_system_stats
+
+
+def load_payloads(path: str = None) -> list:
+    if path is None:
+        documents = [
+            generate_export(500, seed=1),
+            generate_interfaces(8, seed=1),
+            generate_system_stats(seed=1),
+        ]
+
+        return [json.dumps(document).encode() for document in documents]
+
+    with open(path, "rb") as file:
+        payloads = [line.strip() for line in file if len(line.strip()) > 0]
+
+    return payloads
+
+
+def run(payloads: list, iterations: int) -> dict:
+    total_bytes = sum(len(payload) for payload in payloads) * iterations
+    results = {}
+
+    for name, codec in JSON_CODECS.items():
+        started = time.perf_counter()
+
+        for _ in range(iterations):
+            for payload in payloads:
+                codec.loads(payload)
+
+        elapsed = time.perf_counter() - started
+
+        results[name] = {
+            "seconds": elapsed,
+            "payloads_per_second": (len(payloads) * iterations) / elapsed,
+            "mb_per_second": total_bytes / elapsed / (1024 * 1024),
+        }
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("payloads", nargs="?", default=None)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.payloads)
+    results = run(payloads, args.iterations)
+
+    baseline = results["json"]["seconds"]
+
+    for name, result in results.items():
+        print(
+            f"{name:>8}: {result['payloads_per_second']:12.1f} payloads/s, "
+            f"{result['mb_per_second']:8.1f} MB/s, "
+            f"x{baseline / result['seconds']:.2f} vs json"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Per-message overhead of the ingest path logging at INFO vs DEBUG.
+
+Usage: python -m benchmarks.logging_overhead [--devices 1000] [--messages 300]
+                                             [--repeat 3]
+
+Frames are passed to EdgeOSWebSocket.handle_next_message, DEBUG records are
+formatted and written to os.devnull so the cost of producing them is included,
+the best of --repeat runs is reported.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+
+from aiohttp import WSMessage, WSMsgType
+
+from .common import create_data_manager
+from .synthetic import (
+    generate_export,
+    generate_interfaces,
+    generate_system_stats,
+    to_frames,
+)
+
+LOGGER_NAME = "custom_components.edgeos"
+
+
+def generate_messages(devices: int, interfaces: int, messages: int) -> list:
+    generators = [
+        lambda seed: generate_export(devices, seed=seed),
+        lambda seed: generate_interfaces(interfaces, seed=seed),
+        lambda seed: generate_system_stats(seed=seed),
+    ]
+
+    result = []
+
+    for index in range(messages):
+        content = json.dumps(generators[index % len(generators)](index))
+
+        for frame in to_frames(content):
+            result.append(WSMessage(WSMsgType.TEXT, frame.decode(), None))
+
+    return result
+
+
+async def measure(
+    devices: int, interfaces: int, messages: list, level: int, log_incoming: bool
+) -> float:
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level)
+
+    data_manager = create_data_manager(devices, interfaces)
+    data_manager.config_data.log_incoming_messages = log_incoming
+
+    ws = data_manager._ws
+
+    started = time.perf_counter()
+
+    for message in messages:
+        await ws.handle_next_message(message)
+
+    elapsed = time.perf_counter() - started
+
+    data_manager._update_scheduler.cancel()
+
+    return elapsed / len(messages) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--interfaces", type=int, default=8)
+    parser.add_argument("--messages", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with open(os.devnull, "w") as devnull:
+        handler = logging.StreamHandler(devnull)
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+        )
+
+        logger = logging.getLogger(LOGGER_NAME)
+        logger.addHandler(handler)
+        logger.propagate = False
+
+        messages = generate_messages(args.devices, args.interfaces, args.messages)
+
+        for log_incoming in (False, True):
+            for level in (logging.INFO, logging.DEBUG):
+                per_message = min(
+                    asyncio.run(
+                        measure(
+                            args.devices, args.interfaces, messages, level, log_incoming
+                        )
+                    )
+                    for _ in range(args.repeat)
+                )
+
+                print(
+                    f"{logging.getLevelName(level):>5}, "
+                    f"log incoming messages: {str(log_incoming):>5}: "
+                    f"{per_message:8.4f}ms per message"
+                )
+
+        logger.removeHandler(handler)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Event loop blocking while handling large payloads, inline vs executor.
+
+Usage: python -m benchmarks.loop_blocking [--devices 5000] [--messages 50]
+
+A ticker coroutine sleeps --tick milliseconds in a loop and records how late
+it wakes up, while export messages of --devices (all active) are handled by
+EdgeOSWebSocket.parse_message (decoded and handled on the loop) and by
+async_parse_message (payloads above EXECUTOR_PAYLOAD_SIZE decoded and
+transformed in the executor), and the static mappings are loaded inline (as
+refresh does) and using the executor.
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from custom_components.edgeos.helpers.const import EXECUTOR_PAYLOAD_SIZE
+from custom_components.edgeos.helpers.executor import async_run_in_executor
+
+from .common import create_data_manager
+from .synthetic import generate_config, generate_export, to_frames
+
+
+class LoopLagMonitor:
+    """Measures how late a periodic sleep wakes up (time the loop was blocked)."""
+
+    def __init__(self, tick: float):
+        self._tick = tick
+        self._lags = []
+        self._task = None
+
+    async def _run(self):
+        while True:
+            started = time.perf_counter()
+
+            await asyncio.sleep(self._tick)
+
+            self._lags.append(max(time.perf_counter() - started - self._tick, 0))
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> dict:
+        self._task.cancel()
+
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        lags = self._lags or [0]
+
+        result = {
+            "max_ms": max(lags) * 1000,
+            "avg_ms": sum(lags) / len(lags) * 1000,
+            "blocked_ms": sum(lags) * 1000,
+        }
+
+        return result
+
+
+async def measure_ws(devices: int, messages: list, offload: bool, tick: float):
+    data_manager = create_data_manager(devices, 0)
+    ws = data_manager._ws
+
+    monitor = LoopLagMonitor(tick)
+    monitor.start()
+
+    await asyncio.sleep(tick)
+
+    started = time.perf_counter()
+
+    for message in messages:
+        if offload:
+            await ws.async_parse_message(message)
+        else:
+            ws.parse_message(message)
+
+        await asyncio.sleep(0)
+
+    elapsed = time.perf_counter() - started
+
+    await asyncio.sleep(tick * 2)
+
+    result = await monitor.stop()
+    result["per_payload_ms"] = elapsed / len(messages) * 1000
+
+    data_manager._update_scheduler.cancel()
+
+    return result
+
+
+async def measure_static_devices(devices: int, offload: bool, tick: float):
+    data_manager = create_data_manager(0, 0)
+    config = generate_config(devices, 0)
+
+    monitor = LoopLagMonitor(tick)
+    monitor.start()
+
+    await asyncio.sleep(tick)
+
+    started = time.perf_counter()
+
+    if offload:
+        static_devices = await async_run_in_executor(
+            None, data_manager.parse_static_devices, config
+        )
+    else:
+        static_devices = data_manager.parse_static_devices(config)
+
+    data_manager.apply_static_devices(static_devices)
+
+    elapsed = time.perf_counter() - started
+
+    await asyncio.sleep(tick * 2)
+
+    result = await monitor.stop()
+    result["per_payload_ms"] = elapsed * 1000
+
+    data_manager._update_scheduler.cancel()
+
+    return result
+
+
+def print_result(title: str, result: dict):
+    print(
+        f"{title:<32}: loop blocked max {result['max_ms']:8.3f}ms, "
+        f"avg {result['avg_ms']:7.3f}ms, total {result['blocked_ms']:9.3f}ms, "
+        f"took {result['per_payload_ms']:8.3f}ms per payload"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--devices", type=int, default=5000)
+    parser.add_argument("--messages", type=int, default=50)
+    parser.add_argument("--tick", type=float, default=1, help="milliseconds")
+    args = parser.parse_args()
+
+    tick = args.tick / 1000
+    messages = []
+
+    for seed in range(args.messages):
+        content = json.dumps(generate_export(args.devices, 1, seed=seed))
+        messages.extend(frame.decode() for frame in to_frames(content))
+
+    print(
+        f"{args.devices} devices, export message of {len(messages[0])} bytes, "
+        f"executor threshold {EXECUTOR_PAYLOAD_SIZE} bytes"
+    )
+
+    for offload in (False, True):
+        result = asyncio.run(measure_ws(args.devices, messages, offload, tick))
+
+        print_result(f"export, {'executor' if offload else 'inline'}", result)
+
+    for offload in (False, True):
+        result = asyncio.run(measure_static_devices(args.devices, offload, tick))
+
+        print_result(f"static devices, {'executor' if offload else 'inline'}", result)
+
+
+if __name__ == "__main__":
+    main()
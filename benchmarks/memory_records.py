@@ -0,0 +1,160 @@
+"""
+Compare memory of dict based devices / interfaces / entities with slotted records.
+
+Usage: python -m benchmarks.memory_records [--devices 1000] [--interfaces 16]
+
+Dict layout reproduces how data was held before the records were introduced,
+one nested dict per device / interface and a plain class (with __dict__) per
+entity, records layout is what EdgeOSData / EntityManager hold now.
+"""
+import argparse
+from datetime import datetime
+import tracemalloc
+
+from custom_components.edgeos.models.device_data import DeviceData
+from custom_components.edgeos.models.entity_data import EntityData
+from custom_components.edgeos.models.interface_data import InterfaceData
+
+from .synthetic import (
+    generate_export,
+    generate_interfaces,
+    get_hostname,
+    get_ip,
+    get_mac,
+)
+
+
+class LegacyEntityData:
+    def __init__(self):
+        self.unique_id = ""
+        self.name = ""
+        self.state = 0
+        self.attributes = {}
+        self.icon = ""
+        self.device_name = ""
+        self.status = None
+        self.disabled = False
+
+
+def get_device_values(devices: int) -> dict:
+    export = generate_export(devices, active_ratio=1, seed=1)["export"]
+    values = {}
+
+    for index in range(devices):
+        hostname = get_hostname(index)
+        ip = get_ip(index)
+        traffic = {"rx_bytes": 0, "tx_bytes": 0, "rx_rate": 0, "tx_rate": 0}
+
+        for service_data in export.get(ip, {}).values():
+            for item in traffic:
+                traffic[item] += int(service_data[item])
+
+        values[hostname] = {
+            "ip": ip,
+            "mac": get_mac(index),
+            "name": f"{hostname} ({ip})",
+            "Connected": True,
+            "Last Activity": datetime.now(),
+            **traffic,
+        }
+
+    return values
+
+
+def get_interface_values(interfaces: int) -> dict:
+    data = generate_interfaces(interfaces, seed=1)["interfaces"]
+    values = {}
+
+    for name, interface_data in data.items():
+        values[name] = {
+            "name": name,
+            "addresses": interface_data["addresses"],
+            "up": interface_data["up"],
+            "speed": interface_data["speed"],
+            "duplex": interface_data["duplex"],
+            "mac": interface_data["mac"],
+            **interface_data["stats"],
+        }
+
+    return values
+
+
+def build_dicts(devices: dict, interfaces: dict) -> tuple:
+    device_items = {key: dict(value) for key, value in devices.items()}
+    interface_items = {key: dict(value) for key, value in interfaces.items()}
+    entities = {}
+
+    for key in list(devices) + list(interfaces):
+        entity = LegacyEntityData()
+        entity.name = key
+        entity.attributes = {}
+
+        entities[key] = entity
+
+    return device_items, interface_items, entities
+
+
+def build_records(devices: dict, interfaces: dict) -> tuple:
+    device_items = {}
+    for key, value in devices.items():
+        device = DeviceData(key)
+        device.update(value)
+
+        device_items[key] = device
+
+    interface_items = {}
+    for key, value in interfaces.items():
+        interface = InterfaceData()
+        interface.update(value)
+
+        interface_items[key] = interface
+
+    entities = {}
+
+    for key in list(devices) + list(interfaces):
+        entity = EntityData()
+        entity.name = key
+        entity.attributes = {}
+
+        entities[key] = entity
+
+    return device_items, interface_items, entities
+
+
+def measure(builder, devices: dict, interfaces: dict) -> int:
+    tracemalloc.start()
+
+    snapshot_before = tracemalloc.take_snapshot()
+    result = builder(devices, interfaces)
+    snapshot_after = tracemalloc.take_snapshot()
+
+    tracemalloc.stop()
+
+    stats = snapshot_after.compare_to(snapshot_before, "filename")
+    total = sum(stat.size_diff for stat in stats)
+
+    del result
+
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--interfaces", type=int, default=16)
+    args = parser.parse_args()
+
+    devices = get_device_values(args.devices)
+    interfaces = get_interface_values(args.interfaces)
+
+    dicts_size = measure(build_dicts, devices, interfaces)
+    records_size = measure(build_records, devices, interfaces)
+
+    print(f"{args.devices} devices, {args.interfaces} interfaces")
+    print(f"   dicts: {dicts_size / 1024:10.1f} KB")
+    print(f" records: {records_size / 1024:10.1f} KB")
+    print(f"   saved: {(1 - records_size / dicts_size):10.1%}")
+
+
+if __name__ == "__main__":
+    main()
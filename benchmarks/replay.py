@@ -0,0 +1,112 @@
+"""
+Replay a WS recording through the whole ingest pipeline of EdgeOSData.
+
+Usage: python -m benchmarks.replay [recording] [--speed 0] [--devices 1000]
+
+Recording is created by enabling `Record incoming messages`, when not provided,
+a synthetic one (export / interfaces / system-stats split into frames) is
+generated. Speed of 1 keeps the recorded timing, 0 replays as fast as possible.
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+
+from custom_components.edgeos.clients.web_socket_recorder import (
+    EdgeOSWebSocketRecorder,
+    EdgeOSWebSocketReplayer,
+)
+
+from .common import create_data_manager
+from .synthetic import (
+    generate_export,
+    generate_interfaces,
+    generate_system_stats,
+    to_frames,
+)
+
+
+def generate_recording(
+    path: str, devices: int, interfaces: int, messages: int, frame_size: int
+):
+    recorder = EdgeOSWebSocketRecorder(path)
+    recorder.open()
+
+    generators = [
+        lambda seed: generate_export(devices, seed=seed),
+        lambda seed: generate_interfaces(interfaces, seed=seed),
+        lambda seed: generate_system_stats(seed=seed),
+    ]
+
+    timestamp = 0.0
+
+    for index in range(messages):
+        content = json.dumps(generators[index % len(generators)](index))
+
+        for frame in to_frames(content, frame_size):
+            recorder.write(frame, timestamp)
+
+        timestamp += 0.1
+
+    recorder.close()
+
+
+async def replay(path: str, speed: float, devices: int, interfaces: int) -> dict:
+    published = []
+
+    data_manager = create_data_manager(
+        devices, interfaces, lambda: published.append(True)
+    )
+
+    replayer = EdgeOSWebSocketReplayer(path)
+    result = await replayer.replay(data_manager._ws.parse_message, speed)
+
+    data_manager._update_scheduler.flush()
+
+    result["ws"] = data_manager.ws_statistics
+    result["updates"] = data_manager.update_statistics
+    result["published"] = len(published)
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("recording", nargs="?", default=None)
+    parser.add_argument("--speed", type=float, default=0)
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--interfaces", type=int, default=8)
+    parser.add_argument("--messages", type=int, default=300)
+    parser.add_argument("--frame-size", type=int, default=4096)
+    args = parser.parse_args()
+
+    path = args.recording
+
+    with tempfile.TemporaryDirectory() as directory:
+        if path is None:
+            path = os.path.join(directory, "synthetic.rec")
+
+            generate_recording(
+                path, args.devices, args.interfaces, args.messages, args.frame_size
+            )
+
+        result = asyncio.run(replay(path, args.speed, args.devices, args.interfaces))
+
+    seconds = result["seconds"]
+    messages = result["ws"]["messages"]
+
+    print(
+        f"{result['frames']} frames, {messages} messages, "
+        f"{result['bytes'] / (1024 * 1024):.1f} MB in {seconds:.3f}s"
+    )
+    print(
+        f"{result['frames'] / seconds:10.1f} frames/s, "
+        f"{messages / seconds:10.1f} messages/s, "
+        f"{result['bytes'] / seconds / (1024 * 1024):8.1f} MB/s"
+    )
+    print(f"published updates: {result['published']}, WS: {result['ws']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Measure handling of the export topic for a router with many static mappings.
+
+Usage: python -m benchmarks.static_devices [--devices N] [--iterations N]
+
+Compares EdgeOSData.handle_export (lookup by IP index, iterates active IPs)
+with a full scan over all static devices, as done before the index existed,
+both apply the same per device work (traffic, rates, talkers, activity).
+"""
+import argparse
+import time
+
+from custom_components.edgeos.helpers.const import STATIC_DEVICES_KEY
+
+from .common import create_data_manager
+from .synthetic import generate_export
+
+
+def full_scan(data_manager, data):
+    monitored_devices = data_manager.config_data.monitored_devices
+    devices = {}
+
+    for hostname, device in list(data_manager.get_devices().items()):
+        device_data = data.get(device.ip)
+
+        if device_data is None:
+            data_manager.check_last_activity(device)
+
+            continue
+
+        is_monitored = hostname in monitored_devices
+        values = data_manager.get_device_export_values(device_data)
+
+        devices[hostname] = values
+
+        if is_monitored:
+            data_manager.update_rates(STATIC_DEVICES_KEY, hostname, values)
+
+        data_manager.set_device(hostname, values)
+
+        data_manager.check_last_activity(data_manager.get_device(hostname))
+
+        if is_monitored:
+            data_manager.record_time_series(STATIC_DEVICES_KEY, hostname, values)
+
+    if data_manager.config_data.traffic_sensors:
+        data_manager.update_talkers(devices)
+
+
+def measure(handler, data_manager, payloads, iterations) -> float:
+    started = time.perf_counter()
+
+    for iteration in range(iterations):
+        handler(data_manager, payloads[iteration % len(payloads)])
+
+    elapsed = time.perf_counter() - started
+
+    return elapsed / iterations * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    for active_ratio in (0.05, 0.25, 1.0):
+        payloads = [
+            generate_export(args.devices, active_ratio, seed=seed)["export"]
+            for seed in range(10)
+        ]
+
+        indexed = measure(
+            lambda manager, data: manager.handle_export(data),
+            create_data_manager(args.devices, 0),
+            payloads,
+            args.iterations,
+        )
+        scanned = measure(
+            full_scan, create_data_manager(args.devices, 0), payloads, args.iterations
+        )
+
+        print(
+            f"{args.devices} static mappings, {active_ratio:4.0%} active: "
+            f"indexed {indexed:7.3f}ms, full scan {scanned:7.3f}ms per message"
+        )
+
+
+if __name__ == "__main__":
+    main()
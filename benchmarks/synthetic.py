@@ -0,0 +1,164 @@
+"""Synthetic EdgeOS payloads used by the benchmarks."""
+import random
+
+DPI_SERVICES = [
+    "Web|HTTP Protocol over TLS SSL",
+    "Web|Web Browsing",
+    "Streaming Media|YouTube",
+    "Streaming Media|Netflix",
+    "Network protocols|DNS",
+    "Network protocols|NTP",
+    "File Transfer|BitTorrent",
+    "Instant messaging|WhatsApp",
+    "Social network|Facebook",
+    "Games|Steam",
+]
+
+
+def get_ip(index: int) -> str:
+    return f"10.{(index >> 16) & 255}.{(index >> 8) & 255}.{(index & 255) + 1}"
+
+
+def get_mac(index: int) -> str:
+    return ":".join(f"{(index >> shift) & 255:02x}" for shift in (0, 8, 16, 24, 32, 40))
+
+
+def get_hostname(index: int) -> str:
+    return f"device-{index:04d}"
+
+
+def generate_config(devices: int, interfaces: int) -> dict:
+    static_mapping = {}
+
+    for index in range(devices):
+        static_mapping[get_hostname(index)] = {
+            "ip-address": get_ip(index),
+            "mac-address": get_mac(index),
+        }
+
+    ethernet = {}
+    for index in range(interfaces):
+        ethernet[f"eth{index}"] = {"description": f"Port {index}"}
+
+    config = {
+        "service": {
+            "dhcp-server": {
+                "shared-network-name": {
+                    "LAN": {
+                        "subnet": {"10.0.0.0/8": {"static-mapping": static_mapping}}
+                    }
+                }
+            }
+        },
+        "interfaces": {"ethernet": ethernet},
+        "system": {
+            "host-name": "ubnt",
+            "traffic-analysis": {"dpi": "enable", "export": "enable"},
+        },
+    }
+
+    return config
+
+
+def generate_sys_info() -> dict:
+    return {"sw_ver": "v2.0.9-hotfix.1", "fw_latest": {"state": "up-to-date"}}
+
+
+def generate_dhcp_leases(devices: int, unknown_devices: int) -> dict:
+    leases = {}
+
+    for index in range(devices, devices + unknown_devices):
+        leases[get_ip(index)] = {
+            "expiration": "2020/10/18 12:00:00",
+            "pool": "LAN",
+            "mac": get_mac(index),
+            "client-hostname": get_hostname(index),
+        }
+
+    return {"dhcp-server-leases": {"LAN": leases}}
+
+
+def generate_export(
+    devices: int, active_ratio: float = 0.3, services: int = 4, seed: int = None
+) -> dict:
+    rnd = random.Random(seed)
+    data = {}
+
+    for index in range(devices):
+        if rnd.random() > active_ratio:
+            continue
+
+        device_data = {}
+
+        for service in rnd.sample(DPI_SERVICES, services):
+            device_data[service] = {
+                "rx_bytes": str(rnd.randint(0, 10 ** 9)),
+                "tx_bytes": str(rnd.randint(0, 10 ** 9)),
+                "rx_rate": str(rnd.randint(0, 10 ** 6)),
+                "tx_rate": str(rnd.randint(0, 10 ** 6)),
+            }
+
+        data[get_ip(index)] = device_data
+
+    return {"export": data}
+
+
+def generate_interfaces(interfaces: int, seed: int = None) -> dict:
+    rnd = random.Random(seed)
+    data = {}
+
+    for index in range(interfaces):
+        stats = {
+            "rx_packets": str(rnd.randint(0, 10 ** 9)),
+            "tx_packets": str(rnd.randint(0, 10 ** 9)),
+            "rx_bytes": str(rnd.randint(0, 10 ** 12)),
+            "tx_bytes": str(rnd.randint(0, 10 ** 12)),
+            "rx_errors": "0",
+            "tx_errors": "0",
+            "rx_dropped": str(rnd.randint(0, 100)),
+            "tx_dropped": "0",
+            "multicast": str(rnd.randint(0, 10 ** 4)),
+            "rx_bps": str(rnd.randint(0, 10 ** 8)),
+            "tx_bps": str(rnd.randint(0, 10 ** 8)),
+        }
+
+        data[f"eth{index}"] = {
+            "up": "true",
+            "autoneg": "true",
+            "duplex": "full",
+            "speed": "1000",
+            "mac": get_mac(index),
+            "mtu": "1500",
+            "addresses": [f"192.168.{index}.1/24"],
+            "stats": stats,
+        }
+
+    return {"interfaces": data}
+
+
+def generate_system_stats(seed: int = None) -> dict:
+    rnd = random.Random(seed)
+
+    data = {
+        "cpu": str(rnd.randint(0, 100)),
+        "uptime": str(rnd.randint(0, 10 ** 7)),
+        "mem": str(rnd.randint(0, 100)),
+    }
+
+    return {"system-stats": data}
+
+
+def to_frames(content: str, frame_size: int = 0) -> list:
+    """Encode content the way /ws/stats does, split into frames of frame_size bytes."""
+    payload = content.encode()
+    message = f"{len(payload)}\n".encode() + payload
+
+    if frame_size <= 0:
+        return [message]
+
+    frames = [
+        message[start : start + frame_size]
+        for start in range(0, len(message), frame_size)
+    ]
+
+    return frames
@@ -0,0 +1,91 @@
+"""
+Measure ranking of the top talkers (devices by rate) per export message.
+
+Usage: python -m benchmarks.top_talkers [--devices 1000] [--iterations 200]
+                                        [--count 10]
+
+Compares IndexedHeap (changed rates pushed per message, updated in place or
+the heap rebuilt above TRAFFIC_SOURCES_REBUILD_RATIO changed, top taken from
+the heap) with sorting the rates of all devices per message, as done by
+templates over the device attributes. Detecting the changed rates is part of
+handling the export of every device and not measured.
+"""
+import argparse
+import random
+import time
+
+from custom_components.edgeos.helpers.const import TRAFFIC_SOURCES_REBUILD_RATIO
+from custom_components.edgeos.models.indexed_heap import IndexedHeap
+
+
+def generate_updates(devices: int, churn: float, iterations: int) -> list:
+    rnd = random.Random(0)
+    hostnames = [f"device-{index:04d}" for index in range(devices)]
+
+    result = []
+
+    for _ in range(iterations):
+        changed = rnd.sample(hostnames, int(devices * churn))
+
+        result.append({hostname: rnd.randint(1, 10 ** 7) for hostname in changed})
+
+    return result
+
+
+def measure_heap(devices: int, updates: list, count: int, ratio: float) -> float:
+    rates = {f"device-{index:04d}": index + 1 for index in range(devices)}
+
+    heap = IndexedHeap(ratio)
+    heap.update_many(rates)
+
+    started = time.perf_counter()
+
+    for changes in updates:
+        heap.update_many(changes)
+        heap.top(count)
+
+    elapsed = time.perf_counter() - started
+
+    return elapsed / len(updates) * 1000
+
+
+def measure_sort(devices: int, updates: list, count: int) -> float:
+    rates = {f"device-{index:04d}": index + 1 for index in range(devices)}
+
+    started = time.perf_counter()
+
+    for changes in updates:
+        rates.update(changes)
+
+        sorted(rates.items(), key=lambda item: item[1], reverse=True)[:count]
+
+    elapsed = time.perf_counter() - started
+
+    return elapsed / len(updates) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--count", type=int, default=10)
+    args = parser.parse_args()
+
+    for churn in (0.01, 0.1, 0.25, 0.5, 1.0):
+        updates = generate_updates(args.devices, churn, args.iterations)
+
+        incremental = measure_heap(args.devices, updates, args.count, 1)
+        heap = measure_heap(
+            args.devices, updates, args.count, TRAFFIC_SOURCES_REBUILD_RATIO
+        )
+        sort = measure_sort(args.devices, updates, args.count)
+
+        print(
+            f"{args.devices} devices, {churn:4.0%} changed per message: "
+            f"indexed heap {heap:7.3f}ms (never rebuilt {incremental:7.3f}ms), "
+            f"sort {sort:7.3f}ms per message"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Measure DPI traffic aggregation of the export topic per application / category.
+
+Usage: python -m benchmarks.traffic_aggregation [--devices 1000]
+                                                [--iterations 200]
+
+Compares TrafficAggregator.apply (difference of changed services only) with
+recomputing all application and category totals from every export, for
+exports where a part of the active devices changed since the previous one,
+above TRAFFIC_RECOMPUTE_RATIO changed sources the aggregator recomputes too.
+"""
+import argparse
+import random
+import time
+
+from custom_components.edgeos.helpers.const import TRAFFIC_FIELDS
+from custom_components.edgeos.models.traffic_aggregator import TrafficAggregator
+
+from .synthetic import generate_export
+
+
+def generate_exports(devices: int, churn: float, count: int) -> list:
+    rnd = random.Random(0)
+    export = TrafficAggregator.parse(generate_export(devices, seed=0)["export"])
+
+    result = []
+
+    for _ in range(count):
+        export = dict(export)
+
+        for source in rnd.sample(list(export), int(len(export) * churn)):
+            export[source] = {
+                service: tuple(value + rnd.randint(1, 10 ** 6) for value in values)
+                for service, values in export[source].items()
+            }
+
+        result.append(export)
+
+    return result
+
+
+def recompute(exports: list):
+    for export in exports:
+        applications = {}
+        categories = {}
+
+        for services in export.values():
+            for service, values in services.items():
+                category, _, application = service.rpartition("|")
+
+                for totals, name in (
+                    (applications, application),
+                    (categories, category),
+                ):
+                    current = totals.setdefault(name, [0] * len(TRAFFIC_FIELDS))
+
+                    for index, value in enumerate(values):
+                        current[index] += value
+
+
+def aggregate(exports: list):
+    aggregator = TrafficAggregator()
+
+    for export in exports:
+        aggregator.apply(export)
+
+
+def measure(handler, exports: list) -> float:
+    started = time.perf_counter()
+
+    handler(exports)
+
+    elapsed = time.perf_counter() - started
+
+    return elapsed / len(exports) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    for churn in (0.05, 0.25, 0.5, 0.75, 1.0):
+        exports = generate_exports(args.devices, churn, args.iterations)
+
+        incremental = measure(aggregate, exports)
+        recomputed = measure(recompute, exports)
+
+        print(
+            f"{args.devices} devices, {churn:4.0%} changed per export: "
+            f"incremental {incremental:7.3f}ms, recompute {recomputed:7.3f}ms "
+            f"per message"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,13 @@ import sys
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .helpers import async_set_ha, clear_ha, get_ha, handle_log_level
+from .helpers import (
+    async_register_services,
+    async_set_ha,
+    clear_ha,
+    get_ha,
+    handle_log_level,
+)
 from .helpers.const import *
 
 REQUIREMENTS = ["aiohttp"]
@@ -18,6 +24,8 @@ _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup(hass, config):
+    async_register_services(hass)
+
     return True
 
 
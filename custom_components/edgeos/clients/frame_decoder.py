@@ -0,0 +1,147 @@
+"""
+This component provides support for Home Automation Manager (HAM).
+For more details about this component, please refer to the documentation at
+https://home-assistant.io/components/edgeos/
+"""
+import logging
+from typing import List, Optional, Union
+
+from ..helpers.const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EdgeOSFrameDecoder:
+    """
+    Incremental decoder of the length-prefixed /ws/stats stream.
+
+    Router sends every message as `<length>\\n<payload>`, where a message
+    can arrive split across several WS frames, data is accumulated into a
+    single buffer until the declared number of bytes is available.
+
+    The length is the number of UTF-8 encoded bytes of the payload, not of
+    characters, outgoing messages (subscription) declare it the same way.
+    Router payloads are ASCII JSON as far as observed, where both are equal.
+    """
+
+    def __init__(self, max_payload_size: int = MAX_PENDING_PAYLOAD_SIZE):
+        self._max_payload_size = max_payload_size
+
+        self._buffer = bytearray()
+        self._expected_length: Optional[int] = None
+        self._message_frames = 0
+
+        self.frames = 0
+        self.bytes = 0
+        self.messages = 0
+        self.fragmented_messages = 0
+        self.resets = 0
+
+    @property
+    def pending_bytes(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def statistics(self) -> dict:
+        result = {
+            "frames": self.frames,
+            "bytes": self.bytes,
+            "messages": self.messages,
+            "fragmented_messages": self.fragmented_messages,
+            "resets": self.resets,
+            "pending_bytes": self.pending_bytes,
+        }
+
+        return result
+
+    def reset(self):
+        self._buffer.clear()
+        self._expected_length = None
+        self._message_frames = 0
+
+    def feed(self, data: Union[str, bytes]) -> List[bytes]:
+        if isinstance(data, str):
+            data = data.encode()
+
+        self.frames += 1
+        self.bytes += len(data)
+
+        self._buffer.extend(data)
+        self._message_frames += 1
+
+        payloads = []
+
+        while True:
+            if self._expected_length is None and not self._read_header():
+                break
+
+            if len(self._buffer) < self._expected_length:
+                break
+
+            payload = bytes(self._buffer[: self._expected_length])
+            del self._buffer[: self._expected_length]
+
+            self.messages += 1
+
+            if self._message_frames > 1:
+                self.fragmented_messages += 1
+
+            self._expected_length = None
+            self._message_frames = 1 if len(self._buffer) > 0 else 0
+
+            payloads.append(payload)
+
+        return payloads
+
+    def _read_header(self) -> bool:
+        buffer = self._buffer
+
+        start = 0
+        while start < len(buffer) and buffer[start] in FRAME_WHITESPACES:
+            start += 1
+
+        if start > 0:
+            del buffer[:start]
+
+        if len(buffer) == 0:
+            self._message_frames = 0
+
+            return False
+
+        header_end = buffer.find(FRAME_HEADER_SEPARATOR)
+
+        if header_end < 0:
+            if len(buffer) > MAX_FRAME_HEADER_LENGTH:
+                self._reset_invalid("Header is too long")
+
+            return False
+
+        header = bytes(buffer[:header_end])
+
+        if not header.isdigit():
+            self._reset_invalid("Header is not a length")
+
+            return False
+
+        # UTF-8 bytes of the payload, the buffer holds the encoded stream
+        expected_length = int(header)
+
+        if expected_length > self._max_payload_size:
+            self._reset_invalid(f"Declared length {expected_length} exceeds limit")
+
+            return False
+
+        del buffer[: header_end + 1]
+
+        self._expected_length = expected_length
+
+        return True
+
+    def _reset_invalid(self, reason):
+        _LOGGER.warning(
+            f"Dropping {len(self._buffer)} pending bytes of WS stream, Reason: {reason}"
+        )
+
+        self.resets += 1
+
+        self.reset()
@@ -3,18 +3,24 @@ This component provides support for Home Automation Manager (HAM).
 For more details about this component, please refer to the documentation at
 https://home-assistant.io/components/edgeos/
 """
-from asyncio import sleep
+from asyncio import Future, Semaphore, ensure_future, shield, sleep
 import logging
 import sys
-from typing import Optional
+from time import perf_counter
+from typing import Dict, Optional
 
-from aiohttp import ClientSession, CookieJar
-
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from aiohttp import ClientSession
+from yarl import URL
 
 from . import LoginException, SessionTerminatedException
 from ..helpers.const import *
+from ..helpers.executor import async_run_in_executor
+from ..helpers.json_codec import json_codec
 from ..managers.configuration_manager import ConfigManager
+from ..managers.connection_manager import EdgeOSConnectionManager
+from ..models.backoff import ExponentialBackoff
+from ..models.circuit_breaker import CircuitBreaker
+from ..models.latency_histogram import LatencyHistogram
 from .web_socket import EdgeOSWebSocket
 
 REQUIREMENTS = ["aiohttp"]
@@ -29,10 +35,13 @@ class EdgeOSWebAPI:
         config_manager: ConfigManager,
         disconnection_handler=None,
         ws: Optional[EdgeOSWebSocket] = None,
+        connection_manager: Optional[EdgeOSConnectionManager] = None,
     ):
         self._config_manager = config_manager
+        self._connection_manager = connection_manager
         self._last_update = datetime.now()
         self._session: Optional[ClientSession] = None
+        self._requests_semaphore = Semaphore(MAXIMUM_CONCURRENT_REQUESTS)
 
         self._last_valid = EMPTY_LAST_VALID
         self._hass = hass
@@ -44,17 +53,33 @@ class EdgeOSWebAPI:
 
         self._disconnections = 0
 
+        self._requests = {}
+        self._in_flight_requests: Dict[str, Future] = {}
+        self._coalesced_requests = 0
+        self._response_sizes = {}
+        self._offloaded_responses = 0
+        self._failed_requests = 0
+        self._retries = 0
+        self._logins = 0
+        self._restored_sessions = 0
+        self._latency = LatencyHistogram()
+
+        self._circuit_breaker = CircuitBreaker(
+            CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+            ExponentialBackoff(RECONNECT_INTERVAL, DEFAULT_MAXIMUM_RECONNECT_INTERVAL),
+        )
+
         self._ws = ws
 
     async def initialize(self):
-        cookie_jar = CookieJar(unsafe=True)
+        maximum_interval = self._config_manager.data.maximum_reconnect_interval
+        self._circuit_breaker.backoff.maximum = maximum_interval
 
-        if self._hass is None:
-            self._session = ClientSession(cookie_jar=cookie_jar)
-        else:
-            self._session = async_create_clientsession(
-                hass=self._hass, cookies=self._cookies, cookie_jar=cookie_jar,
-            )
+        if self._connection_manager is None:
+            self._connection_manager = EdgeOSConnectionManager(self._hass)
+
+        self._session = self._connection_manager.session
+        self._clear_cookies()
 
     @property
     def is_initialized(self):
@@ -68,6 +93,29 @@ class EdgeOSWebAPI:
     def product(self):
         return self._product
 
+    @property
+    def is_router_down(self):
+        """Circuit breaker is open, requests other than heartbeat are rejected."""
+        return not self._circuit_breaker.is_closed
+
+    @property
+    def statistics(self):
+        result = {
+            "requests": dict(self._requests),
+            "in_flight_requests": len(self._in_flight_requests),
+            "coalesced_requests": self._coalesced_requests,
+            "response_sizes": dict(self._response_sizes),
+            "offloaded_responses": self._offloaded_responses,
+            "failed_requests": self._failed_requests,
+            "retries": self._retries,
+            "logins": self._logins,
+            "restored_sessions": self._restored_sessions,
+            "latency": self._latency.to_dict(),
+            "circuit_breaker": self._circuit_breaker.to_dict(),
+        }
+
+        return result
+
     @property
     def session_id(self):
         session_id = self.get_cookie_data(COOKIE_PHPSESSID)
@@ -92,6 +140,67 @@ class EdgeOSWebAPI:
 
         return cookie_data
 
+    @property
+    def stored_session(self) -> dict:
+        stored_session = {
+            STORED_SESSION_USERNAME: self._config_manager.data.username,
+            STORED_SESSION_COOKIES: dict(self._cookies),
+            STORED_SESSION_PRODUCT: self._product,
+        }
+
+        return stored_session
+
+    async def async_restore_session(self, stored_session: Optional[dict]) -> bool:
+        """
+        Reuse cookies and product of a previous login instead of logging in,
+        valid only when the router accepts them for a heartbeat.
+        """
+        if stored_session is None:
+            return False
+
+        username = stored_session.get(STORED_SESSION_USERNAME)
+        cookies = stored_session.get(STORED_SESSION_COOKIES, {})
+
+        if username != self._config_manager.data.username or len(cookies) == 0:
+            return False
+
+        self._session.cookie_jar.update_cookies(
+            cookies, URL(self._config_manager.data.url)
+        )
+
+        self._cookies = dict(cookies)
+        self._product = stored_session.get(STORED_SESSION_PRODUCT, PRODUCT_NAME)
+        self._last_valid = EMPTY_LAST_VALID
+
+        is_valid = await self.async_send_heartbeat(0)
+
+        if is_valid:
+            self._restored_sessions += 1
+
+            _LOGGER.debug("Stored session restored")
+
+        else:
+            _LOGGER.debug("Stored session rejected, logging in")
+
+            self._product = PRODUCT_NAME
+
+            if self.is_initialized:
+                self._clear_cookies()
+            else:
+                await self.initialize()
+
+        return is_valid
+
+    def _clear_cookies(self):
+        """
+        Drops the router's cookies only, the session's cookie jar is shared,
+        the WS sends its own cookies with the handshake.
+        """
+        host = URL(self._config_manager.data.url).host
+
+        self._session.cookie_jar.clear_domain(host)
+        self._cookies = {}
+
     async def login(self, throw_exception=False):
         logged_in = False
 
@@ -106,6 +215,8 @@ class EdgeOSWebAPI:
             if self._session.closed:
                 raise SessionTerminatedException()
 
+            self._logins += 1
+
             async with self._session.post(url, data=credentials, ssl=False) as response:
                 all_cookies = self._session.cookie_jar.filter_cookies(response.url)
 
@@ -152,28 +263,80 @@ class EdgeOSWebAPI:
 
         return logged_in
 
-    async def async_get(self, url):
+    async def async_get(self, url, name=None, is_probe=False):
+        """
+        Single-flight GET, concurrent calls of the same URL share the request
+        in flight and its result instead of sending it again.
+        While the router is down only probes (heartbeat) are sent, once the
+        probe's backoff delay elapsed.
+        """
+        if name is None:
+            name = url
+
+        if not self._circuit_breaker.allow_request(is_probe):
+            _LOGGER.debug("Request rejected, router is down, URL: %s", url)
+
+            return None
+
+        request = self._in_flight_requests.get(url)
+
+        if request is None:
+            request = ensure_future(self._async_single_get(url, name))
+
+            self._in_flight_requests[url] = request
+
+            request.add_done_callback(lambda _: self._in_flight_requests.pop(url, None))
+        else:
+            self._coalesced_requests += 1
+
+            _LOGGER.debug("Joining request in flight, URL: %s", url)
+
+        result = await shield(request)
+
+        return result
+
+    async def _async_single_get(self, url, name):
+        self._requests[name] = self._requests.get(name, 0) + 1
+
+        async with self._requests_semaphore:
+            started = perf_counter()
+
+            result = await self._async_get(url, name)
+
+            self._latency.observe(perf_counter() - started)
+
+        return result
+
+    async def _async_get(self, url, name):
         result = None
-        message = None
+        reason = None
+        error = None
+        line_number = None
         status = 404
+        is_reachable = False
+
+        retry_backoff = ExponentialBackoff(
+            REQUEST_RETRY_INTERVAL, REQUEST_RETRY_MAXIMUM_INTERVAL
+        )
 
         retry_attempt = 0
         while retry_attempt < MAXIMUM_RECONNECT:
             if retry_attempt > 0:
-                await sleep(1)
+                await sleep(retry_backoff.next_delay())
 
             retry_attempt = retry_attempt + 1
+            is_reachable = False
 
             try:
                 async with self._session.get(url, ssl=False) as response:
                     status = response.status
-
-                    message = (
-                        f"URL: {url}, Status: {response.reason} ({response.status})"
-                    )
+                    reason = response.reason
+                    error = None
+                    is_reachable = status < 500
 
                     if status < 400:
-                        result = await response.json()
+                        content = await response.read()
+                        result = await self._async_decode(name, content)
                         break
                     elif status == 403:
                         self._session = None
@@ -184,27 +347,66 @@ class EdgeOSWebAPI:
             except Exception as ex:
                 exc_type, exc_obj, tb = sys.exc_info()
                 line_number = tb.tb_lineno
-                message = f"URL: {url}, Error: {ex}, Line: {line_number}"
+                error = ex
 
         valid_response = status < 400
 
         self._is_connected = valid_response
 
-        if retry_attempt > 1:
-            message = f"{message}, Retry attempt #{retry_attempt}"
+        if is_reachable:
+            self._circuit_breaker.record_success()
+        else:
+            self._circuit_breaker.record_failure()
+
+        self._retries += retry_attempt - 1
 
         if valid_response:
             self._last_update = datetime.now()
-            _LOGGER.debug(message)
+
+            _LOGGER.debug(
+                "URL: %s, Status: %s (%s), Attempts: %s",
+                url,
+                reason,
+                status,
+                retry_attempt,
+            )
 
         else:
-            _LOGGER.warning(f"Request failed, {message}")
+            self._failed_requests += 1
+
+            if error is None:
+                _LOGGER.warning(
+                    "Request failed, URL: %s, Status: %s (%s), Attempts: %s",
+                    url,
+                    reason,
+                    status,
+                    retry_attempt,
+                )
+            else:
+                _LOGGER.warning(
+                    "Request failed, URL: %s, Error: %s, Line: %s, Attempts: %s",
+                    url,
+                    error,
+                    line_number,
+                    retry_attempt,
+                )
 
             if self._ws is not None:
                 self._ws.disconnect()
 
         return result
 
+    async def _async_decode(self, name, content: bytes):
+        """Decode JSON, runs in executor when content exceeds the threshold."""
+        self._response_sizes[name] = len(content)
+
+        if len(content) < EXECUTOR_PAYLOAD_SIZE:
+            return json_codec.loads(content)
+
+        self._offloaded_responses += 1
+
+        return await async_run_in_executor(self._hass, json_codec.loads, content)
+
     @property
     def last_update(self):
         result = self._last_update
@@ -228,10 +430,12 @@ class EdgeOSWebAPI:
                         heartbeat_req_url, current_ts
                     )
 
-                    response = await self.async_get(heartbeat_req_full_url)
+                    response = await self.async_get(
+                        heartbeat_req_full_url, EDGEOS_API_HEARTBREAT, True
+                    )
 
-                    if response is not None:
-                        _LOGGER.debug(f"Heartbeat response: {response}")
+                    if response is not None and response.get(HEARTBEAT_SESSION, True):
+                        _LOGGER.debug("Heartbeat response: %s", response)
 
                         self._last_valid = ts
             else:
@@ -255,7 +459,7 @@ class EdgeOSWebAPI:
             if self.is_initialized:
                 get_req_url = self.get_edgeos_api_endpoint(EDGEOS_API_GET)
 
-                result_json = await self.async_get(get_req_url)
+                result_json = await self.async_get(get_req_url, EDGEOS_API_GET)
 
                 if result_json is not None:
                     if RESPONSE_SUCCESS_KEY in result_json:
@@ -294,7 +498,9 @@ class EdgeOSWebAPI:
                     data_req_url, clean_item
                 )
 
-                data = await self.async_get(data_req_full_url)
+                data = await self.async_get(
+                    data_req_full_url, f"{EDGEOS_API_DATA}/{clean_item}"
+                )
 
                 if data is not None:
                     if RESPONSE_SUCCESS_KEY in data:
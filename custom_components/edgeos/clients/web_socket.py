@@ -4,18 +4,21 @@ For more details about this component, please refer to the documentation at
 https://home-assistant.io/components/edgeos/
 """
 import asyncio
-import json
 import logging
-import re
+from time import perf_counter
 from typing import Optional
 from urllib.parse import urlparse
 
 import aiohttp
 
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
-
 from ..helpers.const import *
+from ..helpers.executor import async_run_in_executor
+from ..helpers.json_codec import json_codec
+from ..managers.connection_manager import EdgeOSConnectionManager
 from ..models.config_data import ConfigData
+from ..models.latency_histogram import LatencyHistogram
+from .frame_decoder import EdgeOSFrameDecoder
+from .web_socket_recorder import EdgeOSWebSocketRecorder
 
 REQUIREMENTS = ["aiohttp"]
 
@@ -23,16 +26,39 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class EdgeOSWebSocket:
-    def __init__(self, hass, config_manager, topics, edgeos_callback):
+    def __init__(
+        self,
+        hass,
+        config_manager,
+        topics,
+        edgeos_callback,
+        prepare_callback=None,
+        connection_manager: Optional[EdgeOSConnectionManager] = None,
+    ):
+        """
+        edgeos_callback gets the decoded payload, payloads larger than
+        EXECUTOR_PAYLOAD_SIZE are passed to prepare_callback in the executor
+        instead of being decoded on the loop, its result is passed to
+        edgeos_callback with prepared=True.
+        connection_manager provides the session (shared with the API).
+        """
         self._config_manager = config_manager
+        self._connection_manager = connection_manager
         self._last_update = datetime.now()
         self._edgeos_callback = edgeos_callback
+        self._prepare_callback = prepare_callback
         self._hass = hass
         self._session_id = None
-        self._topics = topics
+        self._cookie_header = ""
+        self._topics = list(topics)
+        self._subscribed_topics = set()
         self._session = None
         self._ws = None
-        self._pending_payloads = []
+        self._decoder = EdgeOSFrameDecoder()
+        self._recorder: Optional[EdgeOSWebSocketRecorder] = None
+        self._parse_failures = 0
+        self._offloaded_payloads = 0
+        self._latency = LatencyHistogram()
         self.shutting_down = False
         self._is_connected = False
 
@@ -58,13 +84,18 @@ class EdgeOSWebSocket:
             self._is_connected = False
             self.shutting_down = False
 
+            self._decoder.reset()
+            await self.async_start_recording()
+
             self._session_id = session_id
-            if self._hass is None:
-                self._session = aiohttp.client.ClientSession(cookies=cookies)
-            else:
-                self._session = async_create_clientsession(
-                    hass=self._hass, cookies=cookies
-                )
+
+            if self._connection_manager is None:
+                self._connection_manager = EdgeOSConnectionManager(self._hass)
+
+            self._session = self._connection_manager.session
+            self._cookie_header = "; ".join(
+                f"{key}={value}" for key, value in cookies.items()
+            )
 
         except Exception as ex:
             _LOGGER.warning(f"Failed to create session of EdgeOS WS, Error: {str(ex)}")
@@ -73,6 +104,7 @@ class EdgeOSWebSocket:
             async with self._session.ws_connect(
                 self.ws_url,
                 origin=self.config_data.url,
+                headers={aiohttp.hdrs.COOKIE: self._cookie_header},
                 ssl=False,
                 autoclose=True,
                 max_msg_size=MAX_MSG_SIZE,
@@ -91,6 +123,7 @@ class EdgeOSWebSocket:
                 _LOGGER.warning(f"Failed to connect EdgeOS WS, Error: {ex}")
 
         self._is_connected = False
+        await self.async_stop_recording()
 
         _LOGGER.info("WS Connection terminated")
 
@@ -100,58 +133,171 @@ class EdgeOSWebSocket:
 
         return is_initialized
 
+    @property
+    def is_connected(self):
+        return self._is_connected
+
     @property
     def last_update(self):
         result = self._last_update
 
         return result
 
+    @property
+    def recording_path(self):
+        file_name = WS_RECORDING_FILE.format(self.config_data.host)
+
+        if self._hass is None:
+            return file_name
+
+        return self._hass.config.path(file_name)
+
+    @property
+    def statistics(self):
+        result = self._decoder.statistics
+        result["parse_failures"] = self._parse_failures
+        result["offloaded_payloads"] = self._offloaded_payloads
+        result["topics"] = sorted(self._subscribed_topics)
+        result["latency"] = self._latency.to_dict()
+
+        if self._recorder is not None:
+            result["recorded_frames"] = self._recorder.frames
+            result["dropped_recorded_frames"] = self._recorder.dropped_frames
+
+        return result
+
+    async def async_start_recording(self):
+        await self.async_stop_recording()
+
+        if not self.config_data.record_incoming_messages:
+            return
+
+        try:
+            self._recorder = EdgeOSWebSocketRecorder(self.recording_path)
+            self._recorder.start()
+
+        except Exception as ex:
+            self._recorder = None
+
+            _LOGGER.warning(f"Failed to start recording of WS, Error: {ex}")
+
+    async def async_stop_recording(self):
+        """
+        Waits (in the executor) for the writer thread to close the file, a
+        new recorder never writes the same file concurrently.
+        """
+        recorder = self._recorder
+
+        if recorder is None:
+            return
+
+        self._recorder = None
+
+        recorder.stop()
+
+        await async_run_in_executor(self._hass, recorder.join)
+
+    def record_message(self, message):
+        """Queued for the recorder's writer thread, no file I/O on the loop."""
+        self._recorder.enqueue(message)
+
     def parse_message(self, message):
-        parsed = False
+        started = perf_counter()
+
+        for payload in self._decoder.feed(message):
+            self._handle_payload(payload)
+
+        self._latency.observe(perf_counter() - started)
+
+    async def async_parse_message(self, message):
+        """Same as parse_message, large payloads are prepared in executor."""
+        started = perf_counter()
+
+        for payload in self._decoder.feed(message):
+            if self._prepare_callback is None or len(payload) < EXECUTOR_PAYLOAD_SIZE:
+                self._handle_payload(payload)
+
+                continue
+
+            self._offloaded_payloads += 1
+
+            try:
+                prepared_payload = await async_run_in_executor(
+                    self._hass, self._prepare_callback, payload
+                )
+
+            except Exception as ex:
+                self._log_parse_failure(payload, ex)
+
+                continue
+
+            self._edgeos_callback(prepared_payload, True)
+
+        self._latency.observe(perf_counter() - started)
 
+    def _handle_payload(self, payload: bytes):
         try:
-            message = message.replace(NEW_LINE, EMPTY_STRING)
-            message = re.sub(BEGINS_WITH_SIX_DIGITS, EMPTY_STRING, message)
+            payload_json = json_codec.loads(payload)
 
-            if len(self._pending_payloads) > 0:
-                message_previous = "".join(self._pending_payloads)
-                message = f"{message_previous}{message}"
+        except ValueError as ex:
+            self._log_parse_failure(payload, ex)
 
-            if len(message) > 0:
-                payload_json = json.loads(message)
+            return
 
-                self._edgeos_callback(payload_json)
-                parsed = True
-            else:
-                _LOGGER.debug("Parse message skipped (Empty)")
+        self._edgeos_callback(payload_json)
 
-        except Exception as ex:
-            _LOGGER.debug(f"Parse message failed due to partial payload, Error: {ex}")
+    def _log_parse_failure(self, payload: bytes, ex: Exception):
+        self._parse_failures += 1
 
-        finally:
-            if parsed or len(self._pending_payloads) > MAX_PENDING_PAYLOADS:
-                self._pending_payloads = []
-            else:
-                self._pending_payloads.append(message)
+        _LOGGER.warning(f"Failed to parse message of {len(payload)} bytes, Error: {ex}")
 
     async def async_send_heartbeat(self):
-        _LOGGER.debug(f"Keep alive message sent")
+        _LOGGER.debug("Keep alive message sent")
 
         data = self.get_keep_alive_data()
 
         if self._is_connected:
             await self._ws.send_str(data)
 
+    async def async_update_topics(self, topics):
+        """Subscribes added and unsubscribes removed topics when connected."""
+        self._topics = list(topics)
+
+        if self._is_connected:
+            await self._async_send_subscription()
+
+    async def _async_send_subscription(self):
+        topics_to_subscribe = [
+            topic for topic in self._topics if topic not in self._subscribed_topics
+        ]
+        topics_to_unsubscribe = [
+            topic for topic in self._subscribed_topics if topic not in self._topics
+        ]
+
+        if len(topics_to_subscribe) == 0 and len(topics_to_unsubscribe) == 0:
+            return
+
+        subscription_data = self.get_subscription_data(
+            topics_to_subscribe, topics_to_unsubscribe
+        )
+        await self._ws.send_str(subscription_data)
+
+        self._subscribed_topics = set(self._topics)
+
+        _LOGGER.info(
+            f"Subscribed to WS topics: {topics_to_subscribe}, "
+            f"unsubscribed from: {topics_to_unsubscribe}"
+        )
+
     async def listen(self):
         _LOGGER.info(f"Starting to listen connected")
 
-        subscription_data = self.get_subscription_data()
-        await self._ws.send_str(subscription_data)
+        self._subscribed_topics = set()
 
-        _LOGGER.info("Subscribed to WS payloads")
+        await self._async_send_subscription()
 
         async for msg in self._ws:
-            continue_to_next = self.handle_next_message(msg)
+            continue_to_next = await self.handle_next_message(msg)
 
             if (
                 not continue_to_next
@@ -162,8 +308,8 @@ class EdgeOSWebSocket:
 
         _LOGGER.info(f"Stop listening")
 
-    def handle_next_message(self, msg):
-        _LOGGER.debug(f"Starting to handle next message")
+    async def handle_next_message(self, msg):
+        _LOGGER.debug("Starting to handle next message")
         result = False
 
         if msg.type in (
@@ -177,15 +323,20 @@ class EdgeOSWebSocket:
             _LOGGER.warning(f"Connection error, Description: {self._ws.exception()}")
 
         else:
-            if self.config_data.log_incoming_messages:
-                _LOGGER.debug(f"New message received: {str(msg)}")
+            if self.config_data.log_incoming_messages and _LOGGER.isEnabledFor(
+                logging.DEBUG
+            ):
+                _LOGGER.debug("New message received: %s", msg)
 
             self._last_update = datetime.now()
 
             if msg.data == "close":
                 result = False
             else:
-                self.parse_message(msg.data)
+                if self._recorder is not None:
+                    self.record_message(msg.data)
+
+                await self.async_parse_message(msg.data)
 
                 result = True
 
@@ -200,6 +351,8 @@ class EdgeOSWebSocket:
         self._session_id = None
         self._is_connected = False
 
+        await self.async_stop_recording()
+
         if self._ws is not None:
             await self._ws.close()
 
@@ -211,24 +364,25 @@ class EdgeOSWebSocket:
     def get_keep_alive_data():
         content = "{CLIENT_PING}"
 
-        _LOGGER.debug(f"Keep alive data to be sent: {content}")
+        _LOGGER.debug("Keep alive data to be sent: %s", content)
 
         return content
 
-    def get_subscription_data(self):
-        topics_to_subscribe = [{WS_TOPIC_NAME: topic} for topic in self._topics]
-        topics_to_unsubscribe = []
-
+    def get_subscription_data(self, topics_to_subscribe, topics_to_unsubscribe):
         data = {
-            WS_TOPIC_SUBSCRIBE: topics_to_subscribe,
-            WS_TOPIC_UNSUBSCRIBE: topics_to_unsubscribe,
+            WS_TOPIC_SUBSCRIBE: [
+                {WS_TOPIC_NAME: topic} for topic in topics_to_subscribe
+            ],
+            WS_TOPIC_UNSUBSCRIBE: [
+                {WS_TOPIC_NAME: topic} for topic in topics_to_unsubscribe
+            ],
             WS_SESSION_ID: self._session_id,
         }
 
-        content = json.dumps(data, separators=(STRING_COMMA, STRING_COLON))
-        content_length = len(content)
+        content = json_codec.dumps(data)
+        content_length = len(content.encode())
         data = f"{content_length}\n{content}"
 
-        _LOGGER.debug(f"Subscription data to be sent: {data}")
+        _LOGGER.debug("Subscription data to be sent: %s", data)
 
         return data
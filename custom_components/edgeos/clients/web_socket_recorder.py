@@ -0,0 +1,290 @@
+"""
+This component provides support for Home Automation Manager (HAM).
+For more details about this component, please refer to the documentation at
+https://home-assistant.io/components/edgeos/
+"""
+import asyncio
+import logging
+import os
+import queue
+import struct
+import threading
+import time
+from typing import BinaryIO, Callable, Iterator, List, Optional, Tuple, Union
+
+from ..helpers.const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+RECORD_HEADER = struct.Struct("<dI")
+
+
+class EdgeOSWebSocketRecorder:
+    """
+    Writes raw WS frames into a compact, size-capped recording.
+
+    Every frame is stored as `<timestamp (double)><length (uint32)><bytes>`
+    after a magic header, once the file reaches max_size it is rotated
+    (file -> file.1 -> ... -> file.<backup_count>), oldest one is dropped.
+
+    open / write / close are blocking, from the event loop use start /
+    enqueue / stop, the file is opened, written, rotated and closed by a
+    dedicated writer thread, frames beyond WS_RECORDING_QUEUE_SIZE pending
+    ones are dropped. join (blocking, run it in the executor) waits for the
+    writer to drain the queue and close the file after stop.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = WS_RECORDING_MAX_SIZE,
+        backup_count: int = WS_RECORDING_BACKUP_COUNT,
+    ):
+        self._path = path
+        self._max_size = max_size
+        self._backup_count = backup_count
+
+        self._file: Optional[BinaryIO] = None
+        self._size = 0
+
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        self.frames = 0
+        self.dropped_frames = 0
+        self.rotations = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    def start(self):
+        """Starts the writer thread, doesn't block."""
+        self._queue = queue.Queue(WS_RECORDING_QUEUE_SIZE)
+        self._stop_event.clear()
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"{DOMAIN}_ws_recorder", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Writer thread writes pending frames and closes the file, no waiting."""
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def join(self):
+        """Blocks until the stopped writer thread closed the file."""
+        thread = self._thread
+
+        if thread is None:
+            return
+
+        thread.join()
+
+        self._thread = None
+
+    def enqueue(self, data: Union[str, bytes], timestamp: float = None) -> bool:
+        """Queues a frame for the writer thread, False when it was dropped."""
+        if self._thread is None or self._stop_event.is_set():
+            return False
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        try:
+            self._queue.put_nowait((data, timestamp))
+        except queue.Full:
+            self.dropped_frames += 1
+
+            return False
+
+        return True
+
+    def _run(self):
+        try:
+            self.open()
+
+            while True:
+                try:
+                    item = self._queue.get(timeout=WS_RECORDING_STOP_TIMEOUT)
+                except queue.Empty:
+                    if self._stop_event.is_set():
+                        break
+
+                    continue
+
+                if item is None:
+                    break
+
+                self.write(*item)
+
+        except Exception as ex:
+            self._stop_event.set()
+
+            _LOGGER.warning(f"Failed to record WS frames, Error: {ex}")
+
+        finally:
+            self.close()
+
+            _LOGGER.info(f"Recorded {self.frames} WS frames into {self._path}")
+
+    def open(self):
+        self.close()
+
+        self._file = open(self._path, "ab")
+        self._size = self._file.tell()
+
+        if self._size == 0:
+            self._file.write(WS_RECORDING_MAGIC)
+            self._size = len(WS_RECORDING_MAGIC)
+
+        _LOGGER.info(f"Recording WS frames into {self._path}")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+            self._file = None
+
+    def write(self, data: Union[str, bytes], timestamp: float = None):
+        if self._file is None:
+            return
+
+        if isinstance(data, str):
+            data = data.encode()
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        record_size = RECORD_HEADER.size + len(data)
+
+        if self._size + record_size > self._max_size:
+            self._rotate()
+
+        self._file.write(RECORD_HEADER.pack(timestamp, len(data)))
+        self._file.write(data)
+
+        self._size += record_size
+        self.frames += 1
+
+    def _rotate(self):
+        self.close()
+
+        for index in range(self._backup_count, 0, -1):
+            source = get_recording_path(self._path, index - 1)
+            target = get_recording_path(self._path, index)
+
+            if os.path.exists(source):
+                os.replace(source, target)
+
+        if self._backup_count == 0:
+            os.remove(self._path)
+
+        self.rotations += 1
+
+        self.open()
+
+
+class EdgeOSWebSocketReplayer:
+    """Feeds recorded WS frames back into a handler, e.g. parse_message."""
+
+    def __init__(self, path: str, backup_count: int = WS_RECORDING_BACKUP_COUNT):
+        self._path = path
+        self._backup_count = backup_count
+
+    @property
+    def files(self) -> List[str]:
+        """Recording files ordered from the oldest to the newest."""
+        paths = [
+            get_recording_path(self._path, index)
+            for index in range(self._backup_count, -1, -1)
+        ]
+
+        return [path for path in paths if os.path.exists(path)]
+
+    def read(self) -> Iterator[Tuple[float, bytes]]:
+        for path in self.files:
+            with open(path, "rb") as file:
+                yield from read_recording(file)
+
+    async def replay(
+        self, handler: Callable[[bytes], None], speed: float = 1.0
+    ) -> dict:
+        """
+        Replay frames into handler, speed of 1 keeps the recorded timing,
+        higher values replay faster, 0 replays as fast as possible.
+        """
+        frames = 0
+        size = 0
+        first_timestamp = None
+
+        started = time.perf_counter()
+
+        for timestamp, data in self.read():
+            if first_timestamp is None:
+                first_timestamp = timestamp
+
+            if speed > 0:
+                delay = (timestamp - first_timestamp) / speed
+                delay -= time.perf_counter() - started
+
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            handler(data)
+
+            frames += 1
+            size += len(data)
+
+        elapsed = time.perf_counter() - started
+
+        result = {
+            "frames": frames,
+            "bytes": size,
+            "seconds": elapsed,
+        }
+
+        return result
+
+
+def get_recording_path(path: str, index: int) -> str:
+    if index == 0:
+        return path
+
+    return f"{path}.{index}"
+
+
+def read_recording(file: BinaryIO) -> Iterator[Tuple[float, bytes]]:
+    magic = file.read(len(WS_RECORDING_MAGIC))
+
+    if magic != WS_RECORDING_MAGIC:
+        raise ValueError(f"Invalid WS recording, Header: {magic}")
+
+    while True:
+        header = file.read(RECORD_HEADER.size)
+
+        if len(header) < RECORD_HEADER.size:
+            break
+
+        timestamp, length = RECORD_HEADER.unpack(header)
+        data = file.read(length)
+
+        if len(data) < length:
+            _LOGGER.warning(f"Truncated WS recording frame, {len(data)}/{length} bytes")
+
+            break
+
+        yield timestamp, data
@@ -0,0 +1,38 @@
+"""
+Diagnostics support for EdgeOS.
+For more details about this platform, please refer to the documentation at
+https://home-assistant.io/components/edgeos/
+"""
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .helpers import get_ha
+from .helpers.const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+REDACTED = "**REDACTED**"
+TO_REDACT = [CONF_USERNAME, CONF_PASSWORD]
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict:
+    """Return diagnostics of a config entry."""
+    data = {
+        key: REDACTED if key in TO_REDACT else value
+        for key, value in entry.data.items()
+    }
+
+    result = {
+        "entry": {"title": entry.title, "data": data, "options": dict(entry.options)},
+    }
+
+    ha = get_ha(hass, entry.entry_id)
+
+    if ha is not None:
+        result.update(ha.diagnostics)
+
+    return result
@@ -1,13 +1,20 @@
 import logging
 import sys
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
 
 from ..managers.home_assistant import EdgeOSHomeAssistant
 from ..managers.password_manager import PasswordManager
 from .const import *
 
+try:
+    from homeassistant.core import SupportsResponse
+except ImportError:
+    SupportsResponse = None
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -55,6 +62,100 @@ async def async_set_ha(hass: HomeAssistant, entry: ConfigEntry):
     return initialized
 
 
+def query_time_series(hass: HomeAssistant, data: dict) -> dict:
+    """Statistics of a monitored interface / device field per router."""
+    key = TIME_SERIES_TYPES[data[ATTR_TYPE]]
+    field = data[ATTR_FIELD]
+
+    if field not in TIME_SERIES_FIELDS[key]:
+        raise vol.Invalid(
+            f"Invalid field {field} for {data[ATTR_TYPE]}, "
+            f"available: {', '.join(TIME_SERIES_FIELDS[key])}",
+            path=[ATTR_FIELD],
+        )
+
+    routers = {}
+
+    for ha in hass.data.get(DATA_EDGEOS, dict()).values():
+        statistics = ha.data_manager.query_time_series(
+            key, data[ATTR_NAME], field, data[ATTR_WINDOW], data[ATTR_PERCENTILES]
+        )
+
+        if statistics is not None:
+            routers[ha.config_manager.config_entry.title] = statistics
+
+    result = {
+        ATTR_TYPE: data[ATTR_TYPE],
+        ATTR_NAME: data[ATTR_NAME],
+        ATTR_FIELD: field,
+        ATTR_WINDOW: data[ATTR_WINDOW],
+        "routers": routers,
+    }
+
+    return result
+
+
+def query_traffic(hass: HomeAssistant, data: dict) -> dict:
+    """Top applications, categories and talkers by DPI traffic per router."""
+    count = data[ATTR_COUNT]
+
+    routers = {}
+
+    for ha in hass.data.get(DATA_EDGEOS, dict()).values():
+        data_manager = ha.data_manager
+
+        if data_manager.config_data.traffic_sensors:
+            routers[ha.config_manager.config_entry.title] = {
+                kind: data_manager.get_traffic(kind, count)
+                for kind in TRAFFIC_TOP_KINDS
+            }
+
+    result = {ATTR_COUNT: count, "routers": routers}
+
+    return result
+
+
+def async_register_services(hass: HomeAssistant):
+    services = {
+        SERVICE_QUERY_TIME_SERIES: (
+            query_time_series,
+            EVENT_TIME_SERIES,
+            SERVICE_QUERY_TIME_SERIES_SCHEMA,
+        ),
+        SERVICE_QUERY_TRAFFIC: (
+            query_traffic,
+            EVENT_TRAFFIC,
+            SERVICE_QUERY_TRAFFIC_SCHEMA,
+        ),
+    }
+
+    kwargs = {}
+
+    if SupportsResponse is not None:
+        kwargs["supports_response"] = SupportsResponse.OPTIONAL
+
+    for service, (query, event, schema) in services.items():
+        if hass.services.has_service(DOMAIN, service):
+            continue
+
+        hass.services.async_register(
+            DOMAIN, service, _get_query_handler(hass, query, event), schema, **kwargs
+        )
+
+
+def _get_query_handler(hass: HomeAssistant, query, event):
+    """Service handler firing the query result as event and returning it."""
+
+    async def async_handle_query(service_call: ServiceCall):
+        result = query(hass, dict(service_call.data))
+
+        hass.bus.async_fire(event, result)
+
+        return result
+
+    return async_handle_query
+
+
 async def handle_log_level(hass: HomeAssistant, entry: ConfigEntry):
     log_level = entry.options.get(CONF_LOG_LEVEL, LOG_LEVEL_DEFAULT)
 
@@ -20,6 +20,7 @@ VERSION = "2.0.0"
 
 DOMAIN = "edgeos"
 DATA_EDGEOS = "edgeos_data"
+DATA_EDGEOS_STORAGE_LOCK = "edgeos_storage_lock"
 DEFAULT_NAME = "EdgeOS"
 PASSWORD_MANAGER_EDGEOS = "password_manager_edgeos"
 PRODUCT_NAME = f"{DEFAULT_NAME} Device"
@@ -27,6 +28,7 @@ PRODUCT_NAME = f"{DEFAULT_NAME} Device"
 SIGNAL_UPDATE_BINARY_SENSOR = f"{DEFAULT_NAME}_{DOMAIN_BINARY_SENSOR}_SIGNLE_UPDATE"
 SIGNAL_UPDATE_SENSOR = f"{DEFAULT_NAME}_{DOMAIN_SENSOR}_SIGNLE_UPDATE"
 SIGNAL_UPDATE_TRACKERS = f"{DEFAULT_NAME}_{DOMAIN_DEVICE_TRACKER}_SIGNLE_UPDATE"
+SIGNAL_UPDATE_ENTITY = f"{DEFAULT_NAME}_ENTITY_UPDATE_{{}}"
 
 SIGNALS = {
     DOMAIN_BINARY_SENSOR: SIGNAL_UPDATE_BINARY_SENSOR,
@@ -49,6 +51,7 @@ CONF_TRACK_DEVICES_CLEAR = f"{CONF_TRACK_DEVICES}{CLEAR_SUFFIX}"
 CONF_UNIT = "unit"
 CONF_UPDATE_ENTITIES_INTERVAL = "update_entities_interval"
 CONF_UPDATE_API_INTERVAL = "update_api_interval"
+CONF_UPDATE_DEBOUNCE_INTERVAL = "update_debounce_interval"
 CONF_CLEAR_CREDENTIALS = "clear-credentials"
 CONF_ARR = [CONF_NAME, CONF_HOST, CONF_USERNAME, CONF_PASSWORD, CONF_UNIT]
 
@@ -75,15 +78,42 @@ EDGEOS_API_HEARTBREAT = "heartbeat"
 COOKIE_PHPSESSID = "PHPSESSID"
 COOKIE_BEAKER_SESSION_ID = "beaker.session.id"
 
+HEARTBEAT_SESSION = "SESSION"
+STORED_SESSION_COOKIES = "cookies"
+STORED_SESSION_PRODUCT = "product"
+STORED_SESSION_USERNAME = "username"
+
 RECONNECT_INTERVAL = 5
 DISCONNECT_INTERVAL = 5
 DEFAULT_UPDATE_API_INTERVAL = 60
 DEFAULT_UPDATE_ENTITIES_INTERVAL = 1
+DEFAULT_UPDATE_DEBOUNCE_INTERVAL = 500
+MINIMUM_UPDATE_DEBOUNCE_INTERVAL = 250
+MAXIMUM_UPDATE_DEBOUNCE_INTERVAL = 2000
 
 MAXIMUM_RECONNECT = 3
+DEFAULT_MAXIMUM_RECONNECT_INTERVAL = 300
+REQUEST_RETRY_INTERVAL = 1
+REQUEST_RETRY_MAXIMUM_INTERVAL = 8
+BACKOFF_MULTIPLIER = 2
+BACKOFF_JITTER = 0.5
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3
+CIRCUIT_BREAKER_CLOSED = "closed"
+CIRCUIT_BREAKER_OPEN = "open"
+CIRCUIT_BREAKER_HALF_OPEN = "half_open"
+MAXIMUM_CONCURRENT_REQUESTS = 2
+REFRESH_TIMEOUT = 30
+POLLING_TICK_INTERVAL = 5
+POLLING_WS_LIVE_FACTOR = 5
+POLLING_WS_STALE_INTERVAL = 15
+POLL_FULL = "full"
+POLL_UNKNOWN_DEVICES = "unknown_devices"
 DEFAULT_CONSIDER_AWAY_INTERVAL = 180
 
 CONF_CONSIDER_AWAY_INTERVAL = "consider_away_interval"
+CONF_MAXIMUM_RECONNECT_INTERVAL = "maximum_reconnect_interval"
+CONF_TIME_SERIES_DEPTH = "time_series_depth"
+CONF_TRAFFIC_SENSORS = "traffic_sensors"
 
 TRUE_STR = "true"
 FALSE_STR = "false"
@@ -156,6 +186,8 @@ WS_TOPIC_SUBSCRIBE = "SUBSCRIBE"
 WS_SESSION_ID = "SESSION_ID"
 
 ATTR_LAST_CHANGED = "Last Changed"
+ATTR_TOTAL = "total"
+ATTR_DIAGNOSTICS = "Diagnostics"
 ATTR_WEB_SOCKET_LAST_UPDATE = "WS Last Update"
 ATTR_API_LAST_UPDATE = "API Last Update"
 ATTR_DEVICE_CLASS = "device_class"
@@ -197,6 +229,36 @@ DEVICE_SERVICES_STATS_MAP = {
     "tx_rate": {ATTR_NAME: "{}/ps (Sent)", ATTR_UNIT_OF_MEASUREMENT: "Bps"},
 }
 
+RATE_EWMA_TIME_CONSTANT = 30
+RATE_WINDOW = 60
+RATE_COUNTER_BITS = [32, 64]
+RATE_MAXIMUM = 10 * 1000 ** 3 / 8
+RATE_WRAP_FACTOR = 4
+RATE_WRAPPING_COUNTERS = {INTERFACES_KEY: RATE_COUNTER_BITS, STATIC_DEVICES_KEY: []}
+RATE_COUNTERS = {
+    "rx_bytes": ("rx_rate_smoothed", "rx_rate_windowed"),
+    "tx_bytes": ("tx_rate_smoothed", "tx_rate_windowed"),
+}
+
+RATE_STATS_MAP = {
+    "rx_rate_smoothed": {
+        ATTR_NAME: "{}/ps (Received, Smoothed)",
+        ATTR_UNIT_OF_MEASUREMENT: "Bps",
+    },
+    "tx_rate_smoothed": {
+        ATTR_NAME: "{}/ps (Sent, Smoothed)",
+        ATTR_UNIT_OF_MEASUREMENT: "Bps",
+    },
+    "rx_rate_windowed": {
+        ATTR_NAME: "{}/ps (Received, Last Minute)",
+        ATTR_UNIT_OF_MEASUREMENT: "Bps",
+    },
+    "tx_rate_windowed": {
+        ATTR_NAME: "{}/ps (Sent, Last Minute)",
+        ATTR_UNIT_OF_MEASUREMENT: "Bps",
+    },
+}
+
 HEARTBEAT_INTERVAL_SECONDS = 30
 HEARTBEAT_INTERVAL = timedelta(seconds=30)
 SCAN_INTERVAL_WS_TIMEOUT = timedelta(seconds=60)
@@ -204,11 +266,24 @@ SCAN_INTERVAL_API = timedelta(seconds=60)
 EMPTY_LAST_VALID = datetime.fromtimestamp(100000)
 
 MAX_MSG_SIZE = 0
-MAX_PENDING_PAYLOADS = 3
+MAX_PENDING_PAYLOAD_SIZE = 16 * MEGA_BYTE
+MAX_FRAME_HEADER_LENGTH = 16
+FRAME_HEADER_SEPARATOR = b"\n"
+FRAME_WHITESPACES = b"\r\n\t "
+
+WS_RECORDING_FILE = f"{DOMAIN}_ws_{{}}.rec"
+WS_RECORDING_MAGIC = b"EDGEOSWS1\n"
+WS_RECORDING_MAX_SIZE = 10 * MEGA_BYTE
+WS_RECORDING_BACKUP_COUNT = 2
+WS_RECORDING_QUEUE_SIZE = 1000
+WS_RECORDING_STOP_TIMEOUT = 1
+
+LATENCY_HISTOGRAM_BOUNDS = [1, 5, 10, 50, 100, 500, 1000, 5000]
+
+EXECUTOR_PAYLOAD_SIZE = 64 * KILO_BYTE
 
 EMPTY_STRING = ""
 NEW_LINE = "\n"
-BEGINS_WITH_SIX_DIGITS = "^([0-9]{1,6})"
 
 SENSOR_TYPE_INTERFACE = "Interface"
 SENSOR_TYPE_DEVICE = "Device"
@@ -249,6 +324,83 @@ CONNECTED_ICONS = {True: "mdi:lan-connect", False: "mdi:lan-disconnect"}
 
 SERVICE_LOG_EVENTS_SCHEMA = vol.Schema({vol.Required(ATTR_ENABLED): cv.boolean})
 
+DEFAULT_TIME_SERIES_DEPTH = 360
+TIME_SERIES_SENSOR_WINDOW = 300
+TIME_SERIES_SENSOR_PERCENTILE = 95
+TIME_SERIES_TYPES = {
+    SENSOR_TYPE_INTERFACE.lower(): INTERFACES_KEY,
+    SENSOR_TYPE_DEVICE.lower(): STATIC_DEVICES_KEY,
+}
+TIME_SERIES_FIELDS = {
+    INTERFACES_KEY: [
+        "rx_bytes",
+        "tx_bytes",
+        "rx_packets",
+        "tx_packets",
+        "rx_errors",
+        "tx_errors",
+        "rx_bps",
+        "tx_bps",
+        *RATE_STATS_MAP,
+    ],
+    STATIC_DEVICES_KEY: ["rx_bytes", "tx_bytes", "rx_rate", "tx_rate", *RATE_STATS_MAP],
+}
+TIME_SERIES_SENSOR_FIELDS = {
+    INTERFACES_KEY: ["rx_bps", "tx_bps"],
+    STATIC_DEVICES_KEY: ["rx_rate", "tx_rate"],
+}
+
+SERVICE_QUERY_TIME_SERIES = "query_time_series"
+EVENT_TIME_SERIES = f"{DOMAIN}_time_series"
+ATTR_TYPE = "type"
+ATTR_FIELD = "field"
+ATTR_WINDOW = "window"
+ATTR_PERCENTILES = "percentiles"
+
+SERVICE_QUERY_TIME_SERIES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_TYPE): vol.In(list(TIME_SERIES_TYPES)),
+        vol.Required(ATTR_NAME): cv.string,
+        vol.Required(ATTR_FIELD): cv.string,
+        vol.Optional(ATTR_WINDOW, default=TIME_SERIES_SENSOR_WINDOW): cv.positive_int,
+        vol.Optional(ATTR_PERCENTILES, default=[50, 95]): vol.All(
+            cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=1, max=100))]
+        ),
+    }
+)
+
+TRAFFIC_FIELDS = list(DEVICE_SERVICES_STATS_MAP)
+TRAFFIC_RX_RATE_INDEX = TRAFFIC_FIELDS.index("rx_rate")
+TRAFFIC_TX_RATE_INDEX = TRAFFIC_FIELDS.index("tx_rate")
+TRAFFIC_SERVICE_SEPARATOR = "|"
+TRAFFIC_OTHER = "Other"
+TRAFFIC_MAXIMUM_APPLICATIONS = 500
+TRAFFIC_RECOMPUTE_RATIO = 0.5
+TRAFFIC_TOP_COUNT = 10
+TRAFFIC_APPLICATIONS = "applications"
+TRAFFIC_CATEGORIES = "categories"
+TRAFFIC_SOURCES = "talkers"
+TRAFFIC_SOURCES_REBUILD_RATIO = 0.25
+TRAFFIC_TOP_KINDS = [TRAFFIC_APPLICATIONS, TRAFFIC_CATEGORIES, TRAFFIC_SOURCES]
+TRAFFIC_SENSORS = {
+    TRAFFIC_APPLICATIONS: ("Top Applications", "mdi:apps"),
+    TRAFFIC_CATEGORIES: ("Top Application Categories", "mdi:shape"),
+    TRAFFIC_SOURCES: ("Top Talkers", "mdi:account-network"),
+}
+ATTR_RATE_UNIT = "Rate Unit"
+
+SERVICE_QUERY_TRAFFIC = "query_traffic"
+EVENT_TRAFFIC = f"{DOMAIN}_traffic"
+ATTR_COUNT = "count"
+
+SERVICE_QUERY_TRAFFIC_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_COUNT, default=TRAFFIC_TOP_COUNT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=TRAFFIC_MAXIMUM_APPLICATIONS)
+        ),
+    }
+)
+
 HTTP_ERRORS = {
     404: "not_found",
     403: "invalid_credentials",
@@ -262,6 +414,8 @@ DOMAIN_KEY_FILE = f"{DOMAIN}.key"
 
 CONF_LOG_LEVEL = "log_level"
 CONF_LOG_INCOMING_MESSAGES = "log_incoming_messages"
+CONF_RECORD_INCOMING_MESSAGES = "record_incoming_messages"
+CONF_DIAGNOSTICS_SENSOR = "diagnostics_sensor"
 
 CONF_STORE_DEBUG_FILE = "store_debug_file"
 
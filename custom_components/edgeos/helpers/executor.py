@@ -0,0 +1,17 @@
+"""
+This component provides support for Home Automation Manager (HAM).
+For more details about this component, please refer to the documentation at
+https://home-assistant.io/components/edgeos/
+"""
+import asyncio
+from typing import Any, Callable
+
+
+async def async_run_in_executor(hass, func: Callable, *args) -> Any:
+    """Run func in HA's executor (default loop executor when hass is None)."""
+    if hass is None:
+        loop = asyncio.get_event_loop()
+
+        return await loop.run_in_executor(None, func, *args)
+
+    return await hass.async_add_executor_job(func, *args)
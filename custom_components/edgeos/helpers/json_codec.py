@@ -0,0 +1,92 @@
+"""
+This component provides support for Home Automation Manager (HAM).
+For more details about this component, please refer to the documentation at
+https://home-assistant.io/components/edgeos/
+"""
+import json
+import logging
+from typing import Any, Callable, Dict, Union
+
+_LOGGER = logging.getLogger(__name__)
+
+JSON_BACKEND_ORJSON = "orjson"
+JSON_BACKEND_UJSON = "ujson"
+JSON_BACKEND_STDLIB = "json"
+
+JSON_BACKENDS_PRIORITY = [JSON_BACKEND_ORJSON, JSON_BACKEND_UJSON, JSON_BACKEND_STDLIB]
+
+
+class JsonCodec:
+    name: str
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[Union[str, bytes]], Any],
+        dumps: Callable[[Any], Union[str, bytes]],
+    ):
+        self.name = name
+        self._loads = loads
+        self._dumps = dumps
+
+    def loads(self, content: Union[str, bytes]) -> Any:
+        return self._loads(content)
+
+    def dumps(self, obj: Any) -> str:
+        content = self._dumps(obj)
+
+        if isinstance(content, bytes):
+            content = content.decode()
+
+        return content
+
+    def __repr__(self):
+        return f"{{'name': {self.name}}}"
+
+
+def _load_codecs() -> Dict[str, JsonCodec]:
+    codecs = {}
+
+    try:
+        import orjson
+
+        codecs[JSON_BACKEND_ORJSON] = JsonCodec(
+            JSON_BACKEND_ORJSON, orjson.loads, orjson.dumps
+        )
+    except ImportError:
+        pass
+
+    try:
+        import ujson
+
+        codecs[JSON_BACKEND_UJSON] = JsonCodec(
+            JSON_BACKEND_UJSON, ujson.loads, ujson.dumps
+        )
+    except ImportError:
+        pass
+
+    codecs[JSON_BACKEND_STDLIB] = JsonCodec(
+        JSON_BACKEND_STDLIB,
+        json.loads,
+        lambda obj: json.dumps(obj, separators=(",", ":")),
+    )
+
+    return codecs
+
+
+JSON_CODECS = _load_codecs()
+
+
+def get_json_codec(name: str = None) -> JsonCodec:
+    """Return codec by name, defaults to the fastest available one."""
+    if name is not None:
+        return JSON_CODECS[name]
+
+    for backend in JSON_BACKENDS_PRIORITY:
+        if backend in JSON_CODECS:
+            return JSON_CODECS[backend]
+
+
+json_codec = get_json_codec()
+
+_LOGGER.debug("JSON backend in use: %s", json_codec.name)
@@ -10,6 +10,7 @@ from ..clients import LoginException
 from ..clients.web_api import EdgeOSWebAPI
 from ..helpers.const import *
 from ..managers.configuration_manager import ConfigManager
+from ..managers.connection_manager import EdgeOSConnectionManager
 from ..managers.password_manager import PasswordManager
 from ..models import AlreadyExistsError, LoginError
 from ..models.config_data import ConfigData
@@ -210,6 +211,34 @@ class ConfigFlowManager:
             )
         ] = cv.positive_int
 
+        fields[
+            vol.Optional(
+                CONF_UPDATE_DEBOUNCE_INTERVAL,
+                default=config_data.update_debounce_interval,
+            )
+        ] = vol.All(
+            vol.Coerce(int),
+            vol.Range(
+                min=MINIMUM_UPDATE_DEBOUNCE_INTERVAL,
+                max=MAXIMUM_UPDATE_DEBOUNCE_INTERVAL,
+            ),
+        )
+
+        fields[
+            vol.Optional(
+                CONF_MAXIMUM_RECONNECT_INTERVAL,
+                default=config_data.maximum_reconnect_interval,
+            )
+        ] = vol.All(vol.Coerce(int), vol.Range(min=RECONNECT_INTERVAL))
+
+        fields[
+            vol.Optional(CONF_TIME_SERIES_DEPTH, default=config_data.time_series_depth)
+        ] = cv.positive_int
+
+        fields[
+            vol.Optional(CONF_TRAFFIC_SENSORS, default=config_data.traffic_sensors)
+        ] = bool
+
         fields[vol.Optional(CONF_STORE_DEBUG_FILE, default=False)] = bool
         fields[vol.Optional(CONF_LOG_LEVEL, default=config_data.log_level)] = vol.In(
             LOG_LEVELS
@@ -219,6 +248,17 @@ class ConfigFlowManager:
                 CONF_LOG_INCOMING_MESSAGES, default=config_data.log_incoming_messages
             )
         ] = bool
+        fields[
+            vol.Optional(
+                CONF_RECORD_INCOMING_MESSAGES,
+                default=config_data.record_incoming_messages,
+            )
+        ] = bool
+        fields[
+            vol.Optional(
+                CONF_DIAGNOSTICS_SENSOR, default=config_data.diagnostics_sensor
+            )
+        ] = bool
 
         data_schema = vol.Schema(fields)
 
@@ -381,8 +421,12 @@ class ConfigFlowManager:
 
         name = f"{DEFAULT_NAME} {self.title}"
 
+        connection_manager = EdgeOSConnectionManager(self._hass)
+
         try:
-            api = EdgeOSWebAPI(self._hass, self._config_manager)
+            api = EdgeOSWebAPI(
+                self._hass, self._config_manager, connection_manager=connection_manager
+            )
 
             await api.initialize()
 
@@ -437,5 +481,8 @@ class ConfigFlowManager:
 
             errors = {"base": "auth_general_error"}
 
+        finally:
+            await connection_manager.async_close()
+
         if errors is not None:
             raise LoginError(errors)
@@ -35,11 +35,25 @@ class ConfigManager:
         result.update_entities_interval = options.get(
             CONF_UPDATE_ENTITIES_INTERVAL, DEFAULT_UPDATE_ENTITIES_INTERVAL
         )
+        result.update_debounce_interval = options.get(
+            CONF_UPDATE_DEBOUNCE_INTERVAL, DEFAULT_UPDATE_DEBOUNCE_INTERVAL
+        )
         result.log_level = options.get(CONF_LOG_LEVEL, LOG_LEVEL_DEFAULT)
         result.log_incoming_messages = options.get(CONF_LOG_INCOMING_MESSAGES, False)
+        result.record_incoming_messages = options.get(
+            CONF_RECORD_INCOMING_MESSAGES, False
+        )
+        result.diagnostics_sensor = options.get(CONF_DIAGNOSTICS_SENSOR, False)
         result.consider_away_interval = options.get(
             CONF_CONSIDER_AWAY_INTERVAL, DEFAULT_CONSIDER_AWAY_INTERVAL
         )
+        result.maximum_reconnect_interval = options.get(
+            CONF_MAXIMUM_RECONNECT_INTERVAL, DEFAULT_MAXIMUM_RECONNECT_INTERVAL
+        )
+        result.time_series_depth = options.get(
+            CONF_TIME_SERIES_DEPTH, DEFAULT_TIME_SERIES_DEPTH
+        )
+        result.traffic_sensors = options.get(CONF_TRAFFIC_SENSORS, False)
 
         self.config_entry = config_entry
         self.data = result
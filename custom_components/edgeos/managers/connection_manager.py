@@ -0,0 +1,94 @@
+"""
+This component provides support for Home Automation Manager (HAM).
+For more details about this component, please refer to the documentation at
+https://home-assistant.io/components/edgeos/
+"""
+import logging
+from typing import Optional
+
+from aiohttp import ClientSession, CookieJar, TCPConnector, TraceConfig
+
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EdgeOSConnectionManager:
+    """
+    Single session of a router, shared by the REST and WS clients so
+    connections (and their TLS handshakes) are kept alive and reused instead
+    of a new session per client and reconnect, created by HA (its pooled
+    connector, user agent and close on stop).
+    """
+
+    def __init__(self, hass):
+        self._hass = hass
+        self._session: Optional[ClientSession] = None
+
+        self._sessions = 0
+        self._connections_created = 0
+        self._connections_reused = 0
+
+        self._trace_config = TraceConfig()
+        self._trace_config.on_connection_create_end.append(self._on_connection_create)
+        self._trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+
+    @property
+    def session(self) -> ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+
+        return self._session
+
+    @property
+    def statistics(self):
+        connections = self._connections_created + self._connections_reused
+
+        reuse_ratio = 0
+        if connections > 0:
+            reuse_ratio = round(self._connections_reused / connections, 3)
+
+        result = {
+            "sessions": self._sessions,
+            "connections_created": self._connections_created,
+            "connections_reused": self._connections_reused,
+            "reuse_ratio": reuse_ratio,
+        }
+
+        return result
+
+    def _create_session(self) -> ClientSession:
+        _LOGGER.debug("Creating session")
+
+        cookie_jar = CookieJar(unsafe=True)
+        trace_configs = [self._trace_config]
+
+        if self._hass is None:
+            session = ClientSession(
+                connector=TCPConnector(ssl=False),
+                cookie_jar=cookie_jar,
+                trace_configs=trace_configs,
+            )
+        else:
+            session = async_create_clientsession(
+                hass=self._hass,
+                verify_ssl=False,
+                cookie_jar=cookie_jar,
+                trace_configs=trace_configs,
+            )
+
+        self._sessions += 1
+
+        return session
+
+    async def async_close(self):
+        if self._session is not None:
+            await self._session.close()
+
+            self._session = None
+
+    async def _on_connection_create(self, session, context, params):
+        self._connections_created += 1
+
+    async def _on_connection_reuse(self, session, context, params):
+        self._connections_reused += 1
@@ -3,18 +3,30 @@ This component provides support for Home Automation Manager (HAM).
 For more details about this component, please refer to the documentation at
 https://home-assistant.io/components/edgeos/
 """
-from asyncio import sleep
+from asyncio import TimeoutError, gather, sleep, wait_for
 import logging
 import sys
-from typing import Optional
+from time import monotonic, time
+from typing import List, Optional
 
 from custom_components.edgeos.clients import SessionTerminatedException
 
 from ..clients.web_api import EdgeOSWebAPI
 from ..clients.web_socket import EdgeOSWebSocket
 from ..helpers.const import *
+from ..helpers.json_codec import json_codec
+from ..models.backoff import ExponentialBackoff
 from ..models.config_data import ConfigData
+from ..models.device_data import DeviceData
+from ..models.indexed_heap import IndexedHeap
+from ..models.interface_data import InterfaceData
+from ..models.rate_engine import RateEngine
+from ..models.time_series_store import TimeSeriesStore
+from ..models.traffic_aggregator import TrafficAggregator
 from .configuration_manager import ConfigManager
+from .connection_manager import EdgeOSConnectionManager
+from .storage_manager import StorageManager
+from .update_scheduler import UpdateScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,10 +37,17 @@ class EdgeOSData:
     edgeos_data: dict
     system_data: dict
 
-    def __init__(self, hass, config_manager: ConfigManager, update_home_assistant):
+    def __init__(
+        self,
+        hass,
+        config_manager: ConfigManager,
+        update_home_assistant,
+        storage_manager: Optional[StorageManager] = None,
+    ):
         self._hass = hass
         self._update_home_assistant = update_home_assistant
         self._config_manager = config_manager
+        self._storage_manager = storage_manager
 
         self._is_initialized = False
         self._is_updating = False
@@ -36,19 +55,63 @@ class EdgeOSData:
         self.edgeos_data = {}
         self.system_data = {}
 
+        self._changed_keys = {STATIC_DEVICES_KEY: set(), INTERFACES_KEY: set()}
+
+        self._devices_by_ip = {}
+        self._devices_by_mac = {}
+        self._connected_devices = set()
+
+        self._refresh_latency = {}
+        self._refresh_timeouts = 0
+        self._skipped_refreshes = 0
+        self._reconnects = 0
+
+        self._reconnect_backoff = ExponentialBackoff(
+            RECONNECT_INTERVAL, DEFAULT_MAXIMUM_RECONNECT_INTERVAL
+        )
+
+        self._rate_engines = {
+            key: RateEngine(RATE_WRAPPING_COUNTERS[key]) for key in TIME_SERIES_FIELDS
+        }
+        self._traffic = TrafficAggregator()
+        self._talkers = IndexedHeap(TRAFFIC_SOURCES_REBUILD_RATIO)
+        self._uptime = None
+
+        self._time_series = {
+            key: TimeSeriesStore(fields) for key, fields in TIME_SERIES_FIELDS.items()
+        }
+
         self._ws_handlers = self.get_ws_handlers()
+        self._ws_prepared_handlers = self.get_ws_prepared_handlers()
 
         config_data = self._config_manager.data
 
-        topics = self._ws_handlers.keys()
+        topics = self.get_required_topics()
 
         self.hostname = config_data.host
         self.version = "N/A"
 
-        self._ws = EdgeOSWebSocket(self._hass, config_manager, topics, self.ws_handler)
+        self._connection_manager = EdgeOSConnectionManager(self._hass)
+
+        self._ws = EdgeOSWebSocket(
+            self._hass,
+            config_manager,
+            topics,
+            self.ws_handler,
+            self.prepare_ws_payload,
+            self._connection_manager,
+        )
 
         self._api = EdgeOSWebAPI(
-            self._hass, config_manager, self.edgeos_disconnection_handler, self._ws
+            self._hass,
+            config_manager,
+            self.edgeos_disconnection_handler,
+            self._ws,
+            self._connection_manager,
+        )
+
+        self._update_scheduler = UpdateScheduler(
+            self._hass, config_manager, self.update
         )
 
         self._is_active = True
@@ -57,6 +120,55 @@ class EdgeOSData:
     def product(self):
         return self._api.product
 
+    @property
+    def ws_statistics(self):
+        return self._ws.statistics
+
+    @property
+    def update_statistics(self):
+        return self._update_scheduler.statistics
+
+    @property
+    def refresh_statistics(self):
+        result = {
+            "latency": dict(self._refresh_latency),
+            "timeouts": self._refresh_timeouts,
+            "skipped": self._skipped_refreshes,
+        }
+
+        return result
+
+    @property
+    def api_statistics(self):
+        return self._api.statistics
+
+    @property
+    def traffic_statistics(self):
+        result = {**self._traffic.statistics, TRAFFIC_SOURCES: len(self._talkers)}
+
+        return result
+
+    @property
+    def statistics(self):
+        result = {
+            "ws": self.ws_statistics,
+            "api": self.api_statistics,
+            "refresh": self.refresh_statistics,
+            "updates": self.update_statistics,
+            "connections": self._connection_manager.statistics,
+            "reconnects": self._reconnects,
+            "reconnect_backoff": self._reconnect_backoff.to_dict(),
+            "rates": {
+                key: engine.statistics for key, engine in self._rate_engines.items()
+            },
+            "time_series": {
+                key: store.statistics for key, store in self._time_series.items()
+            },
+            "traffic": self.traffic_statistics,
+        }
+
+        return result
+
     @property
     def config_data(self) -> Optional[ConfigData]:
         if self._config_manager is not None:
@@ -78,12 +190,21 @@ class EdgeOSData:
                 else:
                     slept = False
 
+                    backoff = self._reconnect_backoff
+                    backoff.maximum = self.config_data.maximum_reconnect_interval
+
+                    delay = backoff.next_delay()
+
+                    self._reconnects += 1
+
                     try:
                         _LOGGER.debug(
-                            f"Sleeping {RECONNECT_INTERVAL} seconds until next reconnect attempt"
+                            "Sleeping %.1f seconds until reconnect attempt #%s",
+                            delay,
+                            self._reconnects,
                         )
 
-                        await sleep(RECONNECT_INTERVAL)
+                        await sleep(delay)
                         slept = True
 
                     finally:
@@ -106,11 +227,13 @@ class EdgeOSData:
 
     async def _initialize(self, post_login_action=None):
         try:
-            _LOGGER.debug(f"Initializing API")
+            _LOGGER.debug("Initializing API")
             await self._api.initialize()
 
-            if await self._api.login():
-                _LOGGER.debug(f"Requesting initial data")
+            if await self._async_login():
+                self._reconnect_backoff.reset()
+
+                _LOGGER.debug("Requesting initial data")
                 await self.refresh()
 
                 if post_login_action is not None:
@@ -119,7 +242,9 @@ class EdgeOSData:
                 cookies = self._api.cookies_data
                 session_id = self._api.session_id
 
-                _LOGGER.debug(f"Initializing WS using session: {session_id}")
+                await self.async_update_topics()
+
+                _LOGGER.debug("Initializing WS using session: %s", session_id)
                 await self._ws.initialize(cookies, session_id)
         except SessionTerminatedException as stex:
             _LOGGER.info(f"Session terminated ({stex})")
@@ -134,12 +259,32 @@ class EdgeOSData:
                 f"Failed to initialize EdgeOS Manager, Error: {str(ex)}, Line: {line_number}"
             )
 
+    async def _async_login(self):
+        """Restores the stored session of the host, logs in when rejected."""
+        if self._storage_manager is None:
+            return await self._api.login()
+
+        host = self.config_data.host
+
+        stored_session = await self._storage_manager.async_load_session(host)
+
+        if await self._api.async_restore_session(stored_session):
+            return True
+
+        logged_in = await self._api.login()
+
+        stored_session = self._api.stored_session if logged_in else None
+
+        await self._storage_manager.async_save_session(host, stored_session)
+
+        return logged_in
+
     @property
     def is_initialized(self):
         return self._is_initialized
 
     async def edgeos_disconnection_handler(self):
-        _LOGGER.debug(f"Disconnection detected, reconnecting...")
+        _LOGGER.debug("Disconnection detected, reconnecting...")
 
         await self.terminate()
 
@@ -147,13 +292,15 @@ class EdgeOSData:
 
     async def terminate(self):
         try:
-            _LOGGER.debug(f"Terminating WS")
+            _LOGGER.debug("Terminating WS")
 
             self._is_active = False
 
+            self._update_scheduler.cancel()
+
             await self._ws.close()
 
-            _LOGGER.debug(f"WS terminated")
+            _LOGGER.debug("WS terminated")
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
@@ -162,6 +309,10 @@ class EdgeOSData:
                 f"Failed to terminate connection to WS, Error: {ex}, Line: {line_number}"
             )
 
+    async def async_close_connections(self):
+        """Closes the pooled session, terminate keeps it for reconnecting."""
+        await self._connection_manager.async_close()
+
     async def async_send_heartbeat(self):
         if not self._api.is_initialized:
             self.disconnect()
@@ -171,32 +322,122 @@ class EdgeOSData:
         if result:
             await self._ws.async_send_heartbeat()
 
+    @property
+    def ws_age(self) -> Optional[float]:
+        """Seconds since the last WS message, None while WS is not connected."""
+        if not self._ws.is_connected:
+            return None
+
+        ws_age = (datetime.now() - self._ws.last_update).total_seconds()
+
+        return ws_age
+
     async def refresh(self):
+        await self._async_run_refresh(self._async_refresh)
+
+    async def refresh_unknown_devices(self):
+        """Requests only dhcp-leases, between full refreshes while WS is live."""
+        await self._async_run_refresh(self._async_refresh_unknown_devices)
+
+    async def _async_run_refresh(self, refresh):
+        if self._is_updating:
+            self._skipped_refreshes += 1
+
+            _LOGGER.debug("Refresh skipped, previous refresh is still running")
+
+            return
+
+        self._is_updating = True
+
+        try:
+            await refresh()
+
+        finally:
+            self._is_updating = False
+
+    async def _async_refresh_unknown_devices(self):
+        try:
+            if not self._api.is_initialized or self._api.is_router_down:
+                return
+
+            _LOGGER.debug("Getting unknown devices by API")
+
+            unknown_devices_data = await self._async_timed_request(
+                DHCP_LEASES_KEY, self._api.get_general_data(DHCP_LEASES_KEY)
+            )
+
+            if unknown_devices_data is not None:
+                self.load_unknown_devices(unknown_devices_data)
+
+                self._update_scheduler.flush()
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(
+                f"Failed to load unknown devices data, Error: {ex}, Line: {line_number}"
+            )
+
+    async def _async_refresh(self):
         try:
             if not self._api.is_initialized:
                 self.disconnect()
 
                 return
 
+            if self._api.is_router_down:
+                _LOGGER.debug("Router is down, probing it by heartbeat")
+
+                if not await self._api.async_send_heartbeat(0):
+                    self._skipped_refreshes += 1
+
+                    return
+
             _LOGGER.debug("Getting devices by API")
 
-            devices_data = await self._api.get_devices_data()
+            started = monotonic()
 
-            if devices_data is not None:
-                system_info_data = await self._api.get_general_data(SYS_INFO_KEY)
+            requests = [
+                self._async_timed_request(EDGEOS_API_GET, self._api.get_devices_data()),
+                self._async_timed_request(
+                    SYS_INFO_KEY, self._api.get_general_data(SYS_INFO_KEY)
+                ),
+                self._async_timed_request(
+                    DHCP_LEASES_KEY, self._api.get_general_data(DHCP_LEASES_KEY)
+                ),
+            ]
+
+            try:
+                results = await wait_for(gather(*requests), REFRESH_TIMEOUT)
+
+            except TimeoutError:
+                self._refresh_timeouts += 1
+
+                _LOGGER.warning(
+                    f"Getting devices by API exceeded {REFRESH_TIMEOUT} seconds"
+                )
+
+                return
 
+            finally:
+                self._refresh_latency[ATTR_TOTAL] = monotonic() - started
+
+                _LOGGER.debug("Refresh latency (seconds): %s", self._refresh_latency)
+
+            devices_data, system_info_data, unknown_devices_data = results
+
+            if devices_data is not None:
                 if system_info_data is not None:
                     self.load_system_data(devices_data, system_info_data)
 
                 self.load_devices(devices_data)
                 self.load_interfaces(devices_data)
 
-                unknown_devices_data = await self._api.get_general_data(DHCP_LEASES_KEY)
-
                 if unknown_devices_data is not None:
                     self.load_unknown_devices(unknown_devices_data)
 
-            self.update()
+            self._update_scheduler.flush()
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -206,6 +447,17 @@ class EdgeOSData:
                 f"Failed to load devices data, Error: {ex}, Line: {line_number}"
             )
 
+    async def _async_timed_request(self, key, request):
+        started = monotonic()
+
+        try:
+            result = await request
+
+        finally:
+            self._refresh_latency[key] = monotonic() - started
+
+        return result
+
     def update(self):
         try:
             devices = self.get_devices()
@@ -237,21 +489,37 @@ class EdgeOSData:
 
             _LOGGER.error(f"Failed to refresh data, Error: {ex}, Line: {line_number}")
 
-    def ws_handler(self, payload=None):
+    def prepare_ws_payload(self, content: bytes) -> dict:
+        """
+        Decode WS payload and transform data of topics that have a prepared
+        handler, doesn't change any state so it can run in the executor.
+        """
+        payload = json_codec.loads(content)
+
+        for key, (prepare, _) in self._ws_prepared_handlers.items():
+            if key in payload:
+                payload[key] = prepare(payload[key])
+
+        return payload
+
+    def ws_handler(self, payload=None, prepared=False):
         try:
             if payload is not None:
                 for key in payload:
-                    _LOGGER.debug(f"Running parser of {key}")
+                    _LOGGER.debug("Running parser of %s", key)
 
                     data = payload.get(key)
                     handler = self._ws_handlers.get(key)
 
+                    if prepared and key in self._ws_prepared_handlers:
+                        _, handler = self._ws_prepared_handlers[key]
+
                     if handler is None:
                         _LOGGER.error(f"Handler not found for {key}")
                     else:
                         handler(data)
 
-                        self.update()
+                        self._update_scheduler.mark_dirty(key)
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
@@ -270,6 +538,45 @@ class EdgeOSData:
 
         return ws_handlers
 
+    def get_required_topics(self) -> list:
+        """WS topics used by the monitored / tracked devices and interfaces."""
+        config_data = self.config_data
+
+        topics = [SYSTEM_STATS_KEY, DISCOVER_KEY]
+
+        if len(config_data.monitored_interfaces) > 0:
+            topics.append(INTERFACES_KEY)
+
+        devices = config_data.monitored_devices + config_data.device_trackers
+
+        if len(devices) > 0 or config_data.traffic_sensors:
+            topics.append(EXPORT_KEY)
+
+        return topics
+
+    def retain_monitored(self):
+        """Drops rates and time series of items no longer monitored."""
+        monitored = {
+            INTERFACES_KEY: self.config_data.monitored_interfaces,
+            STATIC_DEVICES_KEY: self.config_data.monitored_devices,
+        }
+
+        for key, names in monitored.items():
+            self._rate_engines[key].retain(names)
+            self._time_series[key].retain(names)
+
+        if not self.config_data.traffic_sensors:
+            self._traffic.clear()
+
+    async def async_update_topics(self):
+        await self._ws.async_update_topics(self.get_required_topics())
+
+    def get_ws_prepared_handlers(self):
+        """Topics handled in 2 steps, transformation (executor safe) and apply."""
+        ws_prepared_handlers = {EXPORT_KEY: (self.parse_export, self.apply_export)}
+
+        return ws_prepared_handlers
+
     def load_unknown_devices(self, unknown_devices_data):
         try:
             if unknown_devices_data is not None:
@@ -284,12 +591,16 @@ class EdgeOSData:
 
                     for ip in interface_info:
                         device_info = interface_info[ip]
+                        mac = device_info.get("mac")
+
+                        if self.get_hostname_by_mac(mac) is not None:
+                            continue
 
                         device = {
                             "ip": ip,
                             "expiration": device_info.get("expiration"),
                             "pool": device_info.get("pool"),
-                            "mac": device_info.get("mac"),
+                            "mac": mac,
                             "client-hostname": device_info.get("client-hostname"),
                         }
 
@@ -309,6 +620,13 @@ class EdgeOSData:
         if device_data is None:
             return
 
+        self.apply_static_devices(self.parse_static_devices(device_data))
+
+    @staticmethod
+    def parse_static_devices(device_data) -> dict:
+        """Static mappings of the config by hostname."""
+        devices = {}
+
         service_data = device_data.get(SERVICE, {})
         dhcp_server_data = service_data.get(DHCP_SERVER, {})
         shared_network_data = dhcp_server_data.get(SHARED_NETWORK_NAME, {})
@@ -321,8 +639,6 @@ class EdgeOSData:
 
                 static_mapping_data = subnet_item.get(STATIC_MAPPING, {})
                 for hostname in static_mapping_data:
-                    device = self.get_device(hostname)
-
                     static_mapping_item = static_mapping_data[hostname]
                     ip = static_mapping_item.get(IP_ADDRESS)
                     mac = static_mapping_item.get(MAC_ADDRESS)
@@ -331,13 +647,30 @@ class EdgeOSData:
                     if ip is not None:
                         name = f"{hostname} ({ip})"
 
-                    device[IP] = ip
-                    device[MAC] = mac
-                    device[ATTR_NAME] = name
+                    devices[hostname] = {IP: ip, MAC: mac, ATTR_NAME: name}
+
+        return devices
+
+    def apply_static_devices(self, devices: dict):
+        devices_by_ip = {}
+        devices_by_mac = {}
+
+        for hostname, device in devices.items():
+            ip = device[IP]
+            mac = device[MAC]
+
+            if ip is not None:
+                devices_by_ip[ip] = hostname
 
-                    self.check_last_activity(device)
+            if mac is not None:
+                devices_by_mac[mac.lower()] = hostname
 
-                    self.set_device(hostname, device)
+            self.set_device(hostname, device)
+
+            self.check_last_activity(self.get_device(hostname))
+
+        self._devices_by_ip = devices_by_ip
+        self._devices_by_mac = devices_by_mac
 
     def load_interfaces(self, device_data):
         if device_data is None:
@@ -369,12 +702,14 @@ class EdgeOSData:
 
     def handle_interfaces(self, data):
         try:
-            _LOGGER.debug(f"Handle {INTERFACES_KEY} data")
+            _LOGGER.debug("Handle %s data", INTERFACES_KEY)
 
             if data is None or data == "":
-                _LOGGER.debug(f"{INTERFACES_KEY} is empty")
+                _LOGGER.debug("%s is empty", INTERFACES_KEY)
                 return
 
+            monitored_interfaces = self.config_data.monitored_interfaces
+
             for name in data:
                 interface_data = data.get(name)
 
@@ -394,7 +729,15 @@ class EdgeOSData:
                         if item in INTERFACES_MAIN_MAP:
                             interface[item] = item_data
 
+                is_monitored = name in monitored_interfaces
+
+                if is_monitored:
+                    self.update_rates(INTERFACES_KEY, name, interface)
+
                 self.set_interface(name, interface)
+
+                if is_monitored:
+                    self.record_time_series(INTERFACES_KEY, name, interface)
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
@@ -403,14 +746,58 @@ class EdgeOSData:
                 f"Failed to load {INTERFACES_KEY}, Error: {ex}, Line: {line_number}"
             )
 
+    def update_rates(self, key, name, values: dict):
+        """Adds rates derived from the byte counters to values."""
+        rates = self._rate_engines[key].update(name, monotonic(), values)
+
+        values.update(rates)
+
+    def check_reboot(self, system_state: dict):
+        """Uptime going backwards means the router rebooted, counters reset."""
+        try:
+            uptime = int(system_state.get(UPTIME))
+        except (TypeError, ValueError):
+            return
+
+        if self._uptime is not None and uptime < self._uptime:
+            _LOGGER.info(
+                f"Router rebooted (uptime {uptime}s, was {self._uptime}s), "
+                "resetting rates"
+            )
+
+            for engine in self._rate_engines.values():
+                engine.reboot()
+
+        self._uptime = uptime
+
+    def record_time_series(self, key, name, values):
+        depth = self.config_data.time_series_depth
+
+        if depth == 0:
+            return
+
+        store = self._time_series[key]
+        store.resize(depth)
+        store.record(name, time(), values)
+
+    def query_time_series(
+        self, key, name, field, window, percentiles=None
+    ) -> Optional[dict]:
+        """Statistics of field in the last window seconds, None when unknown."""
+        store = self._time_series[key]
+
+        return store.query(name, field, time() - window, percentiles)
+
     def handle_system_stats(self, data):
         try:
-            _LOGGER.debug(f"Handle {SYSTEM_STATS_KEY} data")
+            _LOGGER.debug("Handle %s data", SYSTEM_STATS_KEY)
 
             if data is None or data == "":
-                _LOGGER.debug(f"{SYSTEM_STATS_KEY} is empty")
+                _LOGGER.debug("%s is empty", SYSTEM_STATS_KEY)
                 return
 
+            self.check_reboot(data)
+
             self.set_system_state(data)
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -422,12 +809,12 @@ class EdgeOSData:
 
     def handle_discover(self, data):
         try:
-            _LOGGER.debug(f"Handle {DISCOVER_KEY} data")
+            _LOGGER.debug("Handle %s data", DISCOVER_KEY)
 
             result = self.get_discover_data()
 
             if data is None or data == "":
-                _LOGGER.debug(f"{DISCOVER_KEY} is empty")
+                _LOGGER.debug("%s is empty", DISCOVER_KEY)
                 return
 
             devices_data = data.get(DEVICE_LIST, [])
@@ -458,10 +845,10 @@ class EdgeOSData:
                 f"Failed to load {DISCOVER_KEY}, Original Message: {data}, Error: {ex}, Line: {line_number}"
             )
 
-    def check_last_activity(self, device):
+    def check_last_activity(self, device: DeviceData):
         date_minimum = datetime.fromtimestamp(0)
-        device_ip = device.get(IP)
-        device_connected = device.get(CONNECTED, False)
+        device_ip = device.ip
+        device_connected = device.connected
         device_last_activity = device.get(LAST_ACTIVITY, date_minimum)
 
         is_connected = False
@@ -475,57 +862,78 @@ class EdgeOSData:
                 device_connected != is_connected
                 and device_last_activity != date_minimum
             ):
-                msg = [
-                    f"Device {device_ip} disconnected",
-                    f"due to inactivity since {device_last_activity}",
-                    f"({time_since_last_action} seconds)",
-                ]
-
-                _LOGGER.info(" ".join(msg))
+                _LOGGER.info(
+                    "Device %s disconnected due to inactivity since %s (%s seconds)",
+                    device_ip,
+                    device_last_activity,
+                    time_since_last_action,
+                )
 
-        device[CONNECTED] = is_connected
+        self.set_device(device.hostname, {CONNECTED: is_connected})
 
     def handle_export(self, data):
+        self.apply_export(self.parse_export(data))
+
+    def parse_export(self, data):
+        """
+        Traffic of known devices by hostname and DPI traffic per service when
+        traffic sensors are enabled, reads only the IP index (replaced as a
+        whole on refresh) so it can run in the executor.
+        """
+        if data is None or data == "":
+            return None
+
+        devices = {}
+
+        for device_ip in data:
+            hostname = self._devices_by_ip.get(device_ip)
+
+            if hostname is not None:
+                devices[hostname] = self.get_device_export_values(data.get(device_ip))
+
+        traffic = None
+
+        if self.config_data.traffic_sensors:
+            traffic = TrafficAggregator.parse(data)
+
+        return devices, traffic
+
+    def apply_export(self, export):
         try:
-            _LOGGER.debug(f"Handle {EXPORT_KEY} data")
+            _LOGGER.debug("Handle %s data", EXPORT_KEY)
 
-            if data is None or data == "":
-                _LOGGER.debug(f"{EXPORT_KEY} is empty")
+            if export is None:
+                _LOGGER.debug("%s is empty", EXPORT_KEY)
                 return
 
-            all_devices = self.get_devices().keys()
+            devices, traffic = export
 
-            for hostname in all_devices:
-                device = self.get_device(hostname)
-                device_ip = device.get(IP)
-                device_data = data.get(device_ip)
+            if traffic is not None:
+                self._traffic.apply(traffic)
 
-                if device_data is not None:
-                    traffic: dict = {}
+            monitored_devices = self.config_data.monitored_devices
 
-                    for item in DEVICE_SERVICES_STATS_MAP:
-                        traffic[item] = int(0)
+            if self.config_data.traffic_sensors:
+                self.update_talkers(devices)
 
-                    for service in device_data:
-                        service_data = device_data.get(service, {})
-                        for item in service_data:
-                            current_value = traffic.get(item, 0)
-                            service_data_item_value = 0
+            elif len(self._talkers) > 0:
+                self._talkers.clear()
 
-                            if item in service_data and service_data[item] != "":
-                                service_data_item_value = int(service_data[item])
+            for hostname, device in devices.items():
+                is_monitored = hostname in monitored_devices
 
-                            if "x_rate" in item and current_value > 0:
-                                device[LAST_ACTIVITY] = datetime.now()
+                if is_monitored:
+                    self.update_rates(STATIC_DEVICES_KEY, hostname, device)
 
-                            traffic_value = current_value + service_data_item_value
+                self.set_device(hostname, device)
 
-                            traffic[item] = traffic_value
-                            device[item] = traffic_value
+                self.check_last_activity(self.get_device(hostname))
 
-                self.check_last_activity(device)
+                if is_monitored:
+                    self.record_time_series(STATIC_DEVICES_KEY, hostname, device)
 
-                self.set_device(hostname, device)
+            for hostname in self._connected_devices - devices.keys():
+                self.check_last_activity(self.get_device(hostname))
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -535,6 +943,82 @@ class EdgeOSData:
                 f"Failed to load {EXPORT_KEY}, Error: {ex}, Line: {line_number}"
             )
 
+    def update_talkers(self, devices: dict):
+        """
+        Ranks devices with traffic by their rate (received + sent), only the
+        rates changed since the previous export are pushed into the heap.
+        """
+        talkers = self._talkers
+
+        removed = talkers.keys() - devices.keys()
+        changed = {}
+
+        for hostname, device in devices.items():
+            rate = device.get("rx_rate", 0) + device.get("tx_rate", 0)
+            previous_rate = talkers.get(hostname)
+
+            if rate > 0:
+                if rate != previous_rate:
+                    changed[hostname] = rate
+
+            elif previous_rate is not None:
+                removed.add(hostname)
+
+        talkers.update_many(changed, removed)
+
+    def get_top_talkers(self, count: int) -> List[dict]:
+        result = []
+
+        for hostname, _ in self._talkers.top(count):
+            device = self.get_device(hostname)
+
+            talker = {ATTR_NAME: hostname, IP: device.ip}
+
+            for field in TRAFFIC_FIELDS:
+                talker[field] = device.get(field, 0)
+
+            result.append(talker)
+
+        return result
+
+    def get_traffic(self, kind: str, count: int) -> List[dict]:
+        """Top count applications / categories / talkers by traffic rate."""
+        if kind == TRAFFIC_SOURCES:
+            return self.get_top_talkers(count)
+
+        return self._traffic.get_top(kind, count)
+
+    @staticmethod
+    def get_device_export_values(device_data) -> dict:
+        device = {}
+
+        if device_data is not None:
+            traffic: dict = {}
+
+            for item in DEVICE_SERVICES_STATS_MAP:
+                traffic[item] = int(0)
+
+            for service in device_data:
+                service_data = device_data.get(service, {})
+                for item in service_data:
+                    if item not in traffic:
+                        continue
+
+                    current_value = traffic.get(item, 0)
+                    service_data_item_value = 0
+
+                    if service_data[item] != "":
+                        service_data_item_value = int(service_data[item])
+
+                    if "x_rate" in item and current_value > 0:
+                        device[LAST_ACTIVITY] = datetime.now()
+
+                    traffic[item] = current_value + service_data_item_value
+
+            device.update(traffic)
+
+        return device
+
     def _get_edgeos_data(self, key):
         if key not in self.edgeos_data:
             self.edgeos_data[key] = {}
@@ -570,25 +1054,36 @@ class EdgeOSData:
 
         return result
 
-    def set_interface(self, name, interface):
+    def pop_changed_keys(self):
+        """Return keys of devices / interfaces changed since previous call."""
+        changed_keys = self._changed_keys
+
+        self._changed_keys = {STATIC_DEVICES_KEY: set(), INTERFACES_KEY: set()}
+
+        return changed_keys
+
+    def set_interface(self, name, interface: dict):
         all_interfaces = self.get_interfaces()
 
-        if name not in all_interfaces:
-            all_interfaces[name] = {}
+        current_interface = all_interfaces.get(name)
+
+        if current_interface is None:
+            current_interface = InterfaceData()
+            all_interfaces[name] = current_interface
 
-        current_interface = all_interfaces[name]
+            self._changed_keys[INTERFACES_KEY].add(name)
 
-        for key in interface:
-            current_interface[key] = interface[key]
+        if current_interface.update(interface):
+            self._changed_keys[INTERFACES_KEY].add(name)
 
     def get_interfaces(self):
         result = self._get_edgeos_data(INTERFACES_KEY)
 
         return result
 
-    def get_interface(self, name):
+    def get_interface(self, name) -> Optional[InterfaceData]:
         interfaces = self.get_interfaces()
-        interface = interfaces.get(name, {})
+        interface = interfaces.get(name)
 
         return interface
 
@@ -597,21 +1092,29 @@ class EdgeOSData:
 
         return result
 
-    def set_device(self, hostname, device):
+    def set_device(self, hostname, device: dict):
         all_devices = self.get_devices()
 
         if hostname is not None:
-            if hostname not in all_devices:
-                all_devices[hostname] = {}
+            current_device = all_devices.get(hostname)
 
-            current_device = all_devices[hostname]
+            if current_device is None:
+                current_device = DeviceData(hostname)
+                all_devices[hostname] = current_device
 
-            for key in device:
-                current_device[key] = device[key]
+                self._changed_keys[STATIC_DEVICES_KEY].add(hostname)
 
-    def get_device(self, hostname):
+            if current_device.update(device):
+                self._changed_keys[STATIC_DEVICES_KEY].add(hostname)
+
+            if current_device.connected:
+                self._connected_devices.add(hostname)
+            else:
+                self._connected_devices.discard(hostname)
+
+    def get_device(self, hostname) -> Optional[DeviceData]:
         devices = self.get_devices()
-        device = devices.get(hostname, {})
+        device = devices.get(hostname)
 
         return device
 
@@ -624,13 +1127,24 @@ class EdgeOSData:
     def get_device_mac(self, hostname):
         device = self.get_device(hostname)
 
-        mac = device.get(MAC)
+        mac = None if device is None else device.mac
 
         return mac
 
-    def is_device_online(self, hostname) -> bool:
-        device = self.get_device(hostname)
+    def get_hostname_by_ip(self, ip) -> Optional[str]:
+        hostname = self._devices_by_ip.get(ip)
+
+        return hostname
+
+    def get_hostname_by_mac(self, mac) -> Optional[str]:
+        hostname = None
 
-        connected = device.get(CONNECTED, False)
+        if mac is not None:
+            hostname = self._devices_by_mac.get(mac.lower())
+
+        return hostname
+
+    def is_device_online(self, hostname) -> bool:
+        connected = hostname in self._connected_devices
 
         return connected
@@ -1,5 +1,6 @@
 import logging
 import sys
+from time import perf_counter
 from typing import Dict, List, Optional
 
 from homeassistant.components.device_tracker import ATTR_SOURCE_TYPE, SOURCE_TYPE_ROUTER
@@ -11,6 +12,7 @@ from ..helpers.const import *
 from ..managers.data_manager import EdgeOSData
 from ..models.config_data import ConfigData
 from ..models.entity_data import EntityData
+from ..models.latency_histogram import LatencyHistogram
 from .configuration_manager import ConfigManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,6 +30,15 @@ class EntityManager:
         self.domain_component_manager = {}
         self.entities = {}
 
+        self._full_rebuild_required = True
+        self._processed_entities = set()
+        self._pending_updates = {}
+
+        self.state_writes = {}
+        self.suppressed_state_writes = {}
+
+        self._rebuild_latency = LatencyHistogram()
+
     @property
     def entity_registry(self) -> EntityRegistry:
         return self.ha.entity_registry
@@ -107,19 +118,70 @@ class EntityManager:
                 ex, f"Failed to set_entity, domain: {domain}, name: {name}"
             )
 
-    def create_components(self):
+    @property
+    def state_write_statistics(self):
+        result = {
+            "written": dict(self.state_writes),
+            "suppressed": dict(self.suppressed_state_writes),
+        }
+
+        return result
+
+    @property
+    def statistics(self):
+        result = {
+            "entities": len(self.get_all_entities()),
+            "rebuild_latency": self._rebuild_latency.to_dict(),
+            "state_writes": self.state_write_statistics,
+        }
+
+        return result
+
+    def count_state_write(self, domain, suppressed: bool):
+        counters = self.suppressed_state_writes if suppressed else self.state_writes
+
+        counters[domain] = counters.get(domain, 0) + 1
+
+    def pop_pending_updates(self) -> List[EntityData]:
+        """Return entities modified since previous call, marks them as ready."""
+        pending_updates = self._pending_updates
+
+        self._pending_updates = {}
+
+        for entity in pending_updates.values():
+            entity.status = ENTITY_STATUS_READY
+
+        return list(pending_updates.values())
+
+    def request_full_rebuild(self):
+        self._full_rebuild_required = True
+
+    def create_components(self, full_rebuild: bool = True):
         system_state = self.system_data.get(SYSTEM_STATS_KEY)
         api_last_update = self.system_data.get(ATTR_API_LAST_UPDATE)
         web_socket_last_update = self.system_data.get(ATTR_WEB_SOCKET_LAST_UPDATE)
 
-        self.create_interface_binary_sensors()
-        self.create_device_binary_sensors()
-        self.create_device_trackers()
+        changed_keys = self.data_manager.pop_changed_keys()
+
+        self._processed_entities = set()
+
+        changed_interfaces = None
+        changed_devices = None
+
+        if not full_rebuild:
+            changed_interfaces = changed_keys.get(INTERFACES_KEY)
+            changed_devices = changed_keys.get(STATIC_DEVICES_KEY)
+
+        self.create_interface_binary_sensors(changed_interfaces)
+        self.create_device_binary_sensors(changed_devices)
+        self.create_device_trackers(changed_devices)
         self.create_unknown_devices_sensor()
         self.create_uptime_sensor(system_state, api_last_update, web_socket_last_update)
         self.create_system_status_binary_sensor(
             system_state, api_last_update, web_socket_last_update
         )
+        self.create_diagnostics_sensor()
+        self.create_traffic_sensors()
 
     def update(self):
         self.hass.async_create_task(self._async_update())
@@ -127,14 +189,23 @@ class EntityManager:
     async def _async_update(self):
         step = "Mark as ignore"
         try:
-            entities_to_delete = []
-
-            for entity in self.get_all_entities():
-                entities_to_delete.append(entity.unique_id)
+            full_rebuild = self._full_rebuild_required
+            self._full_rebuild_required = False
 
             step = "Create components"
 
-            self.create_components()
+            started = perf_counter()
+
+            self.create_components(full_rebuild)
+
+            self._rebuild_latency.observe(perf_counter() - started)
+
+            entities_to_delete = []
+
+            if full_rebuild:
+                for entity in self.get_all_entities():
+                    if entity.unique_id not in self._processed_entities:
+                        entities_to_delete.append(entity.unique_id)
 
             step = "Start updating"
 
@@ -160,9 +231,6 @@ class EntityManager:
                     if entity.status == ENTITY_STATUS_CREATED:
                         entity_item = self.entity_registry.async_get(entity_id)
 
-                        if entity.unique_id in entities_to_delete:
-                            entities_to_delete.remove(entity.unique_id)
-
                         step = f"Mark as created - {domain} -> {entity_key}"
 
                         entity_component = domain_component(
@@ -189,6 +257,8 @@ class EntityManager:
                             if restored:
                                 if entity_item is None or not entity_item.disabled:
                                     entities_to_add.append(entity_component)
+                            else:
+                                self._pending_updates[entity.unique_id] = entity
                         else:
                             entities_to_add.append(entity_component)
 
@@ -216,11 +286,14 @@ class EntityManager:
         except Exception as ex:
             self.log_exception(ex, f"Failed to update, step: {step}")
 
-    def create_device_trackers(self):
+    def create_device_trackers(self, hostnames=None):
         try:
             devices = self.system_data.get(STATIC_DEVICES_KEY)
 
-            for hostname in devices:
+            if hostnames is None:
+                hostnames = devices
+
+            for hostname in hostnames:
                 host_data = devices.get(hostname, {})
 
                 self.create_device_tracker(hostname, host_data)
@@ -228,11 +301,14 @@ class EntityManager:
         except Exception as ex:
             self.log_exception(ex, "Failed to updated device trackers")
 
-    def create_device_binary_sensors(self):
+    def create_device_binary_sensors(self, hostnames=None):
         try:
             devices = self.system_data.get(STATIC_DEVICES_KEY)
 
-            for hostname in devices:
+            if hostnames is None:
+                hostnames = devices
+
+            for hostname in hostnames:
                 host_data = devices.get(hostname, {})
 
                 self.create_device_binary_sensor(hostname, host_data)
@@ -240,12 +316,15 @@ class EntityManager:
         except Exception as ex:
             self.log_exception(ex, "Failed to updated devices")
 
-    def create_interface_binary_sensors(self):
+    def create_interface_binary_sensors(self, names=None):
         try:
             interfaces = self.system_data.get(INTERFACES_KEY)
 
-            for interface in interfaces:
-                interface_data = interfaces.get(interface)
+            if names is None:
+                names = interfaces
+
+            for interface in names:
+                interface_data = interfaces.get(interface, {})
 
                 self.create_interface_binary_sensor(interface, interface_data)
 
@@ -260,6 +339,7 @@ class EntityManager:
             SENSOR_TYPE_INTERFACE,
             LINK_UP,
             self.get_interface_attributes,
+            INTERFACES_KEY,
         )
 
     def create_device_binary_sensor(self, key, data):
@@ -270,10 +350,18 @@ class EntityManager:
             SENSOR_TYPE_DEVICE,
             CONNECTED,
             self.get_device_attributes,
+            STATIC_DEVICES_KEY,
         )
 
     def create_binary_sensor(
-        self, key, data, allowed_items, sensor_type, main_attribute, get_attributes
+        self,
+        key,
+        data,
+        allowed_items,
+        sensor_type,
+        main_attribute,
+        get_attributes,
+        time_series_key,
     ):
         try:
             if key in allowed_items:
@@ -286,9 +374,10 @@ class EntityManager:
                     ATTR_FRIENDLY_NAME: entity_name,
                 }
 
-                for data_item_key in data:
+                time_series_fields = TIME_SERIES_SENSOR_FIELDS[time_series_key]
+
+                for data_item_key, value in data.items():
                     if data_item_key != main_attribute:
-                        value = data.get(data_item_key)
                         attr = get_attributes(data_item_key)
 
                         name = attr.get(ATTR_NAME, data_item_key)
@@ -301,19 +390,26 @@ class EntityManager:
 
                             attributes[name] = (int(value)) / self.config_data.unit_size
 
+                            if data_item_key in time_series_fields:
+                                self.add_time_series_attributes(
+                                    attributes,
+                                    time_series_key,
+                                    key,
+                                    data_item_key,
+                                    name,
+                                )
+
                 is_on = str(main_entity_details).lower() == TRUE_STR
 
                 current_entity = self.get_entity(DOMAIN_BINARY_SENSOR, entity_name)
 
-                attributes[ATTR_LAST_CHANGED] = datetime.now().strftime(
-                    DEFAULT_DATE_FORMAT
-                )
-
                 if current_entity is not None and current_entity.state == is_on:
                     entity_attributes = current_entity.attributes
-                    attributes[ATTR_LAST_CHANGED] = entity_attributes.get(
-                        ATTR_LAST_CHANGED
-                    )
+                    last_changed = entity_attributes.get(ATTR_LAST_CHANGED)
+                else:
+                    last_changed = datetime.now().strftime(DEFAULT_DATE_FORMAT)
+
+                attributes[ATTR_LAST_CHANGED] = last_changed
 
                 icon = ICONS[sensor_type]
 
@@ -327,6 +423,25 @@ class EntityManager:
                 f"Failed to create {key} sensor {sensor_type} with the following data: {data}",
             )
 
+    def add_time_series_attributes(self, attributes, time_series_key, key, field, name):
+        """Average, maximum and percentile of the field in the sensor window."""
+        percentile = TIME_SERIES_SENSOR_PERCENTILE
+
+        result = self.data_manager.query_time_series(
+            time_series_key, key, field, TIME_SERIES_SENSOR_WINDOW, [percentile]
+        )
+
+        if result is None or result.get("count", 0) == 0:
+            return
+
+        unit_size = self.config_data.unit_size
+
+        attributes[f"{name} Average"] = result["avg"] / unit_size
+        attributes[f"{name} Maximum"] = result["max"] / unit_size
+        attributes[f"{name} {percentile}th Percentile"] = (
+            result[f"p{percentile}"] / unit_size
+        )
+
     def create_unknown_devices_sensor(self):
         unknown_devices = self.system_data.get(UNKNOWN_DEVICES_KEY)
 
@@ -412,6 +527,70 @@ class EntityManager:
         except Exception as ex:
             self.log_exception(ex, "Failed to create system status binary sensor")
 
+    def create_diagnostics_sensor(self):
+        if not self.config_data.diagnostics_sensor:
+            return
+
+        try:
+            entity_name = f"{self.integration_title} {ATTR_DIAGNOSTICS}"
+
+            ws_statistics = self.data_manager.ws_statistics
+            api_statistics = self.data_manager.api_statistics
+            state_writes = self.state_write_statistics
+
+            attributes = {
+                ATTR_FRIENDLY_NAME: entity_name,
+                "WS Frames": ws_statistics["frames"],
+                "WS Bytes": ws_statistics["bytes"],
+                "WS Parse Failures": ws_statistics["parse_failures"],
+                "WS Decoder Resets": ws_statistics["resets"],
+                "WS Frame Latency (ms)": ws_statistics["latency"]["avg_ms"],
+                "API Requests": sum(api_statistics["requests"].values()),
+                "API Failed Requests": api_statistics["failed_requests"],
+                "API Latency (ms)": api_statistics["latency"]["avg_ms"],
+                "Rebuild Latency (ms)": round(self._rebuild_latency.average, 3),
+                "State Writes": sum(state_writes["written"].values()),
+                "Suppressed State Writes": sum(state_writes["suppressed"].values()),
+            }
+
+            self.create_entity(
+                DOMAIN_SENSOR,
+                entity_name,
+                ws_statistics["messages"],
+                attributes,
+                "mdi:stethoscope",
+            )
+        except Exception as ex:
+            self.log_exception(ex, "Failed to create diagnostics sensor")
+
+    def create_traffic_sensors(self):
+        if not self.config_data.traffic_sensors:
+            return
+
+        try:
+            statistics = self.data_manager.traffic_statistics
+            unit = self.config_data.unit
+            unit_size = self.config_data.unit_size
+
+            for kind, (title, icon) in TRAFFIC_SENSORS.items():
+                entity_name = f"{self.integration_title} {title}"
+
+                attributes = {
+                    ATTR_FRIENDLY_NAME: entity_name,
+                    ATTR_RATE_UNIT: f"{unit}/ps",
+                }
+
+                for item in self.data_manager.get_traffic(kind, TRAFFIC_TOP_COUNT):
+                    rate = item["rx_rate"] + item["tx_rate"]
+
+                    attributes[item[ATTR_NAME]] = rate / unit_size
+
+                self.create_entity(
+                    DOMAIN_SENSOR, entity_name, statistics[kind], attributes, icon
+                )
+        except Exception as ex:
+            self.log_exception(ex, "Failed to create traffic sensors")
+
     def create_device_tracker(self, host, data):
         try:
             allowed_items = self.config_data.device_trackers
@@ -423,8 +602,7 @@ class EntityManager:
 
                 attributes = {ATTR_SOURCE_TYPE: SOURCE_TYPE_ROUTER, CONF_HOST: host}
 
-                for data_item_key in data:
-                    value = data.get(data_item_key)
+                for data_item_key, value in data.items():
                     attr = self.get_device_attributes(data_item_key)
 
                     name = attr.get(ATTR_NAME, data_item_key)
@@ -450,28 +628,50 @@ class EntityManager:
         attributes: dict,
         icon: Optional[str] = None,
     ):
-        entity = EntityData()
+        unique_id = f"{DEFAULT_NAME}-{domain}-{name}"
+
+        self._processed_entities.add(unique_id)
+
+        entity = self.get_entity(domain, name)
+
+        if entity is None:
+            entity = EntityData()
+
+            entity.name = name
+            entity.state = state
+            entity.attributes = attributes
+            entity.device_name = DEFAULT_NAME
+            entity.unique_id = unique_id
 
-        entity.name = name
-        entity.state = state
-        entity.attributes = attributes
-        entity.device_name = DEFAULT_NAME
-        entity.unique_id = f"{DEFAULT_NAME}-{domain}-{name}"
+            if icon is not None:
+                entity.icon = icon
 
-        if icon is not None:
-            entity.icon = icon
+            self.set_entity(domain, name, entity)
 
-        self.set_entity(domain, name, entity)
+        elif entity.update(state, attributes, icon):
+            if entity.status != ENTITY_STATUS_CREATED:
+                entity.status = ENTITY_STATUS_MODIFIED
+
+                self._pending_updates[entity.unique_id] = entity
+
+        else:
+            self.count_state_write(domain, True)
 
     @staticmethod
     def get_device_attributes(key):
-        result = DEVICE_SERVICES_STATS_MAP.get(key, {})
+        all_attributes = {**DEVICE_SERVICES_STATS_MAP, **RATE_STATS_MAP}
+
+        result = all_attributes.get(key, {})
 
         return result
 
     @staticmethod
     def get_interface_attributes(key):
-        all_attributes = {**INTERFACES_MAIN_MAP, **INTERFACES_STATS_MAP}
+        all_attributes = {
+            **INTERFACES_MAIN_MAP,
+            **INTERFACES_STATS_MAP,
+            **RATE_STATS_MAP,
+        }
 
         result = all_attributes.get(key, {})
 
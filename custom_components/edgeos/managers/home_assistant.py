@@ -22,6 +22,7 @@ from .data_manager import EdgeOSData
 from .device_manager import DeviceManager
 from .entity_manager import EntityManager
 from .password_manager import PasswordManager
+from .polling_scheduler import PollingScheduler
 from .storage_manager import StorageManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -44,6 +45,7 @@ class EdgeOSHomeAssistant:
         self._storage_manager = None
 
         self._config_manager = ConfigManager(password_manager)
+        self._polling_scheduler = PollingScheduler(self._config_manager)
 
         def update_api(internal_now):
             self._hass.async_create_task(self.async_update_api(internal_now))
@@ -85,6 +87,18 @@ class EdgeOSHomeAssistant:
     def entity_registry(self) -> EntityRegistry:
         return self._entity_registry
 
+    @property
+    def diagnostics(self) -> dict:
+        result = {
+            "product": self.data_manager.product,
+            "version": self.data_manager.version,
+            "statistics": self.data_manager.statistics,
+            "entities": self.entity_manager.statistics,
+            "polling": self._polling_scheduler.statistics,
+        }
+
+        return result
+
     def set_async_track_timer(self, key, interval, callback):
         timer = self._remove_async_track_timers.get(key)
 
@@ -136,7 +150,7 @@ class EdgeOSHomeAssistant:
             await self._config_manager.update(entry)
 
             self._data_manager = EdgeOSData(
-                self._hass, self._config_manager, self.update
+                self._hass, self._config_manager, self.update, self._storage_manager
             )
             self._device_manager = DeviceManager(self._hass, self)
             self._entity_manager = EntityManager(self._hass, self)
@@ -147,9 +161,7 @@ class EdgeOSHomeAssistant:
 
             _LOGGER.error(error_message)
 
-            data = await self._storage_manager.async_load_from_store()
-            data.key = None
-            await self._storage_manager.async_save_to_store(data)
+            await self._storage_manager.async_clear_key()
 
             await self._hass.services.async_call(
                 "persistent_notification",
@@ -173,6 +185,7 @@ class EdgeOSHomeAssistant:
         _LOGGER.info(f"Removing {entry.title}")
 
         await self._data_manager.terminate()
+        await self._data_manager.async_close_connections()
 
         for timer_key in self._remove_async_track_timers:
             self.remove_async_track_timer(timer_key)
@@ -194,8 +207,13 @@ class EdgeOSHomeAssistant:
         _LOGGER.info(f"Handling ConfigEntry change: {entry.as_dict()}")
 
         await self._config_manager.update(entry)
+        await self._data_manager.async_update_topics()
 
-        await self.async_update_api(datetime.now())
+        self._data_manager.retain_monitored()
+
+        self._entity_manager.request_full_rebuild()
+
+        await self.async_update_api(datetime.now(), True)
 
         await self.discover_all()
 
@@ -204,7 +222,9 @@ class EdgeOSHomeAssistant:
         self.set_async_track_timer(
             "Entities", config.update_entities_interval, self._update_entities
         )
-        self.set_async_track_timer("API", config.update_api_interval, self._update_api)
+        self.set_async_track_timer(
+            "API", self._polling_scheduler.tick_interval, self._update_api
+        )
         self.set_async_track_timer(
             "Heartbeat", HEARTBEAT_INTERVAL_SECONDS, self._send_heartbeat
         )
@@ -219,15 +239,28 @@ class EdgeOSHomeAssistant:
 
         await self._data_manager.async_send_heartbeat()
 
-    async def async_update_api(self, event_time):
+    async def async_update_api(self, event_time, force=False):
         if not self._is_initialized:
             _LOGGER.info(f"NOT INITIALIZED, cannot update data from API: {event_time}")
 
             return
 
-        _LOGGER.debug(f"Update API: {event_time}")
+        poll = POLL_FULL
+
+        if not force:
+            poll = self._polling_scheduler.get_due_poll(self._data_manager.ws_age)
+
+        if poll is None:
+            return
 
-        await self._data_manager.refresh()
+        _LOGGER.debug("Update API (%s): %s", poll, event_time)
+
+        self._polling_scheduler.record(poll)
+
+        if poll == POLL_FULL:
+            await self._data_manager.refresh()
+        else:
+            await self._data_manager.refresh_unknown_devices()
 
     async def async_update_entities(self, event_time):
         if not self._is_initialized:
@@ -262,8 +295,8 @@ class EdgeOSHomeAssistant:
         default_device_info = self.device_manager.get(DEFAULT_NAME)
 
         if CONF_NAME in default_device_info:
-            for domain in SIGNALS:
-                signal = SIGNALS.get(domain)
+            for entity in self.entity_manager.pop_pending_updates():
+                signal = SIGNAL_UPDATE_ENTITY.format(entity.unique_id)
 
                 async_dispatcher_send(self._hass, signal)
 
@@ -29,19 +29,23 @@ class PasswordManager:
             self.data = await storage_manager.async_load_from_store()
 
             if self.data.key is None:
-                legacy_key_path = self.hass.config.path(DOMAIN_KEY_FILE)
+                self.data = await storage_manager.async_update_store(self._set_key)
 
-                if path.exists(legacy_key_path):
-                    with open(legacy_key_path, "rb") as file:
-                        self.data.key = file.read().decode("utf-8")
+            self.crypto = Fernet(self.data.key.encode())
 
-                    remove(legacy_key_path)
-                else:
-                    self.data.key = Fernet.generate_key().decode("utf-8")
+    def _set_key(self, data: StorageData):
+        if data.key is not None:
+            return
 
-                await storage_manager.async_save_to_store(self.data)
+        legacy_key_path = self.hass.config.path(DOMAIN_KEY_FILE)
 
-            self.crypto = Fernet(self.data.key.encode())
+        if path.exists(legacy_key_path):
+            with open(legacy_key_path, "rb") as file:
+                data.key = file.read().decode("utf-8")
+
+            remove(legacy_key_path)
+        else:
+            data.key = Fernet.generate_key().decode("utf-8")
 
     async def encrypt(self, data: str):
         await self._load_key()
@@ -0,0 +1,116 @@
+"""
+This component provides support for Home Automation Manager (HAM).
+For more details about this component, please refer to the documentation at
+https://home-assistant.io/components/edgeos/
+"""
+import logging
+from time import monotonic
+from typing import Optional
+
+from ..helpers.const import *
+from ..models.config_data import ConfigData
+from .configuration_manager import ConfigManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PollingScheduler:
+    """
+    Decides on every tick of the API timer which REST data is due, while WS
+    delivers data get.json is polled every POLLING_WS_LIVE_FACTOR API
+    intervals and only dhcp-leases every API interval, once WS goes stale
+    everything is polled at least every POLLING_WS_STALE_INTERVAL seconds.
+    """
+
+    def __init__(self, config_manager: ConfigManager):
+        self._config_manager = config_manager
+
+        self._last_polls = {}
+        self._polls = {POLL_FULL: 0, POLL_UNKNOWN_DEVICES: 0}
+        self._is_ws_live = None
+
+    @property
+    def config_data(self) -> Optional[ConfigData]:
+        if self._config_manager is not None:
+            return self._config_manager.data
+
+        return None
+
+    @property
+    def interval(self) -> int:
+        interval = DEFAULT_UPDATE_API_INTERVAL
+
+        if self.config_data is not None:
+            interval = self.config_data.update_api_interval
+
+        return interval
+
+    @property
+    def tick_interval(self) -> int:
+        """Interval of the API timer."""
+        return min(self.interval, POLLING_TICK_INTERVAL)
+
+    @property
+    def intervals(self) -> dict:
+        interval = self.interval
+
+        if self._is_ws_live:
+            intervals = {
+                POLL_FULL: interval * POLLING_WS_LIVE_FACTOR,
+                POLL_UNKNOWN_DEVICES: interval,
+            }
+
+        else:
+            stale_interval = min(interval, POLLING_WS_STALE_INTERVAL)
+
+            intervals = {
+                POLL_FULL: stale_interval,
+                POLL_UNKNOWN_DEVICES: stale_interval,
+            }
+
+        return intervals
+
+    @property
+    def statistics(self) -> dict:
+        result = {
+            "ws_live": self._is_ws_live,
+            "intervals": self.intervals,
+            "polls": dict(self._polls),
+        }
+
+        return result
+
+    def get_due_poll(self, ws_age: Optional[float]) -> Optional[str]:
+        """ws_age - seconds since the last WS message, None when disconnected."""
+        is_ws_live = ws_age is not None and ws_age < POLLING_WS_STALE_INTERVAL
+
+        if is_ws_live != self._is_ws_live:
+            is_changed = self._is_ws_live is not None
+
+            self._is_ws_live = is_ws_live
+
+            if is_changed:
+                _LOGGER.info(
+                    f"WS is {'live' if is_ws_live else 'stale'}, "
+                    f"polling API by intervals: {self.intervals}"
+                )
+
+        now = monotonic()
+        intervals = self.intervals
+
+        for poll in (POLL_FULL, POLL_UNKNOWN_DEVICES):
+            last_poll = self._last_polls.get(poll)
+
+            if last_poll is None or now - last_poll >= intervals[poll]:
+                return poll
+
+        return None
+
+    def record(self, poll: str):
+        now = monotonic()
+
+        self._polls[poll] += 1
+        self._last_polls[poll] = now
+
+        if poll == POLL_FULL:
+            self._last_polls[POLL_UNKNOWN_DEVICES] = now
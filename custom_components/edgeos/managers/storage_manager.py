@@ -1,5 +1,7 @@
 """Storage handers."""
+from asyncio import Lock
 import logging
+from typing import Callable, Optional
 
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.storage import Store
@@ -22,6 +24,18 @@ class StorageManager:
 
         return file_name
 
+    @property
+    def lock(self) -> Lock:
+        """Single lock per HA instance for the store shared by all entries."""
+        lock = self._hass.data.get(DATA_EDGEOS_STORAGE_LOCK)
+
+        if lock is None:
+            lock = Lock()
+
+            self._hass.data[DATA_EDGEOS_STORAGE_LOCK] = lock
+
+        return lock
+
     async def async_load_from_store(self) -> StorageData:
         """Load the retained data from store and return de-serialized data."""
         store = Store(self._hass, STORAGE_VERSION, self.file_name, encoder=JSONEncoder)
@@ -37,3 +51,42 @@ class StorageManager:
         store = Store(self._hass, STORAGE_VERSION, self.file_name, encoder=JSONEncoder)
 
         await store.async_save(data.to_dict())
+
+    async def async_load_session(self, host) -> Optional[dict]:
+        """Cookies and product of the last login to the host."""
+        data = await self.async_load_from_store()
+
+        session = data.sessions.get(host)
+
+        return session
+
+    async def async_update_store(
+        self, update: Callable[[StorageData], None]
+    ) -> StorageData:
+        """
+        Load, modify and save the store while holding the lock, concurrent
+        updates (sessions of other entries, encryption key) are not lost.
+        """
+        async with self.lock:
+            data = await self.async_load_from_store()
+
+            update(data)
+
+            await self.async_save_to_store(data)
+
+        return data
+
+    async def async_save_session(self, host, session: Optional[dict]):
+        def update_session(data: StorageData):
+            if session is None:
+                data.sessions.pop(host, None)
+            else:
+                data.sessions[host] = session
+
+        await self.async_update_store(update_session)
+
+    async def async_clear_key(self):
+        def clear_key(data: StorageData):
+            data.key = None
+
+        await self.async_update_store(clear_key)
@@ -0,0 +1,101 @@
+"""
+This component provides support for Home Automation Manager (HAM).
+For more details about this component, please refer to the documentation at
+https://home-assistant.io/components/edgeos/
+"""
+import asyncio
+import logging
+import sys
+from typing import Optional
+
+from ..helpers.const import *
+from ..models.config_data import ConfigData
+from .configuration_manager import ConfigManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class UpdateScheduler:
+    """Coalesces updates of WS topics into a single publish per interval."""
+
+    def __init__(self, hass, config_manager: ConfigManager, publish_callback):
+        self._hass = hass
+        self._config_manager = config_manager
+        self._publish_callback = publish_callback
+
+        self._dirty_topics = set()
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._last_publish = None
+
+        self._received = {}
+        self._published = 0
+
+    @property
+    def config_data(self) -> Optional[ConfigData]:
+        if self._config_manager is not None:
+            return self._config_manager.data
+
+        return None
+
+    @property
+    def interval(self) -> float:
+        interval = DEFAULT_UPDATE_DEBOUNCE_INTERVAL
+
+        if self.config_data is not None:
+            interval = self.config_data.update_debounce_interval
+
+        return interval / 1000
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._hass is None:
+            return asyncio.get_event_loop()
+
+        return self._hass.loop
+
+    @property
+    def statistics(self) -> dict:
+        result = {
+            "received": sum(self._received.values()),
+            "received_per_topic": dict(self._received),
+            "published": self._published,
+            "pending_topics": list(self._dirty_topics),
+        }
+
+        return result
+
+    def mark_dirty(self, topic):
+        self._received[topic] = self._received.get(topic, 0) + 1
+        self._dirty_topics.add(topic)
+
+        if self._handle is not None:
+            return
+
+        delay = 0
+        now = self.loop.time()
+
+        if self._last_publish is not None:
+            delay = max(0, self.interval - (now - self._last_publish))
+
+        self._handle = self.loop.call_later(delay, self.flush)
+
+    def flush(self):
+        self.cancel()
+
+        self._dirty_topics.clear()
+        self._last_publish = self.loop.time()
+        self._published += 1
+
+        try:
+            self._publish_callback()
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(f"Failed to publish update, Error: {ex}, Line: {line_number}")
+
+    def cancel(self):
+        if self._handle is not None:
+            self._handle.cancel()
+
+            self._handle = None
@@ -0,0 +1,63 @@
+import random
+
+from ..helpers.const import *
+
+
+class ExponentialBackoff:
+    """
+    Delays (seconds) growing by multiplier up to maximum, every delay is
+    reduced by a random part of up to jitter (ratio) so clients that failed
+    together don't retry together.
+    """
+
+    __slots__ = ("initial", "maximum", "multiplier", "jitter", "attempts")
+
+    initial: float
+    maximum: float
+    multiplier: float
+    jitter: float
+    attempts: int
+
+    def __init__(
+        self,
+        initial: float,
+        maximum: float,
+        multiplier: float = BACKOFF_MULTIPLIER,
+        jitter: float = BACKOFF_JITTER,
+    ):
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.attempts = 0
+
+    @property
+    def delay(self) -> float:
+        """Delay of the next attempt without jitter."""
+        return min(self.maximum, self.initial * self.multiplier ** self.attempts)
+
+    def next_delay(self) -> float:
+        delay = self.delay
+
+        if delay < self.maximum:
+            self.attempts += 1
+
+        return delay - random.uniform(0, delay * self.jitter)
+
+    def reset(self):
+        self.attempts = 0
+
+    def to_dict(self):
+        obj = {
+            "initial": self.initial,
+            "maximum": self.maximum,
+            "attempts": self.attempts,
+            "delay": self.delay,
+        }
+
+        return obj
+
+    def __repr__(self):
+        to_string = f"{self.to_dict()}"
+
+        return to_string
@@ -45,6 +45,7 @@ class EdgeOSEntity(Entity):
     entity: EntityData = None
     remove_dispatcher = None
     current_domain: str = None
+    last_state = None
 
     ha: EdgeOSHomeAssistant
 
@@ -59,6 +60,7 @@ class EdgeOSEntity(Entity):
         self.entity = entity
         self.remove_dispatcher = None
         self.current_domain = current_domain
+        self.last_state = entity.state
 
         self.ha = get_ha(hass, self.integration_name)
 
@@ -102,7 +104,9 @@ class EdgeOSEntity(Entity):
     async def async_added_to_hass(self):
         """Register callbacks."""
         self.remove_dispatcher = async_dispatcher_connect(
-            self.hass, SIGNALS[self.current_domain], self._schedule_immediate_update
+            self.hass,
+            SIGNAL_UPDATE_ENTITY.format(self.unique_id),
+            self._handle_update_signal,
         )
 
         await self.async_added_to_hass_local()
@@ -115,17 +119,14 @@ class EdgeOSEntity(Entity):
         await self.async_will_remove_from_hass_local()
 
     @callback
-    def _schedule_immediate_update(self):
-        self.hass.async_create_task(self._async_schedule_immediate_update())
-
-    async def _async_schedule_immediate_update(self):
+    def _handle_update_signal(self):
         if self.entity_manager is None:
             _LOGGER.debug(
                 f"Cannot update {self.current_domain} - Entity Manager is None | {self.name}"
             )
         else:
             if self.entity is not None:
-                previous_state = self.entity.state
+                previous_state = self.last_state
 
                 entity = self.entity_manager.get_entity(self.current_domain, self.name)
 
@@ -137,8 +138,11 @@ class EdgeOSEntity(Entity):
 
                 else:
                     self.entity = entity
-                    if self.entity is not None:
-                        self._immediate_update(previous_state)
+                    self.last_state = entity.state
+
+                    self.entity_manager.count_state_write(self.current_domain, False)
+
+                    self._immediate_update(previous_state)
 
     async def async_added_to_hass_local(self):
         pass
@@ -147,4 +151,4 @@ class EdgeOSEntity(Entity):
         pass
 
     def _immediate_update(self, previous_state: int):
-        self.async_schedule_update_ha_state(True)
+        self.async_write_ha_state()
@@ -0,0 +1,98 @@
+from time import monotonic
+
+from ..helpers.const import *
+from .backoff import ExponentialBackoff
+
+
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive failures, while open only a
+    probe is allowed once its backoff delay elapsed (half-open), a successful
+    probe closes it, a failed one opens it again for a longer delay.
+    """
+
+    __slots__ = (
+        "failure_threshold",
+        "backoff",
+        "state",
+        "failures",
+        "opened",
+        "rejected",
+        "next_probe",
+    )
+
+    failure_threshold: int
+    backoff: ExponentialBackoff
+    state: str
+    failures: int
+    opened: int
+    rejected: int
+    next_probe: float
+
+    def __init__(self, failure_threshold: int, backoff: ExponentialBackoff):
+        self.failure_threshold = failure_threshold
+        self.backoff = backoff
+        self.state = CIRCUIT_BREAKER_CLOSED
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self.next_probe = 0
+
+    @property
+    def is_closed(self) -> bool:
+        return self.state == CIRCUIT_BREAKER_CLOSED
+
+    @property
+    def is_probe_due(self) -> bool:
+        return self.state == CIRCUIT_BREAKER_OPEN and monotonic() >= self.next_probe
+
+    def allow_request(self, is_probe: bool = False) -> bool:
+        if self.is_closed:
+            return True
+
+        if is_probe and self.is_probe_due:
+            self.state = CIRCUIT_BREAKER_HALF_OPEN
+
+            return True
+
+        self.rejected += 1
+
+        return False
+
+    def record_success(self):
+        self.state = CIRCUIT_BREAKER_CLOSED
+        self.failures = 0
+        self.backoff.reset()
+
+    def record_failure(self):
+        self.failures += 1
+
+        if self.is_closed and self.failures < self.failure_threshold:
+            return
+
+        if self.is_closed:
+            self.opened += 1
+
+        self.state = CIRCUIT_BREAKER_OPEN
+        self.next_probe = monotonic() + self.backoff.next_delay()
+
+    def to_dict(self):
+        next_probe_in = None
+
+        if not self.is_closed:
+            next_probe_in = max(0.0, round(self.next_probe - monotonic(), 1))
+
+        obj = {
+            "state": self.state,
+            "failures": self.failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+            "next_probe_in": next_probe_in,
+        }
+
+        return obj
+
+    def __repr__(self):
+        to_string = f"{self.to_dict()}"
+
+        return to_string
@@ -13,12 +13,18 @@ class ConfigData:
     unit: int
     update_entities_interval: int
     update_api_interval: int
+    update_debounce_interval: int
     monitored_devices: list
     monitored_interfaces: list
     device_trackers: list
     log_level: str
     log_incoming_messages: bool
+    record_incoming_messages: bool
+    diagnostics_sensor: bool
     consider_away_interval: int
+    maximum_reconnect_interval: int
+    time_series_depth: int
+    traffic_sensors: bool
 
     def __init__(self):
         self.name = DEFAULT_NAME
@@ -30,13 +36,19 @@ class ConfigData:
         self.unit = ATTR_BYTE
         self.update_entities_interval = DEFAULT_UPDATE_ENTITIES_INTERVAL
         self.update_api_interval = DEFAULT_UPDATE_API_INTERVAL
+        self.update_debounce_interval = DEFAULT_UPDATE_DEBOUNCE_INTERVAL
         self.monitored_devices = []
         self.monitored_interfaces = []
         self.device_trackers = []
         self.log_level = ""
         self.log_incoming_messages = False
+        self.record_incoming_messages = False
+        self.diagnostics_sensor = False
         self.store_debug_files = False
         self.consider_away_interval = DEFAULT_CONSIDER_AWAY_INTERVAL
+        self.maximum_reconnect_interval = DEFAULT_MAXIMUM_RECONNECT_INTERVAL
+        self.time_series_depth = DEFAULT_TIME_SERIES_DEPTH
+        self.traffic_sensors = False
 
     @property
     def unit_size(self):
@@ -66,12 +78,18 @@ class ConfigData:
             CONF_UNIT: self.unit,
             CONF_UPDATE_API_INTERVAL: self.update_api_interval,
             CONF_UPDATE_ENTITIES_INTERVAL: self.update_entities_interval,
+            CONF_UPDATE_DEBOUNCE_INTERVAL: self.update_debounce_interval,
             CONF_MONITORED_DEVICES: self.monitored_devices,
             CONF_MONITORED_INTERFACES: self.monitored_interfaces,
             CONF_TRACK_DEVICES: self.device_trackers,
             CONF_LOG_LEVEL: self.log_level,
             CONF_LOG_INCOMING_MESSAGES: self.log_incoming_messages,
+            CONF_RECORD_INCOMING_MESSAGES: self.record_incoming_messages,
+            CONF_DIAGNOSTICS_SENSOR: self.diagnostics_sensor,
             CONF_CONSIDER_AWAY_INTERVAL: self.consider_away_interval,
+            CONF_MAXIMUM_RECONNECT_INTERVAL: self.maximum_reconnect_interval,
+            CONF_TIME_SERIES_DEPTH: self.time_series_depth,
+            CONF_TRAFFIC_SENSORS: self.traffic_sensors,
         }
 
         to_string = f"{obj}"
@@ -0,0 +1,68 @@
+from datetime import datetime
+from typing import Optional
+
+from ..helpers.const import *
+from .record_data import RecordData
+
+
+class DeviceData(RecordData):
+    __slots__ = (
+        "hostname",
+        "ip",
+        "mac",
+        "name",
+        "connected",
+        "last_activity",
+        "rx_bytes",
+        "tx_bytes",
+        "rx_rate",
+        "tx_rate",
+        "rx_rate_smoothed",
+        "tx_rate_smoothed",
+        "rx_rate_windowed",
+        "tx_rate_windowed",
+    )
+
+    ATTRIBUTES = {
+        IP: "ip",
+        MAC: "mac",
+        ATTR_NAME: "name",
+        CONNECTED: "connected",
+        LAST_ACTIVITY: "last_activity",
+        "rx_bytes": "rx_bytes",
+        "tx_bytes": "tx_bytes",
+        "rx_rate": "rx_rate",
+        "tx_rate": "tx_rate",
+        **{key: key for key in RATE_STATS_MAP},
+    }
+
+    hostname: str
+    ip: Optional[str]
+    mac: Optional[str]
+    name: Optional[str]
+    connected: bool
+    last_activity: Optional[datetime]
+    rx_bytes: Optional[int]
+    tx_bytes: Optional[int]
+    rx_rate: Optional[int]
+    tx_rate: Optional[int]
+    rx_rate_smoothed: Optional[int]
+    tx_rate_smoothed: Optional[int]
+    rx_rate_windowed: Optional[int]
+    tx_rate_windowed: Optional[int]
+
+    def __init__(self, hostname: str):
+        self.hostname = hostname
+        self.ip = None
+        self.mac = None
+        self.name = None
+        self.connected = False
+        self.last_activity = None
+        self.rx_bytes = None
+        self.tx_bytes = None
+        self.rx_rate = None
+        self.tx_rate = None
+        self.rx_rate_smoothed = None
+        self.tx_rate_smoothed = None
+        self.rx_rate_windowed = None
+        self.tx_rate_windowed = None
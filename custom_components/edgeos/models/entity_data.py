@@ -1,7 +1,20 @@
+from typing import Optional
+
 from ..helpers.const import *
 
 
 class EntityData:
+    __slots__ = (
+        "unique_id",
+        "name",
+        "state",
+        "attributes",
+        "icon",
+        "device_name",
+        "status",
+        "disabled",
+    )
+
     unique_id: str
     name: str
     state: int
@@ -21,6 +34,24 @@ class EntityData:
         self.status = ENTITY_STATUS_CREATED
         self.disabled = False
 
+    def update(self, state, attributes: dict, icon: Optional[str] = None) -> bool:
+        """Update state in place, returns whether anything changed."""
+        changed = False
+
+        if icon is not None and self.icon != icon:
+            self.icon = icon
+            changed = True
+
+        if self.state != state:
+            self.state = state
+            changed = True
+
+        if self.attributes != attributes:
+            self.attributes = attributes
+            changed = True
+
+        return changed
+
     def __repr__(self):
         obj = {
             ENTITY_NAME: self.name,
@@ -0,0 +1,180 @@
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class IndexedHeap:
+    """
+    Max-heap of keys by priority, the position of every key is indexed so
+    adding, updating and removing a key is O(log n), the top count keys are
+    taken in O(count log count) without changing the heap.
+
+    Updating many priorities at once rebuilds the heap by sorting when more
+    than rebuild_ratio of the keys changed, cheaper than sifting most keys.
+    """
+
+    __slots__ = ("rebuild_ratio", "_keys", "_priorities", "_positions")
+
+    rebuild_ratio: float
+    _keys: List[str]
+    _priorities: List[float]
+    _positions: Dict[str, int]
+
+    def __init__(self, rebuild_ratio: float = 1):
+        self.rebuild_ratio = rebuild_ratio
+
+        self._keys = []
+        self._priorities = []
+        self._positions = {}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def keys(self):
+        return self._positions.keys()
+
+    def get(self, key: str) -> Optional[float]:
+        position = self._positions.get(key)
+
+        if position is None:
+            return None
+
+        return self._priorities[position]
+
+    def update(self, key: str, priority: float):
+        position = self._positions.get(key)
+
+        if position is None:
+            position = len(self._keys)
+
+            self._keys.append(key)
+            self._priorities.append(priority)
+            self._positions[key] = position
+
+            self._sift_up(position)
+
+        else:
+            previous_priority = self._priorities[position]
+            self._priorities[position] = priority
+
+            if priority > previous_priority:
+                self._sift_up(position)
+            elif priority < previous_priority:
+                self._sift_down(position)
+
+    def remove(self, key: str):
+        position = self._positions.pop(key, None)
+
+        if position is None:
+            return
+
+        last_key = self._keys.pop()
+        last_priority = self._priorities.pop()
+
+        if position < len(self._keys):
+            self._keys[position] = last_key
+            self._priorities[position] = last_priority
+            self._positions[last_key] = position
+
+            self._sift_up(position)
+            self._sift_down(self._positions[last_key])
+
+    def update_many(self, priorities: Dict[str, float], removed: Iterable = ()):
+        """
+        Updates the changed priorities and removes keys, the heap is rebuilt
+        by sorting when they are more than rebuild_ratio of the keys.
+        """
+        if len(priorities) + len(removed) > len(self._keys) * self.rebuild_ratio:
+            current = dict(zip(self._keys, self._priorities))
+            current.update(priorities)
+
+            for key in removed:
+                current.pop(key, None)
+
+            self._rebuild(current)
+
+            return
+
+        for key in removed:
+            self.remove(key)
+
+        for key, priority in priorities.items():
+            self.update(key, priority)
+
+    def clear(self):
+        self._keys = []
+        self._priorities = []
+        self._positions = {}
+
+    def top(self, count: int) -> List[Tuple[str, float]]:
+        """Keys with the highest priorities, highest first."""
+        priorities = self._priorities
+        size = len(priorities)
+
+        result = []
+        candidates = [(-priorities[0], 0)] if size > 0 else []
+
+        while len(candidates) > 0 and len(result) < count:
+            _, position = heapq.heappop(candidates)
+
+            result.append((self._keys[position], priorities[position]))
+
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < size:
+                    heapq.heappush(candidates, (-priorities[child], child))
+
+        return result
+
+    def _rebuild(self, priorities: Dict[str, float]):
+        """Sorted by priority, highest first, is a valid max-heap."""
+        keys = sorted(priorities, key=priorities.__getitem__, reverse=True)
+
+        self._keys = keys
+        self._priorities = list(map(priorities.__getitem__, keys))
+        self._positions = dict(zip(keys, range(len(keys))))
+
+    def _swap(self, position: int, other_position: int):
+        keys = self._keys
+        priorities = self._priorities
+
+        keys[position], keys[other_position] = keys[other_position], keys[position]
+        priorities[position], priorities[other_position] = (
+            priorities[other_position],
+            priorities[position],
+        )
+
+        self._positions[keys[position]] = position
+        self._positions[keys[other_position]] = other_position
+
+    def _sift_up(self, position: int):
+        priorities = self._priorities
+
+        while position > 0:
+            parent = (position - 1) // 2
+
+            if priorities[parent] >= priorities[position]:
+                break
+
+            self._swap(position, parent)
+
+            position = parent
+
+    def _sift_down(self, position: int):
+        priorities = self._priorities
+        size = len(priorities)
+
+        while True:
+            largest = position
+
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < size and priorities[child] > priorities[largest]:
+                    largest = child
+
+            if largest == position:
+                break
+
+            self._swap(position, largest)
+
+            position = largest
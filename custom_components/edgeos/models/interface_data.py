@@ -0,0 +1,64 @@
+from typing import Optional
+
+from ..helpers.const import *
+from .record_data import RecordData
+
+
+class InterfaceData(RecordData):
+    __slots__ = (
+        "name",
+        "up",
+        "speed",
+        "duplex",
+        "mac",
+        "addresses",
+        "rx_packets",
+        "tx_packets",
+        "rx_bytes",
+        "tx_bytes",
+        "rx_errors",
+        "tx_errors",
+        "rx_dropped",
+        "tx_dropped",
+        "rx_bps",
+        "tx_bps",
+        "multicast",
+        "rx_rate_smoothed",
+        "tx_rate_smoothed",
+        "rx_rate_windowed",
+        "tx_rate_windowed",
+    )
+
+    ATTRIBUTES = {
+        ATTR_NAME: "name",
+        ADDRESS_LIST: "addresses",
+        **{key: key for key in INTERFACES_MAIN_MAP},
+        **{key: key for key in INTERFACES_STATS_MAP},
+        **{key: key for key in RATE_STATS_MAP},
+    }
+
+    name: Optional[str]
+    up: Optional[str]
+    speed: Optional[str]
+    duplex: Optional[str]
+    mac: Optional[str]
+    addresses: Optional[list]
+    rx_packets: Optional[str]
+    tx_packets: Optional[str]
+    rx_bytes: Optional[str]
+    tx_bytes: Optional[str]
+    rx_errors: Optional[str]
+    tx_errors: Optional[str]
+    rx_dropped: Optional[str]
+    tx_dropped: Optional[str]
+    rx_bps: Optional[str]
+    tx_bps: Optional[str]
+    multicast: Optional[str]
+    rx_rate_smoothed: Optional[int]
+    tx_rate_smoothed: Optional[int]
+    rx_rate_windowed: Optional[int]
+    tx_rate_windowed: Optional[int]
+
+    def __init__(self):
+        for slot in self.__slots__:
+            setattr(self, slot, None)
@@ -0,0 +1,58 @@
+from bisect import bisect_left
+from typing import List
+
+from ..helpers.const import *
+
+
+class LatencyHistogram:
+    """Number of durations per bucket (upper bounds in milliseconds)."""
+
+    __slots__ = ("bounds", "buckets", "count", "total", "maximum")
+
+    bounds: List[int]
+    buckets: List[int]
+    count: int
+    total: float
+    maximum: float
+
+    def __init__(self, bounds: List[int] = None):
+        self.bounds = LATENCY_HISTOGRAM_BOUNDS if bounds is None else bounds
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def observe(self, seconds: float):
+        milliseconds = seconds * 1000
+
+        self.buckets[bisect_left(self.bounds, milliseconds)] += 1
+        self.count += 1
+        self.total += milliseconds
+
+        if milliseconds > self.maximum:
+            self.maximum = milliseconds
+
+    @property
+    def average(self) -> float:
+        if self.count == 0:
+            return 0.0
+
+        return self.total / self.count
+
+    def to_dict(self):
+        keys = [f"<={bound}ms" for bound in self.bounds]
+        keys.append(f">{self.bounds[-1]}ms")
+
+        obj = {
+            "count": self.count,
+            "avg_ms": round(self.average, 3),
+            "max_ms": round(self.maximum, 3),
+            "buckets": dict(zip(keys, self.buckets)),
+        }
+
+        return obj
+
+    def __repr__(self):
+        to_string = f"{self.to_dict()}"
+
+        return to_string
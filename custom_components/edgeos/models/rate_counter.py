@@ -0,0 +1,165 @@
+from collections import deque
+from math import exp
+from typing import List, Optional
+
+from ..helpers.const import *
+
+
+class RateCounter:
+    """
+    Throughput (bytes per second) of a cumulative byte counter, smoothed by
+    an EWMA of time constant RATE_EWMA_TIME_CONSTANT and averaged over the
+    last RATE_WINDOW seconds.
+
+    A counter going backwards wrapped around at one of counter_bits when the
+    previous value was within one interval of the limit, the wrapped delta
+    being at most RATE_WRAP_FACTOR times the smoothed rate over the interval.
+    Otherwise it was reset (router reboot, flows ended) and the interval is
+    skipped with the new value as baseline, as are jumps above RATE_MAXIMUM.
+    """
+
+    __slots__ = (
+        "counter_bits",
+        "value",
+        "timestamp",
+        "smoothed",
+        "wraps",
+        "resets",
+        "_samples",
+        "_window_bytes",
+        "_window_duration",
+    )
+
+    counter_bits: List[int]
+    value: Optional[int]
+    timestamp: Optional[float]
+    smoothed: Optional[float]
+    wraps: int
+    resets: int
+    _samples: deque
+    _window_bytes: int
+    _window_duration: float
+
+    def __init__(self, counter_bits: List[int] = RATE_COUNTER_BITS):
+        self.counter_bits = counter_bits
+        self.wraps = 0
+        self.resets = 0
+
+        self.reset()
+
+    @property
+    def windowed(self) -> Optional[float]:
+        if self._window_duration <= 0:
+            return None
+
+        return self._window_bytes / self._window_duration
+
+    def reset(self):
+        """Drops the baseline and rates, next value starts over."""
+        self.value = None
+        self.timestamp = None
+        self.smoothed = None
+
+        self._samples = deque()
+        self._window_bytes = 0
+        self._window_duration = 0
+
+    def update(self, timestamp: float, value) -> bool:
+        """Returns whether rates were updated by the value."""
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return False
+
+        previous_value = self.value
+        previous_timestamp = self.timestamp
+
+        self.value = value
+        self.timestamp = timestamp
+
+        if previous_value is None:
+            return False
+
+        duration = timestamp - previous_timestamp
+
+        if duration <= 0:
+            return False
+
+        delta = value - previous_value
+
+        if delta < 0:
+            delta = self._get_wrapped_delta(previous_value, value, duration)
+
+            if delta is not None:
+                self.wraps += 1
+
+        if delta is None or delta / duration > RATE_MAXIMUM:
+            self.resets += 1
+
+            return False
+
+        rate = delta / duration
+
+        if self.smoothed is None:
+            self.smoothed = rate
+        else:
+            alpha = 1 - exp(-duration / RATE_EWMA_TIME_CONSTANT)
+
+            self.smoothed += alpha * (rate - self.smoothed)
+
+        self._add_sample(timestamp, delta, duration)
+
+        return True
+
+    def _add_sample(self, timestamp: float, delta: int, duration: float):
+        samples = self._samples
+
+        samples.append((timestamp, delta, duration))
+
+        self._window_bytes += delta
+        self._window_duration += duration
+
+        since = timestamp - RATE_WINDOW
+
+        while len(samples) > 1 and samples[0][0] - samples[0][2] < since:
+            _, expired_delta, expired_duration = samples.popleft()
+
+            self._window_bytes -= expired_delta
+            self._window_duration -= expired_duration
+
+    def _get_wrapped_delta(
+        self, previous_value: int, value: int, duration: float
+    ) -> Optional[int]:
+        if self.smoothed is None:
+            return None
+
+        maximum_delta = RATE_WRAP_FACTOR * self.smoothed * duration
+
+        for bits in self.counter_bits:
+            limit = 2 ** bits
+
+            if previous_value < limit:
+                delta = limit - previous_value + value
+
+                if delta <= maximum_delta:
+                    return delta
+
+                return None
+
+        return None
+
+    def to_dict(self):
+        obj = {
+            "value": self.value,
+            "smoothed": self.smoothed,
+            "windowed": self.windowed,
+            "wraps": self.wraps,
+            "resets": self.resets,
+        }
+
+        return obj
+
+    def __repr__(self):
+        to_string = f"{self.to_dict()}"
+
+        return to_string
@@ -0,0 +1,69 @@
+from typing import Dict, List, Tuple
+
+from ..helpers.const import *
+from .rate_counter import RateCounter
+
+
+class RateEngine:
+    """
+    Rates of the byte counters (RATE_COUNTERS) per key (interface / device),
+    counters are created by the first value, counter_bits are the widths
+    the counters may wrap around at (none for sums such as DPI traffic).
+    """
+
+    def __init__(self, counter_bits: List[int] = RATE_COUNTER_BITS):
+        self._counter_bits = counter_bits
+        self._counters: Dict[Tuple[str, str], RateCounter] = {}
+        self._reboots = 0
+
+    @property
+    def statistics(self) -> dict:
+        counters = self._counters.values()
+
+        result = {
+            "counters": len(self._counters),
+            "wraps": sum(counter.wraps for counter in counters),
+            "resets": sum(counter.resets for counter in counters),
+            "reboots": self._reboots,
+        }
+
+        return result
+
+    def reboot(self):
+        """Router rebooted, all counters start over."""
+        self._reboots += 1
+
+        for counter in self._counters.values():
+            counter.reset()
+
+    def retain(self, keys):
+        for counter_key in list(self._counters.keys()):
+            if counter_key[0] not in keys:
+                del self._counters[counter_key]
+
+    def update(self, key: str, timestamp: float, values: dict) -> dict:
+        """Rates by RATE_COUNTERS fields, None until two values arrived."""
+        result = {}
+
+        for field, (smoothed_field, windowed_field) in RATE_COUNTERS.items():
+            counter_key = (key, field)
+            counter = self._counters.get(counter_key)
+
+            if counter is None:
+                counter = RateCounter(self._counter_bits)
+
+                self._counters[counter_key] = counter
+
+            counter.update(timestamp, values.get(field))
+
+            result[smoothed_field] = self._round(counter.smoothed)
+            result[windowed_field] = self._round(counter.windowed)
+
+        return result
+
+    @staticmethod
+    def _round(rate):
+        if rate is None:
+            return None
+
+        return int(round(rate))
@@ -0,0 +1,53 @@
+class RecordData:
+    """
+    Base of slotted records holding router data.
+
+    ATTRIBUTES maps the attribute key (as exposed in entity attributes)
+    to the slot holding its value, unset values are None.
+    """
+
+    __slots__ = ()
+
+    ATTRIBUTES: dict = {}
+
+    def get(self, key, default=None):
+        value = None
+        slot = self.ATTRIBUTES.get(key)
+
+        if slot is not None:
+            value = getattr(self, slot)
+
+        if value is None:
+            value = default
+
+        return value
+
+    def items(self):
+        for key, slot in self.ATTRIBUTES.items():
+            value = getattr(self, slot)
+
+            if value is not None:
+                yield key, value
+
+    def update(self, values: dict) -> bool:
+        changed = False
+
+        for key, value in values.items():
+            slot = self.ATTRIBUTES[key]
+
+            if getattr(self, slot) != value:
+                setattr(self, slot, value)
+
+                changed = True
+
+        return changed
+
+    def to_dict(self):
+        obj = dict(self.items())
+
+        return obj
+
+    def __repr__(self):
+        to_string = f"{self.to_dict()}"
+
+        return to_string
@@ -3,9 +3,11 @@ from typing import Optional
 
 class StorageData:
     key: Optional[str]
+    sessions: dict
 
     def __init__(self):
         self.key = None
+        self.sessions = {}
 
     @staticmethod
     def from_dict(obj: dict):
@@ -13,11 +15,12 @@ class StorageData:
 
         if obj is not None:
             data.key = obj.get("key")
+            data.sessions = obj.get("sessions", {})
 
         return data
 
     def to_dict(self):
-        obj = {"key": self.key}
+        obj = {"key": self.key, "sessions": self.sessions}
 
         return obj
 
@@ -0,0 +1,90 @@
+from array import array
+from bisect import bisect_left
+from math import ceil, isfinite, nan
+from typing import Dict, List
+
+
+class TimeSeries:
+    """
+    Fixed size ring buffer of timestamped samples, one array of doubles per
+    field, all memory is allocated upfront (8 bytes per field and sample).
+    """
+
+    __slots__ = ("fields", "depth", "count", "_index", "_timestamps", "_values")
+
+    fields: List[str]
+    depth: int
+    count: int
+    _index: int
+    _timestamps: array
+    _values: Dict[str, array]
+
+    def __init__(self, fields: List[str], depth: int):
+        self.fields = fields
+        self.depth = depth
+        self.count = 0
+
+        self._index = 0
+        self._timestamps = array("d", bytes(8 * depth))
+        self._values = {field: array("d", bytes(8 * depth)) for field in fields}
+
+    @property
+    def size(self) -> int:
+        """Memory of the samples in bytes."""
+        return 8 * self.depth * (len(self.fields) + 1)
+
+    def append(self, timestamp: float, values: dict):
+        index = self._index
+
+        self._timestamps[index] = timestamp
+
+        for field, series in self._values.items():
+            series[index] = self._to_float(values.get(field))
+
+        self._index = (index + 1) % self.depth
+
+        if self.count < self.depth:
+            self.count += 1
+
+    def get_window(self, field: str, since: float) -> array:
+        """Values of field sampled at or after since, oldest first."""
+        timestamps = self._ordered(self._timestamps)
+        start = bisect_left(timestamps, since)
+
+        return self._ordered(self._values[field])[start:]
+
+    def query(self, field: str, since: float, percentiles: List[int] = None) -> dict:
+        window = [value for value in self.get_window(field, since) if isfinite(value)]
+        count = len(window)
+
+        result = {"count": count}
+
+        if count == 0:
+            return result
+
+        values = sorted(window)
+
+        result["min"] = values[0]
+        result["max"] = values[-1]
+        result["avg"] = sum(values) / count
+        result["last"] = window[-1]
+
+        for percentile in percentiles or []:
+            rank = max(ceil(percentile / 100 * count), 1)
+
+            result[f"p{percentile}"] = values[rank - 1]
+
+        return result
+
+    def _ordered(self, series: array) -> array:
+        if self.count < self.depth:
+            return series[: self.count]
+
+        return series[self._index :] + series[: self._index]
+
+    @staticmethod
+    def _to_float(value) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return nan
@@ -0,0 +1,54 @@
+from typing import Dict, List, Optional
+
+from .time_series import TimeSeries
+
+
+class TimeSeriesStore:
+    """Time series per key (interface / device), created by the first sample."""
+
+    def __init__(self, fields: List[str], depth: int = 0):
+        self.fields = fields
+        self.depth = depth
+
+        self._series: Dict[str, TimeSeries] = {}
+
+    @property
+    def statistics(self) -> dict:
+        result = {
+            "series": len(self._series),
+            "depth": self.depth,
+            "size": sum(series.size for series in self._series.values()),
+        }
+
+        return result
+
+    def resize(self, depth: int):
+        """Drops all samples when depth changed."""
+        if depth != self.depth:
+            self.depth = depth
+            self._series = {}
+
+    def retain(self, keys):
+        for key in list(self._series.keys()):
+            if key not in keys:
+                del self._series[key]
+
+    def record(self, key: str, timestamp: float, values: dict):
+        series = self._series.get(key)
+
+        if series is None:
+            series = TimeSeries(self.fields, self.depth)
+
+            self._series[key] = series
+
+        series.append(timestamp, values)
+
+    def query(
+        self, key: str, field: str, since: float, percentiles: List[int] = None
+    ) -> Optional[dict]:
+        series = self._series.get(key)
+
+        if series is None:
+            return None
+
+        return series.query(field, since, percentiles)
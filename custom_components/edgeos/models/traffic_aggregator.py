@@ -0,0 +1,204 @@
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+from ..helpers.const import *
+
+TrafficValues = Tuple[int, int, int, int]
+
+
+class TrafficAggregator:
+    """
+    Network wide DPI traffic (rx / tx bytes and rates) per application and
+    category, updated incrementally by the difference of each source's (IP)
+    services since its previous export, sources missing from an export no
+    longer contribute.
+
+    Up to maximum_applications applications are tracked, traffic of further
+    applications is counted as TRAFFIC_OTHER, the category and application
+    of a service are resolved once so its traffic always counts to the same.
+    """
+
+    def __init__(self, maximum_applications: int = TRAFFIC_MAXIMUM_APPLICATIONS):
+        self.maximum_applications = maximum_applications
+
+        self._contributions: Dict[str, Dict[str, TrafficValues]] = {}
+        self._services: Dict[str, Tuple[str, str]] = {}
+        self._applications: Dict[str, list] = {}
+        self._categories: Dict[str, list] = {}
+        self._exports = 0
+        self._recomputes = 0
+
+    @property
+    def statistics(self) -> dict:
+        result = {
+            "exports": self._exports,
+            "recomputes": self._recomputes,
+            "sources": len(self._contributions),
+            "applications": len(self._applications),
+            "categories": len(self._categories),
+        }
+
+        return result
+
+    @staticmethod
+    def parse(data: Optional[dict]) -> Optional[dict]:
+        """Traffic values by source IP and service, executor safe."""
+        if data is None or data == "":
+            return None
+
+        result = {}
+
+        for source, services in data.items():
+            source_traffic = {}
+
+            for service, service_data in services.items():
+                source_traffic[service] = tuple(
+                    int(service_data.get(field) or 0) for field in TRAFFIC_FIELDS
+                )
+
+            result[source] = source_traffic
+
+        return result
+
+    def apply(self, traffic: dict):
+        self._exports += 1
+
+        removed = self._contributions.keys() - traffic.keys()
+        changed = [
+            source
+            for source, services in traffic.items()
+            if services != self._contributions.get(source)
+        ]
+
+        if len(removed) + len(changed) > len(traffic) * TRAFFIC_RECOMPUTE_RATIO:
+            self._recompute(traffic)
+
+            return
+
+        for source in removed:
+            self._update_source(source, {})
+
+        for source in changed:
+            self._update_source(source, traffic[source])
+
+    def clear(self):
+        self._contributions = {}
+        self._services = {}
+        self._applications = {}
+        self._categories = {}
+        self._exports = 0
+        self._recomputes = 0
+
+    def get_top(self, kind: str, count: int) -> List[dict]:
+        """Top count applications / categories by total rate, highest first."""
+        totals = {
+            TRAFFIC_APPLICATIONS: self._applications,
+            TRAFFIC_CATEGORIES: self._categories,
+        }[kind]
+
+        top = heapq.nlargest(count, totals.items(), key=self._get_rate)
+
+        result = [self._to_dict(name, values) for name, values in top]
+
+        return result
+
+    def _recompute(self, traffic: dict):
+        """Totals from all sources, cheaper when most of them changed."""
+        self._recomputes += 1
+
+        self._applications = {}
+        self._categories = {}
+
+        for services in traffic.values():
+            for service, values in services.items():
+                self._apply_delta(service, values, 1)
+
+        self._contributions = {
+            source: services for source, services in traffic.items() if services
+        }
+
+    def _update_source(self, source: str, services: dict):
+        previous_services = self._contributions.get(source, {})
+
+        if services == previous_services:
+            return
+
+        for service, values in services.items():
+            previous = previous_services.get(service)
+            contributors = 0
+
+            if previous is None:
+                previous = (0,) * len(TRAFFIC_FIELDS)
+                contributors = 1
+
+            elif values == previous:
+                continue
+
+            delta = [value - prev for value, prev in zip(values, previous)]
+
+            self._apply_delta(service, delta, contributors)
+
+        for service in previous_services.keys() - services.keys():
+            delta = [-value for value in previous_services[service]]
+
+            self._apply_delta(service, delta, -1)
+
+        if len(services) > 0:
+            self._contributions[source] = services
+        else:
+            self._contributions.pop(source, None)
+
+    def _apply_delta(self, service: str, delta: list, contributors: int):
+        category, application = self._get_service(service)
+
+        self._add(self._categories, category, delta, contributors)
+        self._add(self._applications, application, delta, contributors)
+
+    def _get_service(self, service: str) -> Tuple[str, str]:
+        """Category and application of a service ({category}|{application})."""
+        result = self._services.get(service)
+
+        if result is None:
+            category, _, application = service.rpartition(TRAFFIC_SERVICE_SEPARATOR)
+
+            if len(self._applications) >= self.maximum_applications:
+                application = TRAFFIC_OTHER
+
+            result = (category or TRAFFIC_OTHER, application)
+
+            self._services[service] = result
+
+        return result
+
+    @staticmethod
+    def _add(totals: Dict[str, list], name: str, delta, contributors: int):
+        """Totals are the traffic values followed by number of contributors."""
+        values = totals.get(name)
+
+        if values is None:
+            values = [0] * (len(TRAFFIC_FIELDS) + 1)
+
+            totals[name] = values
+
+        for index, value in enumerate(delta):
+            values[index] += value
+
+        values[-1] += contributors
+
+        if values[-1] == 0:
+            del totals[name]
+
+    @staticmethod
+    def _get_rate(item) -> int:
+        values = item[1]
+
+        return values[TRAFFIC_RX_RATE_INDEX] + values[TRAFFIC_TX_RATE_INDEX]
+
+    @staticmethod
+    def _to_dict(name: str, values: list) -> dict:
+        obj = {ATTR_NAME: name}
+
+        for field, value in zip(TRAFFIC_FIELDS, values):
+            obj[field] = value
+
+        return obj
@@ -0,0 +1,116 @@
+"""Tests of the reconnect backoff and the REST circuit breaker."""
+from custom_components.edgeos.helpers.const import (
+    CIRCUIT_BREAKER_CLOSED,
+    CIRCUIT_BREAKER_HALF_OPEN,
+    CIRCUIT_BREAKER_OPEN,
+)
+from custom_components.edgeos.models import circuit_breaker as circuit_breaker_module
+from custom_components.edgeos.models.backoff import ExponentialBackoff
+from custom_components.edgeos.models.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def create_circuit_breaker(monkeypatch, failure_threshold=3) -> tuple:
+    clock = FakeClock()
+    monkeypatch.setattr(circuit_breaker_module, "monotonic", clock)
+
+    backoff = ExponentialBackoff(10, 60, jitter=0)
+    circuit_breaker = CircuitBreaker(failure_threshold, backoff)
+
+    return circuit_breaker, clock
+
+
+def test_backoff_grows_up_to_maximum():
+    backoff = ExponentialBackoff(5, 60, jitter=0)
+
+    delays = [backoff.next_delay() for _ in range(6)]
+
+    assert delays == [5, 10, 20, 40, 60, 60]
+
+
+def test_backoff_reset():
+    backoff = ExponentialBackoff(5, 60, jitter=0)
+
+    backoff.next_delay()
+    backoff.next_delay()
+    backoff.reset()
+
+    assert backoff.attempts == 0
+    assert backoff.next_delay() == 5
+
+
+def test_backoff_jitter_reduces_delay():
+    backoff = ExponentialBackoff(8, 8, jitter=0.5)
+
+    for _ in range(100):
+        assert 4 <= backoff.next_delay() <= 8
+
+
+def test_circuit_breaker_opens_after_threshold(monkeypatch):
+    circuit_breaker, _ = create_circuit_breaker(monkeypatch)
+
+    circuit_breaker.record_failure()
+    circuit_breaker.record_failure()
+
+    assert circuit_breaker.state == CIRCUIT_BREAKER_CLOSED
+    assert circuit_breaker.allow_request()
+
+    circuit_breaker.record_failure()
+
+    assert circuit_breaker.state == CIRCUIT_BREAKER_OPEN
+    assert circuit_breaker.opened == 1
+    assert not circuit_breaker.allow_request()
+    assert circuit_breaker.rejected == 1
+
+
+def test_circuit_breaker_success_resets_failures(monkeypatch):
+    circuit_breaker, _ = create_circuit_breaker(monkeypatch)
+
+    circuit_breaker.record_failure()
+    circuit_breaker.record_failure()
+    circuit_breaker.record_success()
+    circuit_breaker.record_failure()
+
+    assert circuit_breaker.state == CIRCUIT_BREAKER_CLOSED
+    assert circuit_breaker.failures == 1
+
+
+def test_circuit_breaker_probe_when_due(monkeypatch):
+    circuit_breaker, clock = create_circuit_breaker(monkeypatch, 1)
+
+    circuit_breaker.record_failure()
+
+    clock.now += 9
+    assert not circuit_breaker.allow_request(is_probe=True)
+
+    clock.now += 1
+    assert not circuit_breaker.allow_request()
+    assert circuit_breaker.allow_request(is_probe=True)
+    assert circuit_breaker.state == CIRCUIT_BREAKER_HALF_OPEN
+
+    circuit_breaker.record_success()
+
+    assert circuit_breaker.is_closed
+    assert circuit_breaker.backoff.attempts == 0
+
+
+def test_circuit_breaker_failed_probe_opens_longer(monkeypatch):
+    circuit_breaker, clock = create_circuit_breaker(monkeypatch, 1)
+
+    circuit_breaker.record_failure()
+
+    clock.now += 10
+    assert circuit_breaker.allow_request(is_probe=True)
+
+    circuit_breaker.record_failure()
+
+    assert circuit_breaker.state == CIRCUIT_BREAKER_OPEN
+    assert circuit_breaker.opened == 1
+    assert circuit_breaker.next_probe == clock.now + 20
@@ -0,0 +1,102 @@
+"""Tests of the length-prefixed WS stream decoder."""
+from custom_components.edgeos.clients.frame_decoder import EdgeOSFrameDecoder
+from custom_components.edgeos.helpers.const import MAX_FRAME_HEADER_LENGTH
+
+
+def encode(payload: str) -> bytes:
+    content = payload.encode()
+
+    return f"{len(content)}\n".encode() + content
+
+
+def test_single_message():
+    decoder = EdgeOSFrameDecoder()
+
+    assert decoder.feed(encode('{"a":1}')) == [b'{"a":1}']
+    assert decoder.messages == 1
+    assert decoder.fragmented_messages == 0
+    assert decoder.pending_bytes == 0
+
+
+def test_message_split_across_frames():
+    decoder = EdgeOSFrameDecoder()
+    frame = encode('{"export":{}}')
+
+    assert decoder.feed(frame[:5]) == []
+    assert decoder.feed(frame[5:]) == [b'{"export":{}}']
+    assert decoder.fragmented_messages == 1
+
+
+def test_header_split_across_frames():
+    decoder = EdgeOSFrameDecoder()
+    payload = "x" * 120
+    frame = encode(payload)
+
+    assert decoder.feed(frame[:2]) == []
+    assert decoder.feed(frame[2:4]) == []
+    assert decoder.feed(frame[4:]) == [payload.encode()]
+    assert decoder.resets == 0
+
+
+def test_several_messages_in_one_frame():
+    decoder = EdgeOSFrameDecoder()
+    frame = encode('{"a":1}') + encode('{"b":2}') + encode('{"c":3}')[:4]
+
+    assert decoder.feed(frame) == [b'{"a":1}', b'{"b":2}']
+    assert decoder.feed(encode('{"c":3}')[4:]) == [b'{"c":3}']
+    assert decoder.messages == 3
+
+
+def test_whitespaces_between_messages():
+    decoder = EdgeOSFrameDecoder()
+    frame = encode("{}") + b"\r\n" + encode("[]")
+
+    assert decoder.feed(frame) == [b"{}", b"[]"]
+
+
+def test_multi_byte_payload_length_in_bytes():
+    decoder = EdgeOSFrameDecoder()
+    payload = '{"name":"Küche ☕"}'
+    frame = encode(payload)
+
+    assert len(payload.encode()) > len(payload)
+    assert decoder.feed(frame[:-2]) == []
+    assert [item.decode() for item in decoder.feed(frame[-2:])] == [payload]
+
+
+def test_str_frame_is_encoded():
+    decoder = EdgeOSFrameDecoder()
+    payload = '"☕"'
+
+    assert decoder.feed(f"{len(payload.encode())}\n{payload}") == [payload.encode()]
+
+
+def test_oversize_length_resets():
+    decoder = EdgeOSFrameDecoder(max_payload_size=10)
+
+    assert decoder.feed(b"11\n" + b"x" * 11) == []
+    assert decoder.resets == 1
+    assert decoder.pending_bytes == 0
+
+    assert decoder.feed(encode("{}")) == [b"{}"]
+
+
+def test_garbage_header_resets():
+    decoder = EdgeOSFrameDecoder()
+
+    assert decoder.feed(b"abc\n{}") == []
+    assert decoder.resets == 1
+    assert decoder.pending_bytes == 0
+
+    assert decoder.feed(encode("{}")) == [b"{}"]
+
+
+def test_header_without_separator_too_long_resets():
+    decoder = EdgeOSFrameDecoder()
+
+    assert decoder.feed(b"1" * MAX_FRAME_HEADER_LENGTH) == []
+    assert decoder.resets == 0
+
+    assert decoder.feed(b"1") == []
+    assert decoder.resets == 1
+    assert decoder.pending_bytes == 0
@@ -0,0 +1,94 @@
+"""Tests of the top talkers heap."""
+import random
+
+from custom_components.edgeos.models.indexed_heap import IndexedHeap
+import pytest
+
+
+def get_expected_top(priorities: dict, count: int) -> list:
+    ordered = sorted(priorities.values(), reverse=True)
+
+    return ordered[:count]
+
+
+def assert_heap(heap: IndexedHeap, priorities: dict):
+    assert len(heap) == len(priorities)
+    assert set(heap.keys()) == set(priorities)
+
+    for key, priority in priorities.items():
+        assert heap.get(key) == priority
+
+    top = heap.top(len(priorities))
+
+    assert [priority for _, priority in top] == get_expected_top(
+        priorities, len(priorities)
+    )
+
+
+def test_update_and_top():
+    heap = IndexedHeap()
+
+    for key, priority in {"a": 3, "b": 7, "c": 5, "d": 1}.items():
+        heap.update(key, priority)
+
+    assert heap.top(2) == [("b", 7), ("c", 5)]
+    assert heap.top(10) == [("b", 7), ("c", 5), ("a", 3), ("d", 1)]
+    assert heap.get("e") is None
+
+
+def test_update_existing_key_moves_it():
+    heap = IndexedHeap()
+
+    for key, priority in {"a": 3, "b": 7, "c": 5}.items():
+        heap.update(key, priority)
+
+    heap.update("a", 10)
+    heap.update("b", 0)
+
+    assert heap.top(3) == [("a", 10), ("c", 5), ("b", 0)]
+
+
+def test_remove():
+    heap = IndexedHeap()
+
+    for key, priority in {"a": 3, "b": 7, "c": 5, "d": 1}.items():
+        heap.update(key, priority)
+
+    heap.remove("b")
+    heap.remove("missing")
+
+    assert "b" not in heap
+    assert heap.top(3) == [("c", 5), ("a", 3), ("d", 1)]
+
+
+@pytest.mark.parametrize("rebuild_ratio", [0.25, 1])
+def test_update_many_matches_sort(rebuild_ratio):
+    rnd = random.Random(11)
+    heap = IndexedHeap(rebuild_ratio)
+    priorities = {}
+
+    for _ in range(100):
+        changed = {
+            f"device-{rnd.randrange(200)}": rnd.randint(1, 10 ** 6)
+            for _ in range(rnd.choice([1, 5, 50]))
+        }
+        removed = {key for key in priorities if rnd.random() < 0.05} - changed.keys()
+
+        heap.update_many(changed, removed)
+
+        priorities.update(changed)
+
+        for key in removed:
+            del priorities[key]
+
+        assert_heap(heap, priorities)
+
+
+def test_clear():
+    heap = IndexedHeap()
+
+    heap.update_many({"a": 1, "b": 2})
+    heap.clear()
+
+    assert len(heap) == 0
+    assert heap.top(5) == []
@@ -0,0 +1,93 @@
+"""Tests of the byte counter rates."""
+from custom_components.edgeos.helpers.const import RATE_MAXIMUM
+from custom_components.edgeos.models.rate_counter import RateCounter
+
+LIMIT_32 = 2 ** 32
+
+
+def update_all(counter: RateCounter, samples: list):
+    for timestamp, value in samples:
+        counter.update(timestamp, value)
+
+
+def test_rate_of_increasing_counter():
+    counter = RateCounter()
+
+    update_all(counter, [(0, 1000), (5, 6000), (10, 11000)])
+
+    assert counter.smoothed == 1000
+    assert counter.windowed == 1000
+    assert counter.wraps == 0
+    assert counter.resets == 0
+
+
+def test_wrap_near_limit():
+    counter = RateCounter()
+
+    update_all(
+        counter,
+        [(0, LIMIT_32 - 3000), (5, LIMIT_32 - 2000), (10, LIMIT_32 - 1000), (15, 50)],
+    )
+
+    assert counter.wraps == 1
+    assert counter.resets == 0
+    assert counter.value == 50
+    assert counter.windowed == (3000 + 50) / 15
+
+
+def test_drop_far_from_limit_is_reset():
+    counter = RateCounter()
+
+    update_all(counter, [(0, 1.0e9), (5, 1.01e9), (10, 0.9e9)])
+
+    assert counter.wraps == 0
+    assert counter.resets == 1
+    assert counter.smoothed == 2.0e6
+    assert counter.windowed == 2.0e6
+
+
+def test_reset_restarts_baseline():
+    counter = RateCounter()
+
+    update_all(counter, [(0, 1.0e9), (5, 1.01e9), (10, 0.9e9), (15, 0.91e9)])
+
+    assert counter.value == 0.91e9
+    assert counter.smoothed == 2.0e6
+    assert counter.windowed == 2.0e6
+
+
+def test_drop_without_wrapping_bits_is_reset():
+    counter = RateCounter([])
+
+    update_all(counter, [(0, LIMIT_32 - 3000), (5, LIMIT_32 - 2000), (10, 50)])
+
+    assert counter.wraps == 0
+    assert counter.resets == 1
+
+
+def test_drop_before_rate_is_known_is_reset():
+    counter = RateCounter()
+
+    update_all(counter, [(0, LIMIT_32 - 1000), (5, 50)])
+
+    assert counter.wraps == 0
+    assert counter.resets == 1
+    assert counter.smoothed is None
+
+
+def test_jump_above_maximum_is_skipped():
+    counter = RateCounter()
+
+    update_all(counter, [(0, 0), (5, 5000), (10, 5000 + RATE_MAXIMUM * 5 * 2)])
+
+    assert counter.resets == 1
+    assert counter.smoothed == 1000
+    assert counter.windowed == 1000
+
+
+def test_invalid_value_is_ignored():
+    counter = RateCounter()
+
+    assert counter.update(0, None) is False
+    assert counter.update(5, "") is False
+    assert counter.value is None
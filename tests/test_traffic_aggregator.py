@@ -0,0 +1,143 @@
+"""Tests of the network wide DPI traffic per application and category."""
+import random
+
+from custom_components.edgeos.helpers.const import (
+    ATTR_NAME,
+    TRAFFIC_APPLICATIONS,
+    TRAFFIC_CATEGORIES,
+    TRAFFIC_OTHER,
+)
+from custom_components.edgeos.models.traffic_aggregator import TrafficAggregator
+
+SERVICES = ["Web|HTTP", "Web|HTTPS", "Streaming|Netflix", "Streaming|YouTube", "DNS"]
+
+
+def service_data(rx_bytes, tx_bytes, rx_rate, tx_rate) -> dict:
+    data = {
+        "rx_bytes": str(rx_bytes),
+        "tx_bytes": str(tx_bytes),
+        "rx_rate": str(rx_rate),
+        "tx_rate": str(tx_rate),
+    }
+
+    return data
+
+
+def apply(aggregator: TrafficAggregator, data: dict):
+    aggregator.apply(TrafficAggregator.parse(data))
+
+
+def get_totals(aggregator: TrafficAggregator, kind: str) -> dict:
+    result = {item[ATTR_NAME]: item for item in aggregator.get_top(kind, 100)}
+
+    return result
+
+
+def generate_export(rnd: random.Random, sources: int) -> dict:
+    data = {}
+
+    for index in range(sources):
+        if rnd.random() < 0.2:
+            continue
+
+        services = rnd.sample(SERVICES, rnd.randint(1, 3))
+
+        data[f"10.0.0.{index}"] = {
+            service: service_data(*[rnd.randint(0, 1000) for _ in range(4)])
+            for service in services
+        }
+
+    return data
+
+
+def test_parse_missing_values_as_zero():
+    traffic = TrafficAggregator.parse({"10.0.0.1": {"Web|HTTP": {"rx_rate": "5"}}})
+
+    assert traffic == {"10.0.0.1": {"Web|HTTP": (0, 0, 5, 0)}}
+    assert TrafficAggregator.parse(None) is None
+    assert TrafficAggregator.parse("") is None
+
+
+def test_totals_per_application_and_category():
+    aggregator = TrafficAggregator()
+
+    apply(
+        aggregator,
+        {
+            "10.0.0.1": {"Web|HTTP": service_data(100, 10, 5, 1)},
+            "10.0.0.2": {
+                "Web|HTTP": service_data(200, 20, 10, 2),
+                "Web|HTTPS": service_data(50, 5, 30, 3),
+            },
+        },
+    )
+
+    applications = get_totals(aggregator, TRAFFIC_APPLICATIONS)
+    categories = get_totals(aggregator, TRAFFIC_CATEGORIES)
+
+    assert applications["HTTP"]["rx_bytes"] == 300
+    assert applications["HTTP"]["rx_rate"] == 15
+    assert categories["Web"]["tx_rate"] == 6
+    assert aggregator.get_top(TRAFFIC_APPLICATIONS, 1)[0][ATTR_NAME] == "HTTPS"
+
+
+def test_removed_source_no_longer_contributes():
+    aggregator = TrafficAggregator()
+    sources = {
+        f"10.0.0.{index}": {"Web|HTTP": service_data(1, 1, 1, 1)} for index in range(4)
+    }
+
+    apply(aggregator, {**sources, "10.0.0.9": {"DNS": service_data(1, 1, 1, 1)}})
+    apply(aggregator, sources)
+
+    applications = get_totals(aggregator, TRAFFIC_APPLICATIONS)
+
+    assert aggregator.statistics["recomputes"] == 1
+    assert "DNS" not in applications
+    assert applications["HTTP"]["rx_rate"] == 4
+
+
+def test_service_without_category_and_maximum_applications():
+    aggregator = TrafficAggregator(maximum_applications=1)
+
+    apply(
+        aggregator,
+        {
+            "10.0.0.1": {
+                "DNS": service_data(1, 1, 1, 1),
+                "Web|HTTP": service_data(2, 2, 2, 2),
+            }
+        },
+    )
+
+    applications = get_totals(aggregator, TRAFFIC_APPLICATIONS)
+    categories = get_totals(aggregator, TRAFFIC_CATEGORIES)
+
+    assert set(applications) == {"DNS", TRAFFIC_OTHER}
+    assert set(categories) == {TRAFFIC_OTHER, "Web"}
+
+
+def test_incremental_totals_match_recompute():
+    rnd = random.Random(7)
+    aggregator = TrafficAggregator()
+    data = generate_export(rnd, 20)
+
+    apply(aggregator, data)
+
+    for _ in range(50):
+        source = rnd.choice(list(data) or ["10.0.0.0"])
+
+        if rnd.random() < 0.2:
+            data.pop(source, None)
+        else:
+            data[source] = generate_export(rnd, 1).get("10.0.0.0", {})
+
+        apply(aggregator, data)
+
+        expected = TrafficAggregator()
+        apply(expected, data)
+
+        for kind in (TRAFFIC_APPLICATIONS, TRAFFIC_CATEGORIES):
+            assert get_totals(aggregator, kind) == get_totals(expected, kind)
+
+    assert aggregator.statistics["recomputes"] < aggregator.statistics["exports"]